@@ -3,12 +3,24 @@ Constants and configuration values for Agnira Voice Assistant.
 Includes intent thresholds, keyword lists, and audio processing limits.
 """
 
-# Intent Classification Thresholds
-MIN_QUERY_LENGTH_SIMPLE: int = 5  
-MAX_QUERY_LENGTH_SIMPLE: int = 150 
+import re
+import sys
+
+import ahocorasick
 
-# Complex query keywords that indicate complex reasoning
-COMPLEX_KEYWORDS: list[str] = [
+# Intent Classification Thresholds
+MIN_QUERY_LENGTH_SIMPLE: int = 5
+MAX_QUERY_LENGTH_SIMPLE: int = 150
+
+# Voice queries repeat heavily ("yes", "stop", "what time is it"), and
+# classification is a pure function of the text - cache this many recent
+# results so repeats cost a dict lookup instead of the rule cascade.
+INTENT_CACHE_SIZE: int = 1024
+
+# Complex query keywords that indicate complex reasoning.
+# Interned so membership hashing against interned query tokens is
+# pointer-compare fast and only one copy survives across forked workers.
+COMPLEX_KEYWORDS: frozenset[str] = frozenset(sys.intern(_kw) for _kw in {
     "derive",
     "prove",
     "integrate",
@@ -40,12 +52,21 @@ COMPLEX_KEYWORDS: list[str] = [
     "probability distribution",
     "vector algebra",
     "3d geometry",
-]
+})
+
+# Precompiled Aho-Corasick automaton for COMPLEX_KEYWORDS.
+# Built once at import time so keyword detection is a single O(len(query))
+# scan instead of one substring search per keyword on every utterance.
+COMPLEX_AUTOMATON = ahocorasick.Automaton()
+for _keyword in COMPLEX_KEYWORDS:
+    COMPLEX_AUTOMATON.add_word(_keyword, _keyword)
+COMPLEX_AUTOMATON.make_automaton()
+del _keyword
 
 # Conceptual query settings (short concept probes like "entropy?")
 MAX_CONCEPTUAL_WORDS: int = 3  # Maximum words for conceptual queries
 
-MATH_OPERATORS: list[str] = [
+MATH_OPERATORS: frozenset[str] = frozenset(sys.intern(_op) for _op in {
     "+",
     "-",
     "*",
@@ -63,21 +84,40 @@ MATH_OPERATORS: list[str] = [
     "∫",
     "∑",
     "∂",
-]
+})
+
+# Single-pass alternation regex for operator detection (longest-first so
+# "**" wins over "*"). One compiled scan replaces a substring search per
+# operator on every query.
+MATH_OPERATOR_RE = re.compile(
+    "|".join(map(re.escape, sorted(MATH_OPERATORS, key=len, reverse=True)))
+)
 
 # Audio processing constants
 SAMPLE_RATE: int = 16000  # Hz - for input (mic)
 OUTPUT_SAMPLE_RATE: int = 24000  # Hz - for output (speaker from Gemini)
-AUDIO_CHUNK_DURATION: float = 0.1  # seconds
-AUDIO_CHUNK_SIZE: int = 1024  # frames per buffer
+# Capture and processing buffers are decoupled: the mic is read in small
+# 20 ms chunks for low wake-word/interrupt latency, while VAD and Gemini
+# uploads accumulate capture chunks into a larger 100 ms processing window.
+AUDIO_CAPTURE_FRAMES: int = 320  # frames per mic buffer (20 ms at 16 kHz)
+AUDIO_PROCESS_FRAMES: int = 1600  # frames per VAD/upload window (100 ms at 16 kHz)
 MAX_AUDIO_DURATION: float = 30.0  # Maximum recording duration in seconds
 SILENCE_THRESHOLD: float = 0.01  # Amplitude threshold for silence detection (lowered to capture softer speech)
+# Same threshold in the native int16 sample domain (0.01 * 32768). The live
+# capture path thresholds raw int16 frames directly instead of converting
+# every chunk to normalized floats.
+SILENCE_THRESHOLD_I16: int = 328
 SILENCE_DURATION: float = 1.0  # Seconds of silence to stop recording
 AUDIO_FORMAT: str = "audio/pcm"  # PCM format for Gemini Live API
 
 # Gemini Live API Model (for audio streaming)
 GEMINI_LIVE_MODEL: str = "gemini-2.5-flash-native-audio-preview-12-2025"  # Live API compatible model
 
+# Streaming TTS sentence chunking (playback starts after the first complete
+# sentence instead of after the whole response is generated)
+STREAM_SENTENCE_MIN_CHARS: int = 40  # Don't TTS fragments shorter than this
+STREAM_SENTENCE_MAX_CHARS: int = 180  # Force a flush even without punctuation
+
 # TTS Constants (cost optimization)
 MAX_SIMPLE_RESPONSE_LENGTH: int = 2000  # Max characters for full TTS
 MAX_CONCEPTUAL_RESPONSE_LENGTH: int = 300  # Max characters for conceptual TTS
@@ -88,15 +128,45 @@ CONCEPTUAL_ACKNOWLEDGMENT: str = "Here's a brief explanation."
 WAKE_WORD: str = "angira"
 WAKE_WORD_CONFIDENCE_THRESHOLD: float = 0.8
 
+# On-device wake-word spotting (openWakeWord). When the optional package and
+# the trained model file are both present, wake detection runs entirely
+# locally per mic chunk - no PCM upload and no transcription cost in the
+# always-on loop. The Gemini transcription path remains the fallback.
+WAKE_WORD_MODEL_PATH: str = "models/angira.onnx"
+WAKE_WORD_LOCAL_SCORE: float = 0.5  # openWakeWord detection score threshold
+
+# Wake-word fast-match prefilter (computed before any Gemini round-trip).
+# "angira" is three syllables: captures far shorter/longer than these bounds,
+# or without enough energy in the voiced band, cannot be the wake word and
+# skip the expensive transcription entirely.
+WAKE_WORD_MIN_DURATION: float = 0.3  # seconds
+WAKE_WORD_MAX_DURATION: float = 3.0  # seconds
+WAKE_WORD_VOICED_BAND: tuple[float, float] = (300.0, 3000.0)  # Hz, speech formant range
+WAKE_WORD_VOICED_RATIO: float = 0.3  # min fraction of spectral energy in voiced band
+# Voiced-energy floor gating the transcription RPC: a capture must contain at
+# least this many frames that are both above the silence threshold and within
+# the human-voice zero-crossing range. Music and fan noise sit well outside
+# the ZCR band; pure silence never clears the RMS bar.
+VOICED_MIN_FRAMES: int = 5
+VOICED_ZCR_RANGE: tuple[float, float] = (0.02, 0.25)  # per-frame normalized ZCR
+
 # Timeouts
 SPEECH_RECOGNITION_TIMEOUT: float = 30.0  # seconds
 API_TIMEOUT: float = 60.0  # seconds
 
 # Gemini Reasoning Engine (switched from GPT)
 GEMINI_REASONING_MODEL: str = "gemini-2.0-flash"  # Fast and capable
+
+# Exact-match response cache: a repeated (intent, query, history) triple
+# answers from memory instead of paying the full Gemini round-trip.
+# Only SIMPLE/CONCEPTUAL responses are cached - COMPLEX turns are too
+# context-dependent to reuse safely.
+RESPONSE_CACHE_MAX_ENTRIES: int = 256
 GEMINI_MAX_TOKENS: int = 1024  # Max response tokens
 GEMINI_TEMPERATURE: float = 0.7  # Balance creativity and accuracy
-REASONING_SYSTEM_PROMPT: str = """You are Angira, a real-time voice-based JEE doubt-solving assistant.
+# Interned: multi-kB literals are not auto-interned by CPython, and a single
+# shared copy keeps the prompt CoW-friendly across forked workers.
+REASONING_SYSTEM_PROMPT: str = sys.intern("""You are Angira, a real-time voice-based JEE doubt-solving assistant.
 
 You are designed for ultra-low latency, streaming responses, and frequent user interruptions.
 Your answers must be clear, structured, and easy to follow when spoken aloud.
@@ -161,7 +231,7 @@ Tone rules:
 - Never say "this is obvious" or "you should know this".
 
 You are not a chatbot giving answers.
-You are a one-on-one JEE teacher explaining concepts aloud in real time."""
+You are a one-on-one JEE teacher explaining concepts aloud in real time.""")
 
 # Conversation Memory (for CONCEPTUAL and COMPLEX only)
 CONVERSATION_MEMORY_MAX_TURNS: int = 5  # Max Q&A pairs to remember
@@ -4,35 +4,44 @@ Loads environment variables and exposes API keys and settings safely.
 """
 
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    """Application settings loaded from environment variables."""
+    """Application settings loaded once from environment variables.
+
+    Frozen with slots: attribute reads are direct slot lookups, the instance
+    is hashable/picklable for subprocess workers, and values cannot drift
+    after startup.
+    """
 
     # API Keys
-    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
-    GPT_API_KEY: str = os.getenv("GPT_API_KEY", "")
+    GEMINI_API_KEY: str = field(default_factory=lambda: os.getenv("GEMINI_API_KEY", ""))
+    GPT_API_KEY: str = field(default_factory=lambda: os.getenv("GPT_API_KEY", ""))
 
     # Application Settings
-    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
-    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
+    LOG_LEVEL: str = field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO"))
+    ENVIRONMENT: str = field(default_factory=lambda: os.getenv("ENVIRONMENT", "development"))
 
-    @classmethod
-    def validate(cls) -> bool:
+    def validate(self) -> bool:
         """
         Validate that all required settings are present.
 
         Returns:
-            bool: True if all required settings are present, False otherwise.
+            bool: True if all required settings are present.
+
+        Raises:
+            ValueError: If a required environment variable is missing.
         """
         # Only GEMINI_API_KEY is required now (GPT is optional)
         required_keys = ["GEMINI_API_KEY"]
-        missing_keys = [key for key in required_keys if not getattr(cls, key)]
+        missing_keys = [key for key in required_keys if not getattr(self, key)]
 
         if missing_keys:
             raise ValueError(
@@ -40,8 +49,7 @@ class Settings:
             )
         return True
 
-    @classmethod
-    def get_gemini_api_key(cls) -> str:
+    def get_gemini_api_key(self) -> str:
         """
         Get Gemini API key safely.
 
@@ -51,12 +59,11 @@ class Settings:
         Raises:
             ValueError: If Gemini API key is not set.
         """
-        if not cls.GEMINI_API_KEY:
+        if not self.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY environment variable not set")
-        return cls.GEMINI_API_KEY
+        return self.GEMINI_API_KEY
 
-    @classmethod
-    def get_gpt_api_key(cls) -> str:
+    def get_gpt_api_key(self) -> str:
         """
         Get GPT API key safely.
 
@@ -66,10 +73,10 @@ class Settings:
         Raises:
             ValueError: If GPT API key is not set.
         """
-        if not cls.GPT_API_KEY:
+        if not self.GPT_API_KEY:
             raise ValueError("GPT_API_KEY environment variable not set")
-        return cls.GPT_API_KEY
+        return self.GPT_API_KEY
 
 
-# Initialize settings
+# Initialize settings once at import
 settings = Settings()
@@ -1,13 +1,24 @@
-"""Core modules package for Agnira Voice Assistant."""
+"""Core modules package for Agnira Voice Assistant.
 
-from core.speech_to_text import SpeechToText
-from core.text_to_speech import TextToSpeech
-from core.audio_live import AudioLiveHandler
-from core.wake_word import listen_for_wake_word, WakeWordDetector
-from core.intent_classifier import classify_intent
-from core.reasoning_engine import ReasoningEngine
-from core.response_router import route_response
-from core.verbalizer import verbalize_query
+Submodules are imported lazily (PEP 562) so that touching one symbol does
+not pay the import cost of the heavy audio/API stack (pyaudio, google-genai)
+at startup.
+"""
+
+import importlib
+
+# Maps each public symbol to the submodule that defines it.
+_LAZY = {
+    "SpeechToText": "core.speech_to_text",
+    "TextToSpeech": "core.text_to_speech",
+    "AudioLiveHandler": "core.audio_live",
+    "listen_for_wake_word": "core.wake_word",
+    "WakeWordDetector": "core.wake_word",
+    "classify_intent": "core.intent_classifier",
+    "ReasoningEngine": "core.reasoning_engine",
+    "route_response": "core.response_router",
+    "verbalize_query": "core.verbalizer",
+}
 
 __all__ = [
     "SpeechToText",
@@ -20,3 +31,16 @@ __all__ = [
     "route_response",
     "verbalize_query",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve public symbols on first access, importing their module lazily."""
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,22 @@
+"""
+Shared PyAudio instance for Agnira Voice Assistant.
+
+TextToSpeech and WakeWordDetector each used to construct their own
+pyaudio.PyAudio(), so one process held two PortAudio instances - two
+rounds of host-API and device probing at init, and two terminate() calls
+racing through __del__ at shutdown. One process-wide instance pays the
+probe cost once and is terminated exactly once, at interpreter exit.
+"""
+
+import atexit
+import functools
+
+import pyaudio
+
+
+@functools.lru_cache(maxsize=1)
+def get_pyaudio() -> pyaudio.PyAudio:
+    """Return the process-wide PyAudio instance, creating it on first use."""
+    pya = pyaudio.PyAudio()
+    atexit.register(pya.terminate)
+    return pya
@@ -0,0 +1,25 @@
+"""
+Shared Gemini client factory for Agnira Voice Assistant.
+
+Every core component (STT, TTS, reasoning, live audio, wake word) used to
+construct its own genai.Client, each carrying a separate HTTP connection
+pool, TLS session and auth state. One process-wide client lets all of them
+share warm keep-alive connections, so e.g. the reasoning call after a
+transcription rides the pool the STT call just used instead of paying a
+fresh TLS handshake.
+"""
+
+import functools
+
+from google import genai
+
+from config.settings import settings
+
+
+@functools.lru_cache(maxsize=1)
+def get_client() -> genai.Client:
+    """Return the process-wide Gemini client, creating it on first use."""
+    return genai.Client(
+        api_key=settings.get_gemini_api_key(),
+        http_options={"api_version": "v1beta"},
+    )
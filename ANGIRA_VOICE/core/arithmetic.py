@@ -0,0 +1,141 @@
+"""
+Local arithmetic evaluator for Agnira Voice Assistant.
+Answers deterministic arithmetic queries without a reasoning-engine call.
+"""
+
+import ast
+import functools
+import logging
+import operator
+import re
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Leading politeness/question phrases that may wrap an arithmetic query
+# ("what is 2 plus 2?", "calculate 15 times 3"). Stripped before parsing.
+_LEAD_RE = re.compile(
+    r"^(?:please\s+)?(?:calculate|compute|evaluate|how much is|what is|what are|what's)\s+"
+)
+
+# Spelled-out operators as STT tends to produce them, mapped to symbols.
+# Longest-first alternation so "multiplied by" wins over a bare "x".
+_WORD_OPS = {
+    "to the power of": "**",
+    "multiplied by": "*",
+    "divided by": "/",
+    "plus": "+",
+    "minus": "-",
+    "times": "*",
+    "over": "/",
+    "squared": "**2",
+    "cubed": "**3",
+    "x": "*",
+}
+_WORD_OP_RE = re.compile(
+    r"\b(?:"
+    + "|".join(sorted(map(re.escape, _WORD_OPS), key=len, reverse=True))
+    + r")\b"
+)
+
+# After normalization an evaluable query must be purely numbers, operators
+# and parentheses - any leftover letter means it was never plain arithmetic
+# and the reasoning engine should handle it.
+_EXPR_RE = re.compile(r"[0-9+\-*/%(). ]+")
+_DIGIT_RE = re.compile(r"[0-9]")
+
+# Whitelisted AST operators; anything else (names, calls, subscripts,
+# comparisons) is rejected, so the evaluator can never execute code.
+_BIN_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+# Bound on exponents so "9 to the power of 999999" can't stall the loop
+# computing a number nobody could speak anyway.
+_MAX_EXPONENT = 16
+
+
+def _eval_node(node: ast.expr) -> float:
+    """Evaluate one whitelisted AST node; raise ValueError on anything else."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > _MAX_EXPONENT:
+            raise ValueError("Exponent too large for local evaluation")
+        return _BIN_OPS[type(node.op)](left, right)
+    raise ValueError(f"Unsupported expression node: {type(node).__name__}")
+
+
+def _format_result(value: float) -> str:
+    """Render a result the way it would be spoken: no '4.0', no float noise."""
+    if isinstance(value, float):
+        if value.is_integer():
+            return str(int(value))
+        return f"{value:.10g}"
+    return str(value)
+
+
+def evaluate_arithmetic(query: str) -> Optional[str]:
+    """
+    Evaluate a plain arithmetic query locally, if it is one.
+
+    Normalizes spelled-out operators ("plus" → "+", "times" → "*",
+    "divided by" → "/"), strips leading question phrasing, and evaluates
+    the remainder over a whitelisted AST - no names, calls, or anything
+    beyond the six basic operators. Queries that are not pure arithmetic
+    after normalization return None so the caller falls back to the
+    reasoning engine.
+
+    Args:
+        query (str): User query text (already verbalized).
+
+    Returns:
+        Optional[str]: The result as a string, or None if the query is
+                       not locally evaluable.
+
+    Example:
+        >>> evaluate_arithmetic("What is 2 plus 2?")
+        "4"
+        >>> evaluate_arithmetic("what is entropy")
+        None
+    """
+    # Guard kept outside the cache so bad inputs (None, non-strings)
+    # neither occupy cache slots nor have to be hashable
+    if not query or not isinstance(query, str):
+        return None
+
+    return _evaluate_impl(query)
+
+
+@functools.lru_cache(maxsize=256)
+def _evaluate_impl(query: str) -> Optional[str]:
+    """Normalize, parse and evaluate; memoized since evaluation is pure."""
+    expr = query.strip().lower().rstrip("?!.= ")
+    expr = _LEAD_RE.sub("", expr)
+    expr = _WORD_OP_RE.sub(lambda m: f" {_WORD_OPS[m.group(0)]} ", expr)
+
+    if _EXPR_RE.fullmatch(expr) is None or _DIGIT_RE.search(expr) is None:
+        return None
+
+    try:
+        result = _eval_node(ast.parse(expr, mode="eval").body)
+    except (SyntaxError, ValueError, ZeroDivisionError, OverflowError):
+        logger.debug("Query '%.100s' not locally evaluable", query)
+        return None
+
+    answer = _format_result(result)
+    logger.debug("Evaluated '%.100s' locally: %s", query, answer)
+    return answer
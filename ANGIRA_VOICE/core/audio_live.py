@@ -5,30 +5,158 @@ Handles microphone input, speech-to-text, text-to-speech, and audio playback.
 
 import asyncio
 import logging
+import math
+import os
 import struct
+import threading
+from collections import deque
+
+import ahocorasick
 import numpy as np
 from typing import Optional, Callable, AsyncGenerator
 from dataclasses import dataclass
 
 import pyaudio
-from google import genai
 from google.genai import types
 
-from config.settings import settings
+from core._genai_client import get_client
 from config.constants import (
     SAMPLE_RATE,
     OUTPUT_SAMPLE_RATE,
-    AUDIO_CHUNK_SIZE,
-    SILENCE_THRESHOLD,
+    AUDIO_CAPTURE_FRAMES,
+    AUDIO_PROCESS_FRAMES,
+    SILENCE_THRESHOLD_I16,
     SILENCE_DURATION,
     MAX_AUDIO_DURATION,
     GEMINI_LIVE_MODEL,
     WAKE_WORD,
     REASONING_SYSTEM_PROMPT,
+    VOICED_MIN_FRAMES,
+    VOICED_ZCR_RANGE,
+    WAKE_WORD_MODEL_PATH,
+    WAKE_WORD_LOCAL_SCORE,
 )
 
 logger = logging.getLogger(__name__)
 
+# Shared mime-type literal for the per-chunk upload payloads
+_PCM_MIME = "audio/pcm"
+
+# WAV header layout, compiled once. Only the two size fields vary between
+# calls for a given audio format, so packed headers are cached as templates
+# and just patched per call.
+_WAV_HEADER_STRUCT = struct.Struct('<4sI4s4sIHHIIHH4sI')
+_WAV_HEADER_TEMPLATES: dict[tuple[int, int, int], bytes] = {}
+
+# Fuzzy wake-word variants (pronunciations and common mishearings of
+# WAKE_WORD) compiled once into an Aho-Corasick automaton, mirroring
+# COMPLEX_AUTOMATON in config/constants.py: one O(len(transcription)) DFA
+# scan matches every variant simultaneously, and stays O(n) however many
+# variants are added.
+_WAKE_VARIANTS: tuple[str, ...] = (
+    "angira", "angeera", "anjira", "anira", "angela", "anger",
+    "on gira", "an gira",
+)
+_WAKE_AUTOMATON = ahocorasick.Automaton()
+for _variant in _WAKE_VARIANTS:
+    _WAKE_AUTOMATON.add_word(_variant, _variant)
+_WAKE_AUTOMATON.make_automaton()
+del _variant
+
+try:
+    from numba import njit
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    _HAVE_NUMBA = False
+
+try:
+    from openwakeword.model import Model as _WakeWordModel
+
+    _HAVE_OPENWAKEWORD = True
+except ImportError:  # pragma: no cover - on-device spotter is optional
+    _HAVE_OPENWAKEWORD = False
+
+
+def _energy_kernel_py(samples: np.ndarray, stride: int = 1) -> tuple[float, float, float]:
+    """Single-pass RMS + zero-crossing-rate + peak over an int16 array.
+
+    Compiled with Numba when available (LLVM auto-vectorizes the loop);
+    otherwise runs as plain Python/NumPy indexing, which is slower but
+    keeps the module importable without the optional dependency.
+
+    A stride > 1 reads every stride-th sample only. For a binary
+    voice/no-voice decision, stride 4 at 16kHz (4kHz effective) still sits
+    far above the human-voice fundamental while moving a quarter of the
+    data; note that peak then only sees sampled points, so single-sample
+    spikes between strides can be missed - threshold tuning must account
+    for that.
+
+    Returns:
+        Tuple of (rms in int16 domain, normalized zero-crossing rate,
+        peak amplitude in int16 domain).
+    """
+    n = samples.size
+    if n == 0:
+        return 0.0, 0.0, 0.0
+    ssq = 0
+    zc = 0
+    count = 1
+    prev = int(samples[0])
+    ssq += prev * prev
+    peak = -prev if prev < 0 else prev
+    for i in range(stride, n, stride):
+        x = int(samples[i])
+        ssq += x * x
+        # Branchless zero-crossing test: for int16 PCM the sign IS bit 15,
+        # so a crossing is just the XOR of adjacent sign bits.
+        zc += (x ^ prev) >> 15 & 1
+        ax = -x if x < 0 else x
+        if ax > peak:
+            peak = ax
+        prev = x
+        count += 1
+    return math.sqrt(ssq / count), zc / count, float(peak)
+
+
+if _HAVE_NUMBA:
+    _energy_kernel = njit(cache=True, fastmath=True)(_energy_kernel_py)
+else:
+    _energy_kernel = _energy_kernel_py
+
+
+class _FrameBuffer:
+    """Single-producer/single-consumer hand-off for mic frames.
+
+    asyncio.Queue allocates a waiter future and does lock bookkeeping on
+    every put/get - overhead paid on each 16ms frame. For the mic path a
+    bounded deque plus one Event is enough: deque(maxlen=...) gives the
+    drop-oldest-rather-than-block policy for free, and the Event only
+    costs anything when the consumer actually has to wait.
+    """
+
+    __slots__ = ("_frames", "_event")
+
+    def __init__(self, maxlen: int = 50):
+        self._frames: deque = deque(maxlen=maxlen)
+        self._event = asyncio.Event()
+
+    def append(self, data: bytes) -> None:
+        """Producer side: never blocks, drops the oldest frame when full."""
+        self._frames.append(data)
+        self._event.set()
+
+    async def get(self) -> bytes:
+        """Consumer side: await the next frame."""
+        while not self._frames:
+            self._event.clear()
+            await self._event.wait()
+        return self._frames.popleft()
+
+    def clear(self) -> None:
+        """Discard all buffered frames."""
+        self._frames.clear()
+
 
 @dataclass
 class AudioConfig:
@@ -37,13 +165,14 @@ class AudioConfig:
     channels: int = 1
     input_rate: int = SAMPLE_RATE
     output_rate: int = OUTPUT_SAMPLE_RATE
-    chunk_size: int = AUDIO_CHUNK_SIZE
+    capture_frames: int = AUDIO_CAPTURE_FRAMES  # small mic reads for low latency
+    process_frames: int = AUDIO_PROCESS_FRAMES  # VAD/upload accumulation window
 
 
 class AudioLiveHandler:
     """
     Handles real-time audio streaming with Gemini Live API.
-    
+
     Supports:
     - Microphone capture with silence detection
     - Real-time speech-to-text via Gemini
@@ -51,16 +180,58 @@ class AudioLiveHandler:
     - Audio playback through speakers
     """
 
+    # Small chunks (256 frames = 16ms) for fast interruption detection
+    INTERRUPT_CHUNK_SIZE = 256
+    # Sample stride for interrupt-monitor features: 4kHz effective rate is
+    # plenty for a binary voice/no-voice decision at a quarter of the reads
+    INTERRUPT_FEATURE_STRIDE = 4
+    # Sample stride for the silence probe. Mean energy is stride-invariant
+    # for a uniform subsample, so the thr^2 * n compare needs no threshold
+    # rescaling - the decision just rides on a quarter of the samples.
+    VAD_SAMPLE_STRIDE = 4
+    # Coalesce Gemini audio parts (often ~1-4KB each) into writes of at
+    # least this many bytes: one to_thread hop and one PortAudio call per
+    # batch instead of per part
+    PLAYBACK_WRITE_CHUNK = 4096
+    # Block size of the callback-mode speaker stream (~21ms at 24kHz):
+    # after an interrupt flush, at most one block of already-fetched
+    # audio still plays before silence
+    PLAYBACK_BLOCK_FRAMES = 512
+    # How long a wake cycle waits for its pipelined transcription before
+    # going back to listening; a late result is checked on the next cycle
+    WAKE_TRANSCRIBE_WAIT = 2.0
+
     def __init__(self):
         """Initialize AudioLiveHandler with Gemini client and PyAudio."""
-        self.api_key = settings.get_gemini_api_key()
-        self.client = genai.Client(api_key=self.api_key, http_options={"api_version": "v1beta"})
+        self.client = get_client()
         self.config = AudioConfig()
         self.pya = pyaudio.PyAudio()
         
-        # Audio streams
+        # Audio streams. These are persistent: opened lazily on first use
+        # and never closed between turns, because a PortAudio open is a
+        # device-init cycle costing 50-200ms that would otherwise land at
+        # the start of every user turn. The mic streams are not even
+        # stopped between turns - frames are simply dropped while no
+        # consumer is attached - so the wake -> capture -> conversation
+        # transitions pay no stream start/stop either.
         self._input_stream: Optional[pyaudio.Stream] = None
         self._output_stream: Optional[pyaudio.Stream] = None
+        self._callback_streams: dict[int, pyaudio.Stream] = {}
+        # Callback-mode speaker path for the streaming conversation:
+        # PortAudio's output thread pulls PCM out of this ring, so the event
+        # loop never blocks inside a write and an interrupt flush is just
+        # clearing the deque.
+        self._spk_stream: Optional[pyaudio.Stream] = None
+        self._spk_ring: deque = deque()
+        self._spk_lock = threading.Lock()
+        self._spk_leftover = b""
+        # Current (chunk_size, loop, push) target for the persistent mic
+        # callbacks; None while no listening method is active. The chunk
+        # size keys the sink to one stream: with several persistent
+        # streams open at different sizes, only the one whose size matches
+        # delivers frames - the others keep running but drop theirs, so a
+        # consumer never sees the same audio twice at two chunk sizes.
+        self._mic_sink: Optional[tuple] = None
         
         # Async queues for audio data
         self._mic_queue: asyncio.Queue = asyncio.Queue(maxsize=10)
@@ -69,70 +240,359 @@ class AudioLiveHandler:
         # State
         self._is_recording = False
         self._is_playing = False
-        
-        logger.info(f"AudioLiveHandler initialized with model: {GEMINI_LIVE_MODEL}")
+        self._closed = False
 
-    def _open_input_stream(self) -> pyaudio.Stream:
-        """Open microphone input stream."""
-        mic_info = self.pya.get_default_input_device_info()
-        logger.info(f"Using input device: {mic_info['name']}")
-        
-        return self.pya.open(
-            format=self.config.format,
-            channels=self.config.channels,
-            rate=self.config.input_rate,
-            input=True,
-            input_device_index=int(mic_info["index"]),
-            frames_per_buffer=self.config.chunk_size,
+        # Pipelined wake transcription: a background worker owns the Gemini
+        # RPC so the always-on wake loop can capture the next utterance
+        # while the previous transcription is still in flight. Created
+        # lazily because __init__ runs without an event loop.
+        self._transcribe_q: Optional[asyncio.Queue] = None
+        self._transcribe_results: Optional[asyncio.Queue] = None
+        self._transcriber_task: Optional[asyncio.Task] = None
+
+        # Precomputed per-frame loop constants (hot paths shouldn't redo
+        # this arithmetic 60+ times a second)
+        self._silence_frames_capture = int(
+            SILENCE_DURATION * self.config.input_rate / self.config.capture_frames
+        )
+        self._silence_frames_interrupt = int(
+            SILENCE_DURATION * self.config.input_rate / self.INTERRUPT_CHUNK_SIZE
         )
+        self._capture_frames_per_sec = self.config.input_rate / self.config.capture_frames
+        self._max_frames_capture = int(MAX_AUDIO_DURATION * self._capture_frames_per_sec)
+        self._upload_batch_bytes = self.config.process_frames * 2  # 2 bytes/sample
+        # Squared silence threshold for the integer VAD compare in
+        # _is_silence: sum(x*x) <= thr*thr*n avoids sqrt/divide per chunk
+        self._silence_thr_sq = SILENCE_THRESHOLD_I16 * SILENCE_THRESHOLD_I16
 
-    def _open_output_stream(self) -> pyaudio.Stream:
-        """Open speaker output stream."""
-        return self.pya.open(
-            format=self.config.format,
-            channels=self.config.channels,
-            rate=self.config.output_rate,
-            output=True,
+        # Reusable int16 scratch for the per-frame feature path. Copying the
+        # frame into one long-lived buffer (instead of handing the kernel a
+        # fresh frombuffer view per call) keeps the kernel reading the same
+        # hot cache lines ~60 times a second and gives Numba a stable,
+        # writable array type across calls.
+        self._feat_scratch_i16 = np.empty(
+            max(self.config.capture_frames, self.INTERRUPT_CHUNK_SIZE),
+            dtype=np.int16,
         )
 
+        # Reusable capture buffer sized for a maximum-length utterance:
+        # capture copies each turn's chunks into the same allocation
+        # instead of paying a fresh ~0.5 MB bytearray per turn.
+        self._cap_buf = bytearray(
+            self._max_frames_capture * self.config.capture_frames * 2
+        )
+
+        # On-device wake-word spotter: loaded when openwakeword and the
+        # trained model file are both available. Wake detection then scores
+        # each mic chunk locally with no network round-trip; otherwise
+        # listen_for_wake_word falls back to the Gemini transcription path.
+        self._wake_model = None
+        if _HAVE_OPENWAKEWORD and os.path.exists(WAKE_WORD_MODEL_PATH):
+            try:
+                self._wake_model = _WakeWordModel(
+                    wakeword_models=[WAKE_WORD_MODEL_PATH]
+                )
+                logger.info(f"On-device wake model loaded: {WAKE_WORD_MODEL_PATH}")
+            except Exception as e:
+                logger.warning(f"Failed to load wake model, using Gemini fallback: {e}")
+
+        # Warm the JIT so the first real audio frame doesn't pay compile cost
+        if _HAVE_NUMBA:
+            _energy_kernel(np.zeros(256, dtype=np.int16))
+
+        logger.info(f"AudioLiveHandler initialized with model: {GEMINI_LIVE_MODEL}")
+
+    def _acquire_input_stream(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        mic_queues,
+        frames_per_buffer: Optional[int] = None,
+    ) -> pyaudio.Stream:
+        """Start the persistent callback-mode microphone stream.
+
+        The callback runs on PortAudio's own capture thread and hands each
+        chunk to the event loop via call_soon_threadsafe, so consumers just
+        await the queue - no per-frame asyncio.to_thread hop and no blocking
+        read. When a queue is full its oldest frame is dropped to keep
+        interruption detection responsive.
+
+        One stream per chunk size is opened on first use and reused for the
+        life of the handler; the stored callback reads the current
+        (chunk_size, loop, push) sink off the handler, so re-targeting the
+        stream to a new turn's queues is a single attribute assignment
+        instead of a device open. The chunk size in the sink decides which
+        stream delivers - streams of other sizes stay running but drop
+        their frames.
+
+        Args:
+            loop: Running event loop that owns the queues.
+            mic_queues: A _FrameBuffer, or sequence of them, receiving raw
+                PCM chunks. With several buffers every chunk is broadcast to
+                each consumer - the immutable bytes object is
+                refcount-shared, so the fan-out is zero-copy.
+            frames_per_buffer: Chunk size; defaults to config.capture_frames.
+
+        Returns:
+            pyaudio.Stream: Started callback-mode input stream.
+        """
+        if isinstance(mic_queues, _FrameBuffer):
+            mic_queues = (mic_queues,)
+
+        def _push(data: bytes) -> None:
+            for queue in mic_queues:
+                queue.append(data)  # Bounded: drops oldest when full
+
+        frames = frames_per_buffer or self.config.capture_frames
+        self._mic_sink = (frames, loop, _push)
+
+        stream = self._callback_streams.get(frames)
+        if stream is None:
+            mic_info = self.pya.get_default_input_device_info()
+            logger.info(f"Using input device: {mic_info['name']}")
+
+            def _callback(in_data, frame_count, time_info, status):
+                # Deliver only while this stream's chunk size owns the
+                # sink; other still-running persistent streams drop here
+                sink = self._mic_sink
+                if sink is not None and sink[0] == frames:
+                    sink[1].call_soon_threadsafe(sink[2], in_data)
+                return (None, pyaudio.paContinue)
+
+            stream = self.pya.open(
+                format=self.config.format,
+                channels=self.config.channels,
+                rate=self.config.input_rate,
+                input=True,
+                input_device_index=int(mic_info["index"]),
+                frames_per_buffer=frames,
+                stream_callback=_callback,
+            )
+            self._callback_streams[frames] = stream
+        elif stream.is_stopped():
+            stream.start_stream()
+
+        return stream
+
+    def _release_input_stream(self, stream: Optional[pyaudio.Stream]) -> None:
+        """Detach the mic consumers; the stream itself keeps running.
+
+        With no sink attached the callback drops frames for free, whereas
+        stopping and restarting the stream costs a PortAudio transition at
+        the start of every turn. Only cleanup() actually closes streams.
+        """
+        self._mic_sink = None
+
+    def _acquire_output_stream(self) -> pyaudio.Stream:
+        """Get the persistent speaker stream, opening it on first use."""
+        if self._output_stream is None:
+            self._output_stream = self.pya.open(
+                format=self.config.format,
+                channels=self.config.channels,
+                rate=self.config.output_rate,
+                output=True,
+            )
+        elif self._output_stream.is_stopped():
+            self._output_stream.start_stream()
+        return self._output_stream
+
+    def _release_output_stream(self) -> None:
+        """Stop (but keep open) the speaker stream between turns."""
+        try:
+            if self._output_stream is not None and not self._output_stream.is_stopped():
+                self._output_stream.stop_stream()
+        except Exception as e:
+            logger.warning(f"Failed to stop output stream: {e}")
+
+    def _speaker_callback(self, in_data, frame_count, time_info, status):
+        """Feed the speaker from the ring; runs on PortAudio's output thread.
+
+        Assembles exactly one block from queued PCM chunks and pads with
+        silence on underflow, so the stream never stalls waiting for the
+        event loop. The ring is lock-guarded; the partial-chunk leftover is
+        otherwise only written by _flush_playback, where a race costs at
+        most one stale chunk of audio.
+        """
+        need = frame_count * 2  # 16-bit mono
+        out = bytearray()
+        chunk = self._spk_leftover
+        with self._spk_lock:
+            while len(out) + len(chunk) < need and self._spk_ring:
+                out += chunk
+                chunk = self._spk_ring.popleft()
+        take = need - len(out)
+        out += chunk[:take]
+        self._spk_leftover = chunk[take:]
+        if len(out) < need:
+            out += b"\x00" * (need - len(out))  # underflow: emit silence
+        return (bytes(out), pyaudio.paContinue)
+
+    def _acquire_speaker_ring(self) -> pyaudio.Stream:
+        """Start the persistent callback-mode speaker stream."""
+        if self._spk_stream is None:
+            self._spk_stream = self.pya.open(
+                format=self.config.format,
+                channels=self.config.channels,
+                rate=self.config.output_rate,
+                output=True,
+                frames_per_buffer=self.PLAYBACK_BLOCK_FRAMES,
+                stream_callback=self._speaker_callback,
+            )
+        elif self._spk_stream.is_stopped():
+            self._spk_stream.start_stream()
+        return self._spk_stream
+
+    def _release_speaker_ring(self) -> None:
+        """Flush and stop (but keep open) the callback speaker stream."""
+        self._flush_playback()
+        try:
+            if self._spk_stream is not None and not self._spk_stream.is_stopped():
+                self._spk_stream.stop_stream()
+        except Exception as e:
+            logger.warning(f"Failed to stop speaker stream: {e}")
+
+    def _enqueue_playback(self, pcm: bytes) -> None:
+        """Queue PCM for the callback speaker stream; never blocks."""
+        with self._spk_lock:
+            self._spk_ring.append(pcm)
+
+    def _playback_pending(self) -> bool:
+        """Whether queued playback audio remains in the ring."""
+        with self._spk_lock:
+            return bool(self._spk_ring)
+
+    def _flush_playback(self) -> None:
+        """Drop all queued playback audio.
+
+        The next speaker callback then emits silence, so audible output
+        stops within one PLAYBACK_BLOCK_FRAMES period. A block already
+        handed to PortAudio cannot be recalled.
+        """
+        with self._spk_lock:
+            self._spk_ring.clear()
+        self._spk_leftover = b""
+
     def _calculate_rms(self, audio_data: bytes) -> float:
-        """Calculate RMS (root mean square) of audio chunk for silence detection."""
+        """Calculate RMS of audio chunk in the native int16 sample domain.
+
+        Returned values compare against SILENCE_THRESHOLD_I16; no float
+        normalization pass over the samples is performed.
+        """
         try:
-            samples = struct.unpack(f"{len(audio_data)//2}h", audio_data)
-            rms = np.sqrt(np.mean(np.square(np.array(samples, dtype=np.float32))))
-            return rms / 32768.0  # Normalize to 0-1 range
+            # Zero-copy int16 view of the PyAudio buffer - no Python tuple
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            if samples.size == 0:
+                return 0.0
+            # Single-pass dot-product reduction, no squared temp array.
+            # int64 keeps the sum-of-squares exact (int16 dot would overflow).
+            s64 = samples.astype(np.int64)
+            return math.sqrt(np.dot(s64, s64) / samples.size)
         except Exception:
             return 0.0
 
-    def _calculate_energy_features(self, audio_data: bytes, prev_rms: float = 0.0) -> tuple[float, float, float]:
+    def _is_silence(self, audio_data: bytes) -> bool:
+        """Integer-only silence test for the per-chunk VAD loops.
+
+        Equivalent to ``_calculate_rms(data) <= SILENCE_THRESHOLD_I16`` but
+        compares the raw sum of squares against thr^2 * n, so the hot path
+        never leaves integer arithmetic - no sqrt, no divide, no float
+        widening of the samples. Only every VAD_SAMPLE_STRIDE-th sample is
+        probed: for ~20ms speech chunks the strided mean energy tracks the
+        full-rate one closely, at a quarter of the loads and multiplies.
+        """
+        try:
+            samples = np.frombuffer(audio_data, dtype=np.int16)[::self.VAD_SAMPLE_STRIDE]
+            if samples.size == 0:
+                return True
+            s64 = samples.astype(np.int64)
+            return int(np.dot(s64, s64)) <= self._silence_thr_sq * samples.size
+        except Exception:
+            return True
+
+    def _peak(self, audio_data: bytes) -> int:
+        """Peak absolute amplitude of a chunk, in the int16 sample domain.
+
+        Two plain min/max reductions - about a quarter the cost of the
+        sum-of-squares silence test, with no temporary array. Since peak is
+        always >= RMS, a chunk whose peak sits under the silence threshold
+        is guaranteed silent, making this a sound pre-filter.
+        """
+        try:
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            if samples.size == 0:
+                return 0
+            # max(x, -min(x)) avoids an abs() temp and the int16 overflow
+            # of abs(-32768)
+            return max(int(samples.max()), -int(samples.min()))
+        except Exception:
+            return 0
+
+    def _calculate_energy_features(
+        self, audio_data: bytes, prev_rms: float = 0.0, stride: int = 1
+    ) -> tuple[float, float, float, float]:
         """
         Calculate multiple energy features for aggressive speech detection.
-        
+
+        RMS, energy delta and peak are in the int16 sample domain (compare
+        against SILENCE_THRESHOLD_I16-scaled thresholds); ZCR stays
+        normalized 0-1. Peak responds to a single loud sample, so it flips
+        the interruption detector within one chunk where RMS needs the
+        whole frame to catch up.
+
         Returns:
-            Tuple of (rms, zero_crossing_rate, energy_delta)
+            Tuple of (rms, zero_crossing_rate, energy_delta, peak)
         """
         try:
-            samples = struct.unpack(f"{len(audio_data)//2}h", audio_data)
-            samples_array = np.array(samples, dtype=np.float32)
-            
-            # RMS
-            rms = np.sqrt(np.mean(np.square(samples_array))) / 32768.0
-            
-            # Zero-crossing rate (normalized)
-            zero_crossings = np.sum(np.abs(np.diff(np.sign(samples_array)))) / 2
-            zcr = zero_crossings / len(samples_array)
-            
+            samples_view = np.frombuffer(audio_data, dtype=np.int16)
+
+            # Copy the frame into the preallocated scratch buffer so every
+            # call feeds the kernel the same warm array; frames larger than
+            # the scratch (not expected on this path) fall back to the view.
+            n = samples_view.size
+            if n <= self._feat_scratch_i16.size:
+                samples_array = self._feat_scratch_i16[:n]
+                samples_array[:] = samples_view
+            else:
+                samples_array = samples_view
+
+            # Fused single-pass RMS + ZCR + peak kernel (Numba when available)
+            rms, zcr, peak = _energy_kernel(samples_array, stride)
+
             # Energy delta (spike detection)
             energy_delta = abs(rms - prev_rms)
-            
-            return rms, zcr, energy_delta
+
+            return rms, zcr, energy_delta, peak
         except Exception:
-            return 0.0, 0.0, 0.0
-            samples = struct.unpack(f"{len(audio_data)//2}h", audio_data)
-            rms = np.sqrt(np.mean(np.square(np.array(samples, dtype=np.float32))))
-            return rms / 32768.0  # Normalize to 0-1 range
+            return 0.0, 0.0, 0.0, 0.0
+
+    def _has_voiced_speech(self, audio_data: bytes) -> bool:
+        """
+        Check whether a capture contains enough voiced frames to be speech.
+
+        Walks the buffer in processing-window frames through the fused
+        RMS+ZCR kernel and counts frames that clear the silence threshold
+        with a zero-crossing rate inside the human-voice band. This is a
+        milliseconds-cheap local gate in front of the transcription RPC;
+        background noise and silence never reach the network.
+
+        Returns:
+            bool: True if the buffer plausibly contains speech.
+        """
+        try:
+            samples = np.frombuffer(audio_data, dtype=np.int16)
+            window = self.config.process_frames
+            zcr_low, zcr_high = VOICED_ZCR_RANGE
+
+            voiced_frames = 0
+            for start in range(0, samples.size - window + 1, window):
+                rms, zcr, _peak = _energy_kernel(samples[start:start + window])
+                if rms > SILENCE_THRESHOLD_I16 and zcr_low <= zcr <= zcr_high:
+                    voiced_frames += 1
+                    if voiced_frames >= VOICED_MIN_FRAMES:
+                        return True
+            return False
         except Exception:
-            return 0.0
+            # Gate is an optimization only - never block detection on error
+            return True
 
     async def capture_audio_until_silence(self) -> bytes:
         """
@@ -142,76 +602,87 @@ class AudioLiveHandler:
             bytes: Captured audio data in PCM format.
         """
         logger.info("Starting audio capture...")
-        self._input_stream = await asyncio.to_thread(self._open_input_stream)
-        
-        audio_chunks = []
+        loop = asyncio.get_running_loop()
+        mic_queue = _FrameBuffer(maxlen=50)
+        self._input_stream = await asyncio.to_thread(
+            self._acquire_input_stream, loop, mic_queue
+        )
+
+        # Capture length is bounded by MAX_AUDIO_DURATION, so the whole
+        # recording fits the buffer preallocated in __init__: each chunk is
+        # copied exactly once, with no list of chunks and no join pass at
+        # the end, and the allocation is shared across turns (the returned
+        # bytes below is an independent copy)
+        buf = self._cap_buf
+        pos = 0
         silence_frames = 0
-        silence_threshold_frames = int(SILENCE_DURATION * self.config.input_rate / self.config.chunk_size)
-        max_frames = int(MAX_AUDIO_DURATION * self.config.input_rate / self.config.chunk_size)
+        silence_threshold_frames = self._silence_frames_capture
+        max_frames = self._max_frames_capture
         total_frames = 0
         has_speech = False
-        
+
         try:
             while total_frames < max_frames:
-                data = await asyncio.to_thread(
-                    self._input_stream.read,
-                    self.config.chunk_size,
-                    exception_on_overflow=False
-                )
-                audio_chunks.append(data)
+                data = await mic_queue.get()
+                end = pos + len(data)
+                buf[pos:end] = data
+                pos = end
                 total_frames += 1
-                
-                rms = self._calculate_rms(data)
-                
-                if rms > SILENCE_THRESHOLD:
+
+                if self._is_silence(data):
+                    silence_frames += 1
+                else:
                     has_speech = True
                     silence_frames = 0
-                else:
-                    silence_frames += 1
-                
+
                 # Stop if we've had speech and then silence
                 if has_speech and silence_frames >= silence_threshold_frames:
-                    logger.info(f"Silence detected after {total_frames} frames")
+                    logger.info("Silence detected after %d frames", total_frames)
                     break
-                    
+
         finally:
-            self._input_stream.stop_stream()
-            self._input_stream.close()
+            self._release_input_stream(self._input_stream)
             self._input_stream = None
-        
-        audio_data = b"".join(audio_chunks)
+
+        audio_data = bytes(memoryview(buf)[:pos])
         duration = len(audio_data) / (self.config.input_rate * 2)  # 16-bit = 2 bytes
-        logger.info(f"Captured {duration:.2f}s of audio ({len(audio_data)} bytes)")
+        logger.info("Captured %.2fs of audio (%d bytes)", duration, len(audio_data))
         
         return audio_data
 
     def _pcm_to_wav(self, pcm_data: bytes, sample_rate: int = 16000, channels: int = 1, bits_per_sample: int = 16) -> bytes:
         """Convert raw PCM data to WAV format by adding a proper header."""
-        import struct
-        
-        byte_rate = sample_rate * channels * bits_per_sample // 8
-        block_align = channels * bits_per_sample // 8
         data_size = len(pcm_data)
-        
-        # WAV header (44 bytes)
-        header = struct.pack(
-            '<4sI4s4sIHHIIHH4sI',
-            b'RIFF',
-            36 + data_size,  # File size - 8
-            b'WAVE',
-            b'fmt ',
-            16,  # Subchunk1 size (16 for PCM)
-            1,   # Audio format (1 = PCM)
-            channels,
-            sample_rate,
-            byte_rate,
-            block_align,
-            bits_per_sample,
-            b'data',
-            data_size
-        )
-        
-        return header + pcm_data
+
+        key = (sample_rate, channels, bits_per_sample)
+        template = _WAV_HEADER_TEMPLATES.get(key)
+        if template is None:
+            byte_rate = sample_rate * channels * bits_per_sample // 8
+            block_align = channels * bits_per_sample // 8
+
+            # WAV header (44 bytes) with zeroed size fields
+            template = _WAV_HEADER_STRUCT.pack(
+                b'RIFF',
+                0,   # File size - 8 (patched per call)
+                b'WAVE',
+                b'fmt ',
+                16,  # Subchunk1 size (16 for PCM)
+                1,   # Audio format (1 = PCM)
+                channels,
+                sample_rate,
+                byte_rate,
+                block_align,
+                bits_per_sample,
+                b'data',
+                0    # Data size (patched per call)
+            )
+            _WAV_HEADER_TEMPLATES[key] = template
+
+        header = bytearray(template)
+        header[4:8] = (36 + data_size).to_bytes(4, "little")
+        header[40:44] = data_size.to_bytes(4, "little")
+
+        return bytes(header) + pcm_data
 
     async def transcribe_audio(self, audio_data: bytes) -> str:
         """
@@ -253,13 +724,78 @@ class AudioLiveHandler:
             transcription = response.text.strip()
             # Print to console so user can see what's being heard
             print(f"   📝 Heard: \"{transcription}\"")
-            logger.info(f"Transcription: {transcription}")
+            logger.info("Transcription: %s", transcription)
             return transcription
             
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
 
+    def _ensure_transcriber(self) -> None:
+        """Lazily start the background transcription worker on first use."""
+        if self._transcriber_task is None or self._transcriber_task.done():
+            # maxsize 2: at most one RPC in flight plus one capture queued,
+            # so a slow network backpressures the wake loop instead of
+            # piling up audio
+            self._transcribe_q = asyncio.Queue(maxsize=2)
+            self._transcribe_results = asyncio.Queue()
+            self._transcriber_task = asyncio.create_task(self._transcriber_worker())
+
+    async def _transcriber_worker(self) -> None:
+        """Drain queued captures through Gemini, posting results in order.
+
+        Owning the RPC here keeps it off the capture path: the mic loop
+        hands a finished capture over and immediately goes back to
+        listening. Failures post an empty transcription rather than
+        killing the worker.
+        """
+        while True:
+            audio_data = await self._transcribe_q.get()
+            try:
+                text = await self.transcribe_audio(audio_data)
+            except Exception as e:
+                logger.warning(f"Pipelined transcription failed: {e}")
+                text = ""
+            await self._transcribe_results.put(text)
+
+    async def _listen_for_wake_word_local(self, timeout: float) -> bool:
+        """Spot the wake word on-device with the openWakeWord model.
+
+        Scores each mic chunk as it arrives instead of uploading a capture
+        to Gemini, so a wake attempt costs no network round-trip and no
+        transcription tokens.
+
+        Args:
+            timeout: Maximum seconds to listen for the wake word.
+
+        Returns:
+            True if the wake word was spotted, False otherwise.
+        """
+        loop = asyncio.get_running_loop()
+        mic_queue = _FrameBuffer(maxlen=50)
+        self._input_stream = await asyncio.to_thread(
+            self._acquire_input_stream, loop, mic_queue
+        )
+
+        try:
+            chunks_needed = int(timeout * self._capture_frames_per_sec)
+            for _ in range(chunks_needed):
+                data = await mic_queue.get()
+                scores = self._wake_model.predict(
+                    np.frombuffer(data, dtype=np.int16)
+                )
+                if max(scores.values()) >= WAKE_WORD_LOCAL_SCORE:
+                    logger.info("Wake word spotted on-device")
+                    self._wake_model.reset()
+                    return True
+            return False
+        except Exception as e:
+            logger.warning(f"On-device wake detection failed: {e}")
+            return False
+        finally:
+            self._release_input_stream(self._input_stream)
+            self._input_stream = None
+
     async def listen_for_wake_word(self, timeout: float = 5.0) -> bool:
         """
         Listen for wake word in audio stream.
@@ -270,78 +806,117 @@ class AudioLiveHandler:
         Returns:
             True if wake word detected, False otherwise.
         """
-        logger.info(f"Listening for wake word '{WAKE_WORD}'...")
-        
+        logger.info("Listening for wake word '%s'...", WAKE_WORD)
+
+        # Prefer the on-device spotter: no upload, no transcription cost
+        if self._wake_model is not None:
+            return await self._listen_for_wake_word_local(timeout)
+
+        # A transcription submitted on a previous cycle may have completed
+        # while that cycle had already gone back to listening - check any
+        # finished results before touching the mic
+        if self._transcribe_results is not None:
+            while True:
+                try:
+                    text = self._transcribe_results.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if self._matches_wake_word(text):
+                    return True
+
         try:
             # Capture short audio segment
-            self._input_stream = await asyncio.to_thread(self._open_input_stream)
-            
-            chunks_needed = int(timeout * self.config.input_rate / self.config.chunk_size)
-            audio_chunks = []
-            
+            loop = asyncio.get_running_loop()
+            mic_queue = _FrameBuffer(maxlen=50)
+            self._input_stream = await asyncio.to_thread(
+                self._acquire_input_stream, loop, mic_queue
+            )
+
+            chunks_needed = int(timeout * self._capture_frames_per_sec)
+            extra_chunks = int(2.0 * self._capture_frames_per_sec)
+            # Worst case is the full timeout plus the post-speech tail, so
+            # one preallocated buffer holds the capture with a single copy
+            # per chunk and no join at the end
+            chunk_bytes = self.config.capture_frames * 2
+            buf = bytearray((chunks_needed + extra_chunks) * chunk_bytes)
+            pos = 0
+
             for _ in range(chunks_needed):
-                data = await asyncio.to_thread(
-                    self._input_stream.read,
-                    self.config.chunk_size,
-                    exception_on_overflow=False
-                )
-                audio_chunks.append(data)
-                
-                # Check for speech activity
-                rms = self._calculate_rms(data)
-                if rms > SILENCE_THRESHOLD:
+                data = await mic_queue.get()
+                end = pos + len(data)
+                buf[pos:end] = data
+                pos = end
+
+                # Check for speech activity. The cheap peak test rejects
+                # obviously silent chunks before the sum-of-squares runs -
+                # on a mostly quiet device that is the overwhelming case.
+                if self._peak(data) > SILENCE_THRESHOLD_I16 and not self._is_silence(data):
                     # Capture a bit more after detecting speech
-                    for _ in range(int(2.0 * self.config.input_rate / self.config.chunk_size)):
-                        data = await asyncio.to_thread(
-                            self._input_stream.read,
-                            self.config.chunk_size,
-                            exception_on_overflow=False
-                        )
-                        audio_chunks.append(data)
-                        if self._calculate_rms(data) < SILENCE_THRESHOLD:
+                    for _ in range(extra_chunks):
+                        data = await mic_queue.get()
+                        end = pos + len(data)
+                        buf[pos:end] = data
+                        pos = end
+                        if self._peak(data) <= SILENCE_THRESHOLD_I16 or self._is_silence(data):
                             break
                     break
-                    
+
         finally:
-            if self._input_stream:
-                self._input_stream.stop_stream()
-                self._input_stream.close()
-                self._input_stream = None
-        
-        audio_data = b"".join(audio_chunks)
+            self._release_input_stream(self._input_stream)
+            self._input_stream = None
+
+        audio_data = bytes(memoryview(buf)[:pos])
         
         if len(audio_data) < 1000:
             return False
-            
-        # Transcribe and check for wake word
+
+        # Local voiced-energy gate: skip the Gemini round-trip entirely when
+        # the capture is just background noise
+        if not self._has_voiced_speech(audio_data):
+            logger.debug("No voiced speech in capture - skipping transcription")
+            return False
+
+        # Hand the capture to the pipelined transcriber. If Gemini answers
+        # within the wait window the result is checked here; otherwise this
+        # cycle returns to listening and the result is consumed at the top
+        # of the next call - capture and RPC overlap instead of alternating.
         try:
-            transcription = await self.transcribe_audio(audio_data)
-            transcription_lower = transcription.lower()
-            
-            # Fuzzy matching for various pronunciations/transcriptions
-            wake_word_variants = [
-                WAKE_WORD.lower(),  # angira
-                "angira",
-                "angeera",
-                "anjira",
-                "anira",
-                "angela",  # common mishearing
-                "anger",   # partial match
-                "on gira",
-                "an gira",
-            ]
-            
-            detected = any(variant in transcription_lower for variant in wake_word_variants)
-            
-            if detected:
-                logger.info(f"Wake word detected in: '{transcription}'")
-            else:
-                logger.debug(f"No wake word in: '{transcription}'")
-            return detected
+            self._ensure_transcriber()
+            await self._transcribe_q.put(audio_data)
+            transcription = await asyncio.wait_for(
+                self._transcribe_results.get(),
+                timeout=self.WAKE_TRANSCRIBE_WAIT,
+            )
+        except asyncio.TimeoutError:
+            logger.debug("Transcription still in flight - deferring to next wake cycle")
+            return False
         except Exception as e:
             logger.warning(f"Wake word detection failed: {e}")
             return False
 
+        return self._matches_wake_word(transcription)
+
+    def _matches_wake_word(self, transcription: str) -> bool:
+        """Check a transcription for any fuzzy wake-word variant.
+
+        Every wake variant contains an 'n', so a C-level membership test
+        bails out of the common no-wake case before case folding and the
+        automaton scan run.
+        """
+        if not transcription:
+            return False
+        detected = (
+            "n" in transcription or "N" in transcription
+        ) and next(
+            _WAKE_AUTOMATON.iter(transcription.lower()), None
+        ) is not None
+
+        if detected:
+            logger.info("Wake word detected in: '%s'", transcription)
+        else:
+            logger.debug("No wake word in: '%s'", transcription)
+        return detected
+
     async def speak_text(self, text: str) -> None:
         """
         Convert text to speech and play through speakers using Gemini Live API.
@@ -352,7 +927,7 @@ class AudioLiveHandler:
         if not text:
             return
             
-        logger.info(f"Speaking: {text[:50]}...")
+        logger.info("Speaking: %.50s...", text)
         
         try:
             # Configure Live API for TTS with system instruction to read verbatim
@@ -383,25 +958,32 @@ class AudioLiveHandler:
                 )
                 
                 # Open output stream
-                output_stream = await asyncio.to_thread(self._open_output_stream)
+                output_stream = await asyncio.to_thread(self._acquire_output_stream)
                 
                 try:
-                    # Receive and play audio
+                    # Receive and play audio, coalescing the small inline
+                    # parts into larger writes so each thread hop and
+                    # PortAudio call covers several parts' worth of PCM
+                    pending = bytearray()
                     async for response in session.receive():
                         if response.server_content and response.server_content.model_turn:
                             for part in response.server_content.model_turn.parts:
                                 if part.inline_data and part.inline_data.data:
-                                    await asyncio.to_thread(
-                                        output_stream.write,
-                                        part.inline_data.data
-                                    )
-                        
+                                    pending += part.inline_data.data
+                            if len(pending) >= self.PLAYBACK_WRITE_CHUNK:
+                                await asyncio.to_thread(
+                                    output_stream.write, bytes(pending)
+                                )
+                                pending.clear()
+
                         # Check if turn is complete
                         if response.server_content and response.server_content.turn_complete:
                             break
+                    # Flush whatever is left of the final partial batch
+                    if pending:
+                        await asyncio.to_thread(output_stream.write, bytes(pending))
                 finally:
-                    output_stream.stop_stream()
-                    output_stream.close()
+                    self._release_output_stream()
                     
             logger.info("Speech playback complete")
             
@@ -445,71 +1027,130 @@ class AudioLiveHandler:
             model=GEMINI_LIVE_MODEL,
             config=config
         ) as session:
-            # Open streams
-            input_stream = await asyncio.to_thread(self._open_input_stream)
-            output_stream = await asyncio.to_thread(self._open_output_stream)
-            
+            # Open streams (mic in callback mode feeding an asyncio queue)
+            loop = asyncio.get_running_loop()
+            mic_queue = _FrameBuffer(maxlen=50)
+            input_stream = await asyncio.to_thread(
+                self._acquire_input_stream, loop, mic_queue
+            )
+            output_stream = await asyncio.to_thread(self._acquire_output_stream)
+
             try:
                 # Send audio in real-time
                 async def send_audio():
                     nonlocal user_text
                     silence_count = 0
-                    max_silence = int(SILENCE_DURATION * self.config.input_rate / self.config.chunk_size)
+                    max_silence = self._silence_frames_capture
                     has_speech = False
-                    
+                    # Local-name rebinds: the loop body runs ~50 times/sec
+                    # and LOAD_FAST beats the attribute-lookup chains
+                    get_chunk = mic_queue.get
+                    is_silence = self._is_silence
+                    send = session.send_realtime_input
+                    # pydantic v2 fast path: the payload shape is fixed, so
+                    # skip per-chunk field validation when model_construct
+                    # is available
+                    make_blob = getattr(types.Blob, "model_construct", types.Blob)
+
                     while True:
-                        data = await asyncio.to_thread(
-                            input_stream.read,
-                            self.config.chunk_size,
-                            exception_on_overflow=False
-                        )
-                        
-                        rms = self._calculate_rms(data)
-                        if rms > SILENCE_THRESHOLD:
+                        data = await get_chunk()
+
+                        if is_silence(data):
+                            silence_count += 1
+                        else:
                             has_speech = True
                             silence_count = 0
-                        else:
-                            silence_count += 1
-                        
-                        await session.send_realtime_input(
-                            audio=types.Blob(data=data, mime_type="audio/pcm")
+
+                        await send(
+                            audio=make_blob(data=data, mime_type=_PCM_MIME)
                         )
-                        
+
                         if has_speech and silence_count >= max_silence:
                             break
                 
+                # Bounded hand-off between the network receiver and the
+                # speaker writer: when playback lags, put() blocks and the
+                # receiver stops pulling from the socket instead of buffering
+                # audio without limit.
+                tts_queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+
                 # Receive response
                 async def receive_response():
                     nonlocal assistant_text
-                    async for response in session.receive():
-                        if response.server_content and response.server_content.model_turn:
-                            for part in response.server_content.model_turn.parts:
-                                if part.inline_data and part.inline_data.data:
-                                    await asyncio.to_thread(
-                                        output_stream.write,
-                                        part.inline_data.data
-                                    )
-                                if part.text:
-                                    assistant_text += part.text
-                        
-                        # Get transcription from input
-                        if response.server_content and response.server_content.input_transcription:
-                            user_text = response.server_content.input_transcription.text or ""
-                        
-                        if response.server_content and response.server_content.turn_complete:
+                    try:
+                        async for response in session.receive():
+                            if response.server_content and response.server_content.model_turn:
+                                for part in response.server_content.model_turn.parts:
+                                    if part.inline_data and part.inline_data.data:
+                                        await tts_queue.put(part.inline_data.data)
+                                    if part.text:
+                                        assistant_text += part.text
+
+                            # Get transcription from input
+                            if response.server_content and response.server_content.input_transcription:
+                                user_text = response.server_content.input_transcription.text or ""
+
+                            if response.server_content and response.server_content.turn_complete:
+                                break
+                    finally:
+                        await tts_queue.put(None)  # Sentinel: playback can finish
+
+                # Playback stage: drains the bounded queue so socket reads and
+                # speaker writes overlap instead of alternating. Parts are
+                # coalesced into >=4KB writes so each to_thread hop and
+                # PortAudio call covers several of Gemini's small parts.
+                async def play_audio():
+                    pending = bytearray()
+                    while True:
+                        pcm = await tts_queue.get()
+                        if pcm is None:
                             break
-                
-                # Run send and receive concurrently
-                await asyncio.gather(send_audio(), receive_response())
-                
+                        pending += pcm
+                        # Keep absorbing already-queued parts into this batch
+                        while len(pending) < self.PLAYBACK_WRITE_CHUNK:
+                            try:
+                                pcm = tts_queue.get_nowait()
+                            except asyncio.QueueEmpty:
+                                break
+                            if pcm is None:
+                                await asyncio.to_thread(output_stream.write, bytes(pending))
+                                return
+                            pending += pcm
+                        await asyncio.to_thread(output_stream.write, bytes(pending))
+                        pending.clear()
+                    if pending:
+                        await asyncio.to_thread(output_stream.write, bytes(pending))
+
+                # Run send and receive concurrently, but don't keep the mic
+                # sender alive once Gemini's turn is complete: cancel it the
+                # moment the receiver finishes instead of waiting for its own
+                # silence detection to trigger.
+                send_task = asyncio.create_task(send_audio())
+                recv_task = asyncio.create_task(receive_response())
+                play_task = asyncio.create_task(play_audio())
+                done, _pending = await asyncio.wait(
+                    {send_task, recv_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if recv_task in done:
+                    send_task.cancel()
+                    await asyncio.gather(send_task, return_exceptions=True)
+                else:
+                    # End of user speech - the model's reply is still streaming
+                    await recv_task
+                # Receiver is done, so the sentinel is queued: let the
+                # playback stage finish the tail of the response
+                await play_task
+                # Surface errors from whichever task actually finished
+                for task in done:
+                    task.result()
+
             finally:
-                input_stream.stop_stream()
-                input_stream.close()
-                output_stream.stop_stream()
-                output_stream.close()
+                self._release_input_stream(input_stream)
+                self._release_output_stream()
         
-        logger.info(f"User said: {user_text}")
-        logger.info(f"Assistant replied: {assistant_text[:100]}...")
+        logger.info("User said: %s", user_text)
+        logger.info("Assistant replied: %.100s...", assistant_text)
         
         return user_text, assistant_text
 
@@ -523,8 +1164,8 @@ class AudioLiveHandler:
         Ultra-low latency streaming conversation with <100ms interruption detection.
         
         Architecture:
-        1. Single mic capture task pushes to shared queue
-        2. Gemini streaming consumes from queue (1024-frame chunks)
+        1. PortAudio callback thread pushes 256-frame chunks to shared queue
+        2. Gemini streaming consumes from queue (accumulated to 100ms batches)
         3. Interruption detector consumes from queue (256-frame windows)
         4. Hard audio flush on interruption for instant silence
         
@@ -563,92 +1204,82 @@ class AudioLiveHandler:
         send_complete = asyncio.Event()
         playback_started = asyncio.Event()
         
-        # Shared audio queue for single-reader architecture
-        # Small chunks (256 frames = 16ms) for fast interruption detection
-        INTERRUPT_CHUNK_SIZE = 256
-        audio_queue: asyncio.Queue = asyncio.Queue(maxsize=50)
-        
+        # The PortAudio callback broadcasts every chunk to BOTH queues, so the
+        # Gemini sender and the interruption detector each see the full frame
+        # stream instead of racing for frames on one shared queue.
+        send_queue = _FrameBuffer(maxlen=50)
+        interrupt_queue = _FrameBuffer(maxlen=50)
+
         async with self.client.aio.live.connect(
             model=GEMINI_LIVE_MODEL,
             config=config
         ) as session:
-            # Open streams
-            input_stream = await asyncio.to_thread(self._open_input_stream)
-            output_stream = await asyncio.to_thread(self._open_output_stream)
-            
+            # Open streams. The mic runs in callback mode: PortAudio's capture
+            # thread IS the producer, so no mic-reader task is needed and no
+            # per-frame thread-pool hop happens on the event loop.
+            loop = asyncio.get_running_loop()
+            input_stream = await asyncio.to_thread(
+                self._acquire_input_stream,
+                loop,
+                (send_queue, interrupt_queue),
+                self.INTERRUPT_CHUNK_SIZE,
+            )
+            # Speaker runs in callback mode: the receive loop only appends
+            # to the ring and is never blocked inside PortAudio
+            await asyncio.to_thread(self._acquire_speaker_ring)
+
             try:
-                async def mic_capture():
-                    """
-                    SINGLE microphone reader - pushes ALL audio to shared queue.
-                    This is the ONLY task that reads from input_stream.
-                    """
-                    logger.debug("Mic capture started (single reader)")
-                    
-                    while not response_complete.is_set() or not send_complete.is_set():
-                        try:
-                            # Read smaller chunks for faster interruption detection
-                            data = await asyncio.to_thread(
-                                input_stream.read,
-                                INTERRUPT_CHUNK_SIZE,
-                                exception_on_overflow=False
-                            )
-                            
-                            # Non-blocking put - drop frames if queue is full
-                            try:
-                                audio_queue.put_nowait(data)
-                            except asyncio.QueueFull:
-                                pass  # Drop frame rather than block
-                                
-                        except Exception as e:
-                            logger.warning(f"Mic capture error: {e}")
-                            break
-                    
-                    logger.debug("Mic capture ended")
-                
                 async def send_audio():
                     """Stream audio to Gemini - consumes from shared queue."""
                     nonlocal user_text
                     silence_count = 0
-                    max_silence = int(SILENCE_DURATION * self.config.input_rate / INTERRUPT_CHUNK_SIZE)
+                    max_silence = self._silence_frames_interrupt
                     has_speech = False
-                    audio_buffer = b""
-                    
+                    # Chunk list + running length: O(1) appends, joined once per
+                    # upload (bytes += bytes re-copies the whole buffer each time)
+                    pending_chunks: list[bytes] = []
+                    pending_len = 0
+                    # Local-name rebinds for the ~60/sec loop body
+                    get_chunk = send_queue.get
+                    wait_for = asyncio.wait_for
+                    is_silence = self._is_silence
+                    send = session.send_realtime_input
+                    batch_bytes = self._upload_batch_bytes
+
                     logger.debug("Audio send loop started")
-                    
+
                     while True:
                         try:
-                            # Get audio from shared queue with timeout
+                            # Get audio from the send queue with timeout
                             try:
-                                data = await asyncio.wait_for(
-                                    audio_queue.get(), 
-                                    timeout=0.1
-                                )
+                                data = await wait_for(get_chunk(), timeout=0.1)
                             except asyncio.TimeoutError:
                                 continue
-                            
+
                             # Accumulate small chunks into larger buffer for Gemini
-                            audio_buffer += data
-                            
-                            rms = self._calculate_rms(data)
-                            if rms > SILENCE_THRESHOLD:
+                            pending_chunks.append(data)
+                            pending_len += len(data)
+
+                            if is_silence(data):
+                                silence_count += 1
+                            else:
                                 has_speech = True
                                 silence_count = 0
-                            else:
-                                silence_count += 1
-                            
-                            # Send to Gemini when we have enough data (1024 frames worth)
-                            if len(audio_buffer) >= self.config.chunk_size * 2:  # 2 bytes per sample
-                                await session.send_realtime_input(
-                                    audio={"data": audio_buffer, "mime_type": "audio/pcm"}
+
+                            # Send to Gemini when we have a full processing window
+                            if pending_len >= batch_bytes:
+                                await send(
+                                    audio={"data": b"".join(pending_chunks), "mime_type": _PCM_MIME}
                                 )
-                                audio_buffer = b""
-                            
+                                pending_chunks.clear()
+                                pending_len = 0
+
                             # Stop after detecting end of speech
                             if has_speech and silence_count >= max_silence:
                                 # Send any remaining buffer
-                                if audio_buffer:
-                                    await session.send_realtime_input(
-                                        audio={"data": audio_buffer, "mime_type": "audio/pcm"}
+                                if pending_chunks:
+                                    await send(
+                                        audio={"data": b"".join(pending_chunks), "mime_type": _PCM_MIME}
                                     )
                                 logger.debug("End of speech detected")
                                 break
@@ -678,45 +1309,49 @@ class AudioLiveHandler:
                     
                     logger.debug("Interruption monitor active")
                     
-                    # Aggressive detection thresholds
-                    ENERGY_SPIKE_THRESHOLD = 0.008  # Sudden energy increase
-                    ZCR_SPIKE_THRESHOLD = 0.15      # Voice typically has higher ZCR
-                    RMS_THRESHOLD = SILENCE_THRESHOLD * 1.0  # Lowered for sensitivity
+                    # Aggressive detection thresholds (int16 sample domain)
+                    ENERGY_SPIKE_THRESHOLD = 262  # Sudden energy increase (~0.008 * 32768)
+                    ZCR_SPIKE_THRESHOLD = 0.15    # Voice typically has higher ZCR
+                    RMS_THRESHOLD = SILENCE_THRESHOLD_I16 * 1.0  # Lowered for sensitivity
+                    # Peak gate: speech has a crest factor around 3, so this
+                    # keeps the sensitivity of the old RMS gate while reacting
+                    # to a single loud sample within one 16ms chunk
+                    PEAK_THRESHOLD = SILENCE_THRESHOLD_I16 * 3
                     
                     while not response_complete.is_set():
                         try:
-                            # Get audio from shared queue (non-blocking peek equivalent)
+                            # Get audio from the dedicated interrupt queue
                             try:
                                 data = await asyncio.wait_for(
-                                    audio_queue.get(),
+                                    interrupt_queue.get(),
                                     timeout=0.02  # 20ms timeout for responsiveness
                                 )
                             except asyncio.TimeoutError:
                                 continue
                             
                             # Calculate multiple features for aggressive detection
-                            rms, zcr, energy_delta = self._calculate_energy_features(data, prev_rms)
+                            rms, zcr, energy_delta, peak = self._calculate_energy_features(
+                                data, prev_rms, stride=self.INTERRUPT_FEATURE_STRIDE
+                            )
                             prev_rms = rms
-                            
+
                             # AGGRESSIVE: Trigger on ANY of these conditions
                             is_interrupt = (
+                                peak > PEAK_THRESHOLD or         # Single-sample spike
                                 rms > RMS_THRESHOLD or           # Basic energy threshold
                                 energy_delta > ENERGY_SPIKE_THRESHOLD or  # Sudden spike
                                 (zcr > ZCR_SPIKE_THRESHOLD and rms > RMS_THRESHOLD * 0.5)  # Voice-like
                             )
                             
                             if is_interrupt:
-                                logger.info(f"INTERRUPT! RMS={rms:.4f}, ZCR={zcr:.3f}, Delta={energy_delta:.4f}")
+                                logger.info("INTERRUPT! RMS=%.4f, ZCR=%.3f, Delta=%.4f", rms, zcr, energy_delta)
                                 was_interrupted = True
                                 interrupt_detected.set()
-                                
-                                # HARD FLUSH: Stop speaker immediately
-                                try:
-                                    output_stream.stop_stream()
-                                    output_stream.start_stream()
-                                except Exception as e:
-                                    logger.warning(f"Flush error: {e}")
-                                
+
+                                # HARD FLUSH: drop queued audio; the next
+                                # speaker callback emits silence
+                                self._flush_playback()
+
                                 if on_interrupted:
                                     on_interrupted()
                                 break
@@ -760,11 +1395,10 @@ class AudioLiveHandler:
                                             if not playback_started.is_set():
                                                 playback_started.set()
                                                 logger.debug("Playback started")
-                                            
-                                            # Check interrupt before EVERY write
+
+                                            # Check interrupt before EVERY enqueue
                                             if not interrupt_detected.is_set():
-                                                await asyncio.to_thread(
-                                                    output_stream.write,
+                                                self._enqueue_playback(
                                                     part.inline_data.data
                                                 )
                                         
@@ -776,17 +1410,21 @@ class AudioLiveHandler:
                                 if response.server_content.turn_complete:
                                     logger.debug("Turn complete")
                                     break
-                                    
+
                         except Exception as e:
                             logger.warning(f"Response receive error: {e}")
                             break
-                    
+
+                    # Let the ring drain before the turn stops the speaker,
+                    # unless the user already cut the response off
+                    while not interrupt_detected.is_set() and self._playback_pending():
+                        await asyncio.sleep(0.02)
+
                     response_complete.set()
                     logger.debug("Response receive complete")
                 
-                # Run all tasks concurrently
+                # Run all tasks concurrently (the callback thread produces audio)
                 await asyncio.gather(
-                    mic_capture(),
                     send_audio(),
                     receive_response(),
                     monitor_interruption(),
@@ -794,30 +1432,21 @@ class AudioLiveHandler:
                 )
                 
             finally:
-                # Clean shutdown
-                try:
-                    input_stream.stop_stream()
-                    input_stream.close()
-                except Exception:
-                    pass
-                    
-                try:
-                    output_stream.stop_stream()
-                    output_stream.close()
-                except Exception:
-                    pass
-                    
-                # Clear queue
-                while not audio_queue.empty():
-                    try:
-                        audio_queue.get_nowait()
-                    except:
-                        break
+                # Clean shutdown (streams stay open for the next turn)
+                self._release_input_stream(input_stream)
+                self._release_speaker_ring()
+
+                # Clear queues
+                send_queue.clear()
+                interrupt_queue.clear()
                 
                 # Brief delay for audio device reset
                 await asyncio.sleep(0.05)
         
-        logger.info(f"Conversation complete - User: '{user_text[:50] if user_text else ''}...', Response: {len(assistant_text)} chars, Interrupted: {was_interrupted}")
+        logger.info(
+            "Conversation complete - User: '%.50s...', Response: %d chars, Interrupted: %s",
+            user_text or "", len(assistant_text), was_interrupted,
+        )
         
         return user_text, assistant_text, was_interrupted
 
@@ -849,21 +1478,45 @@ class AudioLiveHandler:
             "api": "Google Gemini Live API",
             "input_sample_rate": self.config.input_rate,
             "output_sample_rate": self.config.output_rate,
-            "chunk_size": self.config.chunk_size,
+            "capture_frames": self.config.capture_frames,
+            "process_frames": self.config.process_frames,
         }
 
+    async def __aenter__(self) -> "AudioLiveHandler":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.to_thread(self.cleanup)
+
     def cleanup(self) -> None:
-        """Clean up PyAudio resources."""
+        """Clean up PyAudio resources (closes the persistent streams).
+
+        Idempotent: a second call (e.g. signal handler followed by the
+        normal teardown path) is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._mic_sink = None
+        if self._transcriber_task is not None:
+            self._transcriber_task.cancel()
+            self._transcriber_task = None
+        for stream in self._callback_streams.values():
+            try:
+                stream.close()
+            except Exception:
+                pass
+        self._callback_streams.clear()
         if self._input_stream:
             self._input_stream.close()
         if self._output_stream:
             self._output_stream.close()
+            self._output_stream = None
+        if self._spk_stream:
+            try:
+                self._spk_stream.close()
+            except Exception:
+                pass
+            self._spk_stream = None
         self.pya.terminate()
         logger.info("AudioLiveHandler cleaned up")
-
-    def __del__(self):
-        """Destructor to ensure cleanup."""
-        try:
-            self.cleanup()
-        except Exception:
-            pass
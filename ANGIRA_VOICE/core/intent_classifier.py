@@ -3,21 +3,48 @@ Intent classifier module for Agnira Voice Assistant.
 Classifies user queries as simple, conceptual, or complex to optimize response routing.
 """
 
+import functools
+import itertools
 import logging
 import re
 from typing import Literal
 from config.constants import (
     MIN_QUERY_LENGTH_SIMPLE,
     MAX_QUERY_LENGTH_SIMPLE,
-    COMPLEX_KEYWORDS,
-    MATH_OPERATORS,
+    COMPLEX_AUTOMATON,
+    MATH_OPERATOR_RE,
     MAX_CONCEPTUAL_WORDS,
+    INTENT_CACHE_SIZE,
 )
 
 logger = logging.getLogger(__name__)
 
+# Anchored alternation for question starters that rule out a conceptual
+# probe, compiled once at import: one C-level match replaces a Python loop
+# of startswith checks (and the per-call list build) on every query.
+_NON_CONCEPTUAL_STARTERS_RE = re.compile(
+    r"what is|what are|what's|how |why |explain|derive|prove|can you|could you"
+)
+
+# Arithmetic tells for "what is X?" disambiguation: any digit or operator
+# character, or a spelled-out operation word. One C-level regex scan
+# replaces the per-character isdigit() generator plus a substring search
+# per indicator.
+_ARITHMETIC_RE = re.compile(r"[0-9+\-*/x]|plus|minus|times|divided|multiplied")
+
+# Anchored what-is matcher that detects the prefix and captures the
+# remainder (sans trailing ?/whitespace) in the same pass, replacing a
+# startswith scan followed by a second prefix loop plus strip/rstrip
+# allocations just to slice it off.
+_WHAT_IS_RE = re.compile(r"^(?:what is|what are|what's)\s+(.*?)[\s?]*$")
 
-def _is_conceptual_probe(text: str) -> bool:
+# Token iterator for the probe word-count bound - paired with islice it
+# stops after MAX_CONCEPTUAL_WORDS + 1 hits instead of materializing every
+# token of a long query the way str.split() does.
+_WORD_RE = re.compile(r"\S+")
+
+
+def _is_conceptual_probe(text_stripped: str, text_lower: str) -> bool:
     """
     Check if text is a short conceptual probe (e.g., "entropy?", "gravity?").
 
@@ -27,45 +54,32 @@ def _is_conceptual_probe(text: str) -> bool:
     - Does NOT start with question words like "what is", "how", etc.
 
     Args:
-        text (str): Text to check.
+        text_stripped (str): Query with surrounding whitespace removed.
+        text_lower (str): The same query, case-folded by the caller.
 
     Returns:
         bool: True if text is a conceptual probe.
     """
-    text_stripped = text.strip()
-
     # Must end with ?
     if not text_stripped.endswith("?"):
         return False
 
-    # Count words (split on whitespace)
-    words = text_stripped.split()
-    if len(words) > MAX_CONCEPTUAL_WORDS:
+    # Word-count bound: stop counting as soon as the limit is exceeded
+    over_limit = itertools.islice(
+        _WORD_RE.finditer(text_stripped), MAX_CONCEPTUAL_WORDS, None
+    )
+    if next(over_limit, None) is not None:
         return False
 
     # Should not start with complex/explanatory question patterns
-    text_lower = text_stripped.lower()
-    non_conceptual_starters = [
-        "what is",
-        "what are",
-        "what's",
-        "how ",
-        "why ",
-        "explain",
-        "derive",
-        "prove",
-        "can you",
-        "could you",
-    ]
-    for starter in non_conceptual_starters:
-        if text_lower.startswith(starter):
-            return False
-
-    logger.debug(f"Query '{text}' identified as conceptual probe")
+    if _NON_CONCEPTUAL_STARTERS_RE.match(text_lower):
+        return False
+
+    logger.debug("Query '%s' identified as conceptual probe", text_stripped)
     return True
 
 
-def _is_what_is_concept_question(text: str) -> bool:
+def _is_what_is_concept_question(text_lower: str) -> bool:
     """
     Check if text is a 'what is X?' question asking about a concept (not arithmetic).
 
@@ -73,44 +87,26 @@ def _is_what_is_concept_question(text: str) -> bool:
     'What is 2 plus 2?' → False (arithmetic)
 
     Args:
-        text (str): Text to check.
+        text_lower (str): Query, stripped and case-folded by the caller.
 
     Returns:
         bool: True if it's a concept question requiring explanation.
     """
-    text_lower = text.lower().strip()
-
-    # Must start with "what is" or "what are" or "what's"
-    what_patterns = ["what is ", "what are ", "what's "]
-    is_what_question = any(text_lower.startswith(p) for p in what_patterns)
-
-    if not is_what_question:
+    # Must start with "what is" or "what are" or "what's"; the match also
+    # hands back the part after the prefix
+    m = _WHAT_IS_RE.match(text_lower)
+    if m is None:
         return False
 
-    # Extract the part after "what is/are/what's"
-    for pattern in what_patterns:
-        if text_lower.startswith(pattern):
-            remainder = text_lower[len(pattern):].strip().rstrip("?")
-            break
+    remainder = m.group(1)
 
-    # If remainder contains numbers or arithmetic words, it's likely arithmetic
-    arithmetic_indicators = [
-        "plus", "minus", "times", "divided", "multiplied",
-        "+", "-", "*", "/", "x",
-    ]
-
-    # Check if remainder has digits
-    has_digits = any(c.isdigit() for c in remainder)
-
-    # Check if remainder has arithmetic words
-    has_arithmetic = any(ind in remainder for ind in arithmetic_indicators)
-
-    # If it has digits or arithmetic indicators, it's NOT a concept question
-    if has_digits or has_arithmetic:
+    # If the remainder contains digits or arithmetic indicators, it's NOT
+    # a concept question
+    if _ARITHMETIC_RE.search(remainder):
         return False
 
     # Otherwise, it's asking about a concept
-    logger.debug(f"Query '{text}' identified as 'what is' concept question")
+    logger.debug("Query '%s' identified as 'what is' concept question", text_lower)
     return True
 
 
@@ -138,42 +134,68 @@ def classify_intent(text: str) -> Literal["simple", "conceptual", "complex"]:
         >>> classify_intent("what is entropy?")
         "complex"
     """
-    # Rule 1: Empty/invalid → SIMPLE
+    # Rule 1: Empty/invalid → SIMPLE. Kept outside the cache so bad
+    # inputs (None, non-strings) neither occupy cache slots nor have to
+    # be hashable.
     if not text or not isinstance(text, str):
         logger.warning("Invalid input to classify_intent")
         return "simple"
 
-    text_lower = text.lower().strip()
-    text_length = len(text)
+    return _classify_intent_impl(text)
+
+
+@functools.lru_cache(maxsize=INTENT_CACHE_SIZE)
+def _classify_intent_impl(
+    text: str,
+    _max_len: int = MAX_QUERY_LENGTH_SIMPLE,
+    _op_findall=MATH_OPERATOR_RE.findall,
+    _kw_iter=COMPLEX_AUTOMATON.iter,
+) -> Literal["simple", "conceptual", "complex"]:
+    """Run the rule cascade; memoized since classification is pure.
 
+    Repeated utterances resolve to a hash lookup; the debug logging
+    inside the rules naturally only fires on cache misses. The trailing
+    defaults pre-bind the rule constants and bound methods at definition
+    time (LOAD_FAST instead of LOAD_GLOBAL plus attribute lookups on
+    every miss) - callers pass only the text.
+    """
     # Rule 2: Check for COMPLEX indicators
 
-    # 2a: Query length exceeds threshold
-    if text_length > MAX_QUERY_LENGTH_SIMPLE:
-        logger.debug(f"Query length {text_length} exceeds threshold - classifying as complex")
+    # 2a: Query length exceeds threshold. Checked on the raw string before
+    # any strip/lower pass - the largest inputs (the ones where an O(n)
+    # copy costs the most) return here without ever being copied.
+    text_length = len(text)
+    if text_length > _max_len:
+        logger.debug("Query length %d exceeds threshold - classifying as complex", text_length)
         return "complex"
 
-    # 2b: Multiple mathematical operators
-    operator_count = sum(1 for op in MATH_OPERATORS if op in text_lower)
+    # Strip and case-fold exactly once; the helpers receive these instead
+    # of re-deriving their own copies (each .lower()/.strip() is a fresh
+    # O(n) string allocation).
+    text_stripped = text.strip()
+    text_lower = text_stripped.lower()
+
+    # 2b: Multiple mathematical operators (one regex pass, count distinct)
+    operator_count = len(set(_op_findall(text_lower)))
     if operator_count > 1:
-        logger.debug(f"Found {operator_count} mathematical operators - classifying as complex")
+        logger.debug("Found %d mathematical operators - classifying as complex", operator_count)
         return "complex"
 
-    # 2c: Complex reasoning keywords
-    for keyword in COMPLEX_KEYWORDS:
-        if keyword.lower() in text_lower:
-            logger.debug(f"Found complex keyword '{keyword}' - classifying as complex")
-            return "complex"
+    # 2c: Complex reasoning keywords (single automaton scan over the query)
+    keyword_match = next(_kw_iter(text_lower), None)
+    if keyword_match is not None:
+        logger.debug("Found complex keyword '%s' - classifying as complex", keyword_match[1])
+        return "complex"
 
     # 2d: 'What is X?' concept questions (not arithmetic)
-    if _is_what_is_concept_question(text):
+    if _is_what_is_concept_question(text_lower):
         return "complex"
 
     # Rule 3: Check for CONCEPTUAL (short concept probes)
-    if _is_conceptual_probe(text):
-        logger.debug(f"Query classified as conceptual: '{text}'")
+    if _is_conceptual_probe(text_stripped, text_lower):
+        logger.debug("Query classified as conceptual: '%s'", text)
         return "conceptual"
 
     # Rule 4: Fallback → SIMPLE
-    logger.debug(f"Query classified as simple (length: {text_length})")
+    logger.debug("Query classified as simple (length: %d)", text_length)
     return "simple"
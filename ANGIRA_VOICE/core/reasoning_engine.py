@@ -3,14 +3,17 @@ Reasoning engine module for Agnira Voice Assistant.
 Uses Google Gemini API (new google.genai SDK) for reasoning, problem-solving, and complex analysis.
 """
 
+import asyncio
+import hashlib
 import logging
+import re
 import time
-from typing import Optional, List, Dict
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Deque, Optional, List, Dict
 
-from google import genai
 from google.genai import types
 
-from config.settings import settings
+from core._genai_client import get_client
 from config.constants import (
     GEMINI_REASONING_MODEL,
     GEMINI_MAX_TOKENS,
@@ -18,10 +21,14 @@ from config.constants import (
     REASONING_SYSTEM_PROMPT,
     CONVERSATION_MEMORY_MAX_TURNS,
     CONVERSATION_MEMORY_TTL,
+    RESPONSE_CACHE_MAX_ENTRIES,
 )
 
 logger = logging.getLogger(__name__)
 
+# Whitespace run collapse for cache-key canonicalization
+_CACHE_WS_RE = re.compile(r"\s+")
+
 
 class ConversationMemory:
     """
@@ -38,32 +45,31 @@ class ConversationMemory:
         """
         self.max_turns = max_turns
         self.ttl = ttl
-        self._history: List[types.Content] = []
+        # Bounded deque (each turn = 2 messages): append is O(1) and the
+        # oldest turn falls off automatically, with none of the slice-copy
+        # the old list trim paid on every overflowing turn.
+        self._history: Deque[types.Content] = deque(maxlen=max_turns * 2)
         self._last_update: float = time.time()
 
-    def add(self, user_message: str, assistant_message: str) -> None:
-        """Add a Q&A pair to memory."""
-        self._history.append(
-            types.Content(role="user", parts=[types.Part.from_text(text=user_message)])
-        )
-        self._history.append(
-            types.Content(role="model", parts=[types.Part.from_text(text=assistant_message)])
-        )
+    def add(self, user_content: types.Content, assistant_content: types.Content) -> None:
+        """Add a Q&A pair to memory.
+
+        Takes already-built Content objects so the caller can share the
+        very instances it sent to the API - no second Content/Part
+        allocation per turn just for storage.
+        """
+        self._history.append(user_content)
+        self._history.append(assistant_content)
         self._last_update = time.time()
 
-        # Trim to max turns (each turn = 2 messages)
-        max_messages = self.max_turns * 2
-        if len(self._history) > max_messages:
-            self._history = self._history[-max_messages:]
-        
-        logger.debug(f"Memory updated: {len(self._history) // 2} turns stored")
+        logger.debug("Memory updated: %d turns stored", len(self._history) // 2)
 
     def get_history(self) -> List[types.Content]:
         """Get conversation history if not expired."""
         if self._is_expired():
             self.clear()
             return []
-        return self._history.copy()
+        return list(self._history)
 
     def _is_expired(self) -> bool:
         """Check if memory has expired."""
@@ -71,7 +77,7 @@ class ConversationMemory:
 
     def clear(self) -> None:
         """Clear conversation history."""
-        self._history = []
+        self._history.clear()
         self._last_update = time.time()
         logger.debug("Conversation memory cleared")
 
@@ -89,13 +95,200 @@ class ReasoningEngine:
     SIMPLE queries are stateless for speed and cost efficiency.
     """
 
+    # Server-side TTL requested for the system-prompt cache, and how long
+    # before that lapses the handle is refreshed proactively so no request
+    # ever references an expired cache.
+    SYSTEM_CACHE_TTL = 3600
+    SYSTEM_CACHE_REFRESH_MARGIN = 60
+
     def __init__(self):
         """Initialize ReasoningEngine with Gemini API credentials."""
-        self.api_key = settings.get_gemini_api_key()
-        self.client = genai.Client(api_key=self.api_key, http_options={"api_version": "v1beta"})
+        self.client = get_client()
         self.model_name = GEMINI_REASONING_MODEL
         self.memory = ConversationMemory()
-        logger.info(f"ReasoningEngine initialized with Gemini model: {self.model_name}")
+        # Server-side system-prompt cache, created lazily on the first
+        # request so constructing the engine never blocks on the network.
+        # The zero deadline makes the first _config_for call create it;
+        # after that it is refreshed shortly before its TTL lapses and
+        # recreated on the spot if the API reports it dead mid-session.
+        self._cached_system: Optional[types.CachedContent] = None
+        self._cache_refresh_at = 0.0
+        # Exact-match response cache (LRU via OrderedDict): a repeated
+        # (intent, query, history) triple skips the API round-trip - the
+        # saving is the entire network latency, not CPU.
+        self._exact_cache: OrderedDict[bytes, str] = OrderedDict()
+        # One frozen GenerateContentConfig per intent: only the token
+        # budget varies between requests, so per-call construction of the
+        # config plus its nested AutomaticFunctionCallingConfig is pure
+        # allocation churn. Starts inline (no cache handle yet) and is
+        # rebuilt whenever the cache handle changes.
+        self._configs: Dict[str, types.GenerateContentConfig] = {}
+        self._rebuild_configs()
+        # Single-flight table for async callers: concurrent identical
+        # (intent, query, history) requests share one in-flight API call
+        # instead of issuing duplicates. With several users asking the
+        # same thing at once, N requests cost one round-trip.
+        self._inflight: Dict[bytes, "asyncio.Task[str]"] = {}
+        logger.info("ReasoningEngine initialized with Gemini model: %s", self.model_name)
+
+    def _create_system_cache(self) -> Optional[types.CachedContent]:
+        """
+        Cache the system prompt server-side so it is tokenized once, not on
+        every request. Falls back to sending the prompt inline if the model
+        or account does not support context caching.
+
+        Returns:
+            Optional[types.CachedContent]: Cache handle, or None if unavailable.
+        """
+        try:
+            cache = self.client.caches.create(
+                model=self.model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=REASONING_SYSTEM_PROMPT,
+                    ttl=f"{self.SYSTEM_CACHE_TTL}s",
+                ),
+            )
+            logger.info("System prompt cached server-side: %s", cache.name)
+            return cache
+        except Exception as e:
+            logger.warning("Context caching unavailable, sending system prompt inline: %s", e)
+            return None
+
+    def _rebuild_configs(self) -> None:
+        """Rebuild the per-intent configs for the current cache handle."""
+        self._configs = {
+            intent: self._generation_config(self._max_tokens(intent))
+            for intent in ("simple", "conceptual", "complex")
+        }
+
+    def _refresh_system_cache(self) -> None:
+        """(Re)create the system cache and swap the configs onto it.
+
+        On creation failure the configs fall back to the inline prompt and
+        no further attempts are made - the same terminal state as when the
+        account doesn't support context caching at all.
+        """
+        self._cached_system = self._create_system_cache()
+        if self._cached_system is not None:
+            self._cache_refresh_at = (
+                time.monotonic()
+                + self.SYSTEM_CACHE_TTL
+                - self.SYSTEM_CACHE_REFRESH_MARGIN
+            )
+        else:
+            self._cache_refresh_at = float("inf")
+        self._rebuild_configs()
+
+    def _config_for(self, intent: str) -> types.GenerateContentConfig:
+        """Per-intent config, creating/refreshing the system cache when due."""
+        if time.monotonic() >= self._cache_refresh_at:
+            self._refresh_system_cache()
+        return self._configs.get(intent, self._configs["complex"])
+
+    async def _config_for_async(self, intent: str) -> types.GenerateContentConfig:
+        """Async twin of _config_for; the refresh RPC runs off-loop."""
+        if time.monotonic() >= self._cache_refresh_at:
+            await asyncio.to_thread(self._refresh_system_cache)
+        return self._configs.get(intent, self._configs["complex"])
+
+    def _is_stale_cache_error(self, exc: Exception) -> bool:
+        """Whether an API failure points at a dead cached-content handle.
+
+        The proactive refresh should keep this from ever firing, but the
+        server can drop a cache early; those errors name the cachedContent
+        resource, which is the signal to recreate it and retry once.
+        """
+        if self._cached_system is None:
+            return False
+        message = str(exc).lower()
+        return "cachedcontent" in message or "cached content" in message
+
+    @staticmethod
+    def _max_tokens(intent: str) -> int:
+        """Token budget for an intent (simple answers stay short)."""
+        if intent == "simple":
+            return min(256, GEMINI_MAX_TOKENS)
+        if intent == "conceptual":
+            return min(512, GEMINI_MAX_TOKENS)
+        return GEMINI_MAX_TOKENS
+
+    def _generation_config(self, max_tokens: int) -> types.GenerateContentConfig:
+        """Build the generation config for one request.
+
+        With a server-side cache the system prompt is referenced by handle
+        instead of re-sent and re-tokenized per call.
+        """
+        if self._cached_system is not None:
+            return types.GenerateContentConfig(
+                cached_content=self._cached_system.name,
+                max_output_tokens=max_tokens,
+                temperature=GEMINI_TEMPERATURE,
+                automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
+                    maximumRemoteCalls=100
+                ),
+            )
+        return types.GenerateContentConfig(
+            system_instruction=REASONING_SYSTEM_PROMPT,
+            max_output_tokens=max_tokens,
+            temperature=GEMINI_TEMPERATURE,
+            automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
+                maximumRemoteCalls=100
+            ),
+        )
+
+    @staticmethod
+    def _stripped(text: str) -> str:
+        """strip() only when needed - clean text is returned as-is.
+
+        Responses run up to GEMINI_MAX_TOKENS worth of characters;
+        skipping the copy when the ends are already clean saves a
+        full-length allocation per turn.
+        """
+        if text and (text[0].isspace() or text[-1].isspace()):
+            return text.strip()
+        return text
+
+    @staticmethod
+    def _user_content(text: str) -> types.Content:
+        """Wrap text as a user-role Content."""
+        return types.Content(role="user", parts=[types.Part.from_text(text=text)])
+
+    @staticmethod
+    def _model_content(text: str) -> types.Content:
+        """Wrap text as a model-role Content."""
+        return types.Content(role="model", parts=[types.Part.from_text(text=text)])
+
+    @staticmethod
+    def _canonical_query(query: str) -> str:
+        """Canonicalize a query for cache-key purposes.
+
+        Casefolding, collapsing whitespace runs and dropping trailing
+        sentence punctuation lets near-identical phrasings ("Entropy?",
+        " entropy ", "entropy") share one cache slot - a cheap stand-in
+        for semantic matching that can never return a wrong answer, since
+        the canonical forms are the same question verbatim.
+        """
+        return _CACHE_WS_RE.sub(" ", query.strip().casefold()).rstrip("?!. ")
+
+    @classmethod
+    def _cache_key(cls, intent: str, query: str, history: List[types.Content]) -> bytes:
+        """Fingerprint of everything that shapes the response.
+
+        Hashing the history texts (not object identities) makes the key
+        exact: the same question in the same conversational context maps
+        to the same digest across turns. The query is canonicalized first
+        so trivially different phrasings hit the same slot.
+        """
+        h = hashlib.blake2b(digest_size=16)
+        h.update(intent.encode())
+        h.update(b"\0")
+        h.update(cls._canonical_query(query).encode())
+        for content in history:
+            for part in content.parts or ():
+                if part.text:
+                    h.update(b"\0")
+                    h.update(part.text.encode())
+        return h.digest()
 
     def solve(self, query: str, intent: str = "simple") -> str:
         """
@@ -115,14 +308,7 @@ class ReasoningEngine:
         if not query or not isinstance(query, str):
             raise ValueError("Query must be a non-empty string")
 
-        logger.info(f"Sending query to Gemini ({self.model_name}): {query[:100]}...")
-
-        # Adjust max tokens based on intent
-        max_tokens = GEMINI_MAX_TOKENS
-        if intent == "simple":
-            max_tokens = min(256, GEMINI_MAX_TOKENS)
-        elif intent == "conceptual":
-            max_tokens = min(512, GEMINI_MAX_TOKENS)
+        logger.info("Sending query to Gemini (%s): %.100s...", self.model_name, query)
 
         # Use memory for CONCEPTUAL and COMPLEX only
         use_memory = intent in ("conceptual", "complex")
@@ -130,46 +316,287 @@ class ReasoningEngine:
         try:
             # Build contents with history if applicable
             contents = []
-            
+            history: List[types.Content] = []
+
+            if use_memory:
+                history = self.memory.get_history()
+                if history:
+                    logger.debug("Including %d turns of conversation history", len(history) // 2)
+                    contents.extend(history)
+
+            # Exact-match cache: COMPLEX is excluded (multi-turn answers go
+            # stale), and the key covers the history so a cached CONCEPTUAL
+            # answer is only reused in the identical context.
+            cache_key = None
+            if intent in ("simple", "conceptual"):
+                cache_key = self._cache_key(intent, query, history)
+                cached = self._exact_cache.get(cache_key)
+                if cached is not None:
+                    self._exact_cache.move_to_end(cache_key)
+                    logger.info("Response cache hit for query: %.50s...", query)
+                    if use_memory:
+                        self.memory.add(
+                            self._user_content(query), self._model_content(cached)
+                        )
+                    return cached
+
+            # Add current query. Built once and shared with memory below -
+            # the Content sent to the API is the Content that gets stored.
+            user_content = self._user_content(query)
+            contents.append(user_content)
+
+            try:
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=self._config_for(intent),
+                )
+            except Exception as api_err:
+                if not self._is_stale_cache_error(api_err):
+                    raise
+                logger.warning(
+                    "System prompt cache rejected mid-session, refreshing: %s", api_err
+                )
+                self._refresh_system_cache()
+                response = self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=contents,
+                    config=self._configs.get(intent, self._configs["complex"]),
+                )
+
+            response_text = self._stripped(response.text)
+
+            logger.info("Gemini response received: %d chars", len(response_text))
+
+            if cache_key is not None:
+                self._exact_cache[cache_key] = response_text
+                if len(self._exact_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                    self._exact_cache.popitem(last=False)
+
+            # Store in memory for CONCEPTUAL and COMPLEX
+            if use_memory:
+                self.memory.add(user_content, self._model_content(response_text))
+
+            return response_text
+
+        except Exception as e:
+            logger.error("Reasoning engine failed: %s", e, exc_info=True)
+            raise RuntimeError(f"Gemini API error: {e}") from e
+
+    async def solve_async(self, query: str, intent: str = "simple") -> str:
+        """
+        Async counterpart of solve() using the SDK's native async client.
+
+        Awaiting client.aio directly keeps the request on the running event
+        loop instead of parking a thread-pool worker on a blocking socket -
+        no thread handoff, and the GIL stays free for the audio handler
+        while the RPC is in flight. Cache, memory, and error semantics are
+        identical to solve().
+
+        Args:
+            query (str): User query requiring reasoning or problem-solving.
+            intent (str): Query intent (simple/conceptual/complex) for context.
+
+        Returns:
+            str: Detailed solution or explanation from Gemini.
+
+        Raises:
+            ValueError: If query is empty.
+            RuntimeError: If the API call fails.
+        """
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        logger.info("Sending query to Gemini (%s): %.100s...", self.model_name, query)
+
+        use_memory = intent in ("conceptual", "complex")
+
+        try:
+            contents = []
+            history: List[types.Content] = []
+
             if use_memory:
                 history = self.memory.get_history()
                 if history:
-                    logger.debug(f"Including {len(history) // 2} turns of conversation history")
+                    logger.debug("Including %d turns of conversation history", len(history) // 2)
                     contents.extend(history)
-            
-            # Add current query
-            contents.append(
-                types.Content(role="user", parts=[types.Part.from_text(text=query)])
+
+            cache_key = None
+            if intent in ("simple", "conceptual"):
+                cache_key = self._cache_key(intent, query, history)
+                cached = self._exact_cache.get(cache_key)
+                if cached is not None:
+                    self._exact_cache.move_to_end(cache_key)
+                    logger.info("Response cache hit for query: %.50s...", query)
+                    if use_memory:
+                        self.memory.add(
+                            self._user_content(query), self._model_content(cached)
+                        )
+                    return cached
+
+            user_content = self._user_content(query)
+            contents.append(user_content)
+
+            # Coalesce cacheable requests: followers await the leader's
+            # task (shielded, so one caller's cancellation doesn't kill
+            # the shared call). The leader updates cache and memory once.
+            if cache_key is not None:
+                task = self._inflight.get(cache_key)
+                if task is None:
+                    task = asyncio.create_task(
+                        self._request_async(contents, intent, user_content, cache_key, use_memory)
+                    )
+                    self._inflight[cache_key] = task
+                    task.add_done_callback(
+                        lambda _t, k=cache_key: self._inflight.pop(k, None)
+                    )
+                else:
+                    logger.info("Coalesced duplicate in-flight query: %.50s...", query)
+                return await asyncio.shield(task)
+
+            return await self._request_async(
+                contents, intent, user_content, cache_key, use_memory
             )
 
-            # Generate response
-            response = self.client.models.generate_content(
+        except Exception as e:
+            logger.error("Reasoning engine failed: %s", e, exc_info=True)
+            raise RuntimeError(f"Gemini API error: {e}") from e
+
+    async def _request_async(
+        self,
+        contents: List[types.Content],
+        intent: str,
+        user_content: types.Content,
+        cache_key: Optional[bytes],
+        use_memory: bool,
+    ) -> str:
+        """Issue one async generate_content call and record its result."""
+        try:
+            response = await self.client.aio.models.generate_content(
                 model=self.model_name,
                 contents=contents,
-                config=types.GenerateContentConfig(
-                    system_instruction=REASONING_SYSTEM_PROMPT,
-                    max_output_tokens=max_tokens,
-                    temperature=GEMINI_TEMPERATURE,
-                    automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
-                        maximumRemoteCalls=100
-                    ),
-                ),
+                config=await self._config_for_async(intent),
+            )
+        except Exception as api_err:
+            if not self._is_stale_cache_error(api_err):
+                raise
+            logger.warning(
+                "System prompt cache rejected mid-session, refreshing: %s", api_err
+            )
+            await asyncio.to_thread(self._refresh_system_cache)
+            response = await self.client.aio.models.generate_content(
+                model=self.model_name,
+                contents=contents,
+                config=self._configs.get(intent, self._configs["complex"]),
             )
 
-            response_text = response.text.strip()
+        response_text = self._stripped(response.text)
 
-            logger.info(f"Gemini response received: {len(response_text)} chars")
+        logger.info("Gemini response received: %d chars", len(response_text))
 
-            # Store in memory for CONCEPTUAL and COMPLEX
-            if use_memory:
-                self.memory.add(query, response_text)
+        if cache_key is not None:
+            self._exact_cache[cache_key] = response_text
+            if len(self._exact_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                self._exact_cache.popitem(last=False)
 
-            return response_text
+        if use_memory:
+            self.memory.add(user_content, self._model_content(response_text))
+
+        return response_text
+
+    async def solve_stream(self, query: str, intent: str = "simple") -> AsyncIterator[str]:
+        """
+        Solve a query, yielding response text chunks as they are generated.
+
+        Streaming counterpart of solve() for consumers like
+        route_response_stream_async: time-to-first-audio is gated on the
+        first token instead of the full completion. Memory and the exact
+        cache are updated once the stream finishes; a cache hit yields the
+        stored answer as a single chunk.
+
+        Args:
+            query (str): User query requiring reasoning or problem-solving.
+            intent (str): Query intent (simple/conceptual/complex) for context.
 
+        Yields:
+            str: Response text chunks in generation order.
+
+        Raises:
+            ValueError: If query is empty.
+            RuntimeError: If the API call fails.
+        """
+        if not query or not isinstance(query, str):
+            raise ValueError("Query must be a non-empty string")
+
+        logger.info("Streaming query to Gemini (%s): %.100s...", self.model_name, query)
+
+        use_memory = intent in ("conceptual", "complex")
+
+        contents = []
+        history: List[types.Content] = []
+
+        if use_memory:
+            history = self.memory.get_history()
+            if history:
+                logger.debug("Including %d turns of conversation history", len(history) // 2)
+                contents.extend(history)
+
+        cache_key = None
+        if intent in ("simple", "conceptual"):
+            cache_key = self._cache_key(intent, query, history)
+            cached = self._exact_cache.get(cache_key)
+            if cached is not None:
+                self._exact_cache.move_to_end(cache_key)
+                logger.info("Response cache hit for query: %.50s...", query)
+                if use_memory:
+                    self.memory.add(
+                        self._user_content(query), self._model_content(cached)
+                    )
+                yield cached
+                return
+
+        user_content = self._user_content(query)
+        contents.append(user_content)
+
+        pieces: List[str] = []
+        try:
+            try:
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=contents,
+                    config=await self._config_for_async(intent),
+                )
+            except Exception as api_err:
+                if not self._is_stale_cache_error(api_err):
+                    raise
+                logger.warning(
+                    "System prompt cache rejected mid-session, refreshing: %s", api_err
+                )
+                await asyncio.to_thread(self._refresh_system_cache)
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_name,
+                    contents=contents,
+                    config=self._configs.get(intent, self._configs["complex"]),
+                )
+            async for chunk in stream:
+                if chunk.text:
+                    pieces.append(chunk.text)
+                    yield chunk.text
         except Exception as e:
-            logger.error(f"Reasoning engine failed: {e}", exc_info=True)
+            logger.error("Reasoning engine streaming failed: %s", e, exc_info=True)
             raise RuntimeError(f"Gemini API error: {e}") from e
 
+        response_text = "".join(pieces).strip()
+        logger.info("Gemini stream complete: %d chars", len(response_text))
+
+        if response_text:
+            if cache_key is not None:
+                self._exact_cache[cache_key] = response_text
+                if len(self._exact_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+                    self._exact_cache.popitem(last=False)
+            if use_memory:
+                self.memory.add(user_content, self._model_content(response_text))
+
     def clear_memory(self) -> None:
         """Clear conversation memory manually."""
         self.memory.clear()
@@ -3,16 +3,25 @@ Response router module for Angira Voice Assistant.
 Routes responses based on query complexity to optimize cost and user experience.
 """
 
+import asyncio
 import logging
-from typing import Literal
+import re
+from typing import AsyncIterator, Literal
 from config.constants import (
     SHORT_ACKNOWLEDGMENT,
     RESPONSE_PRINT_LENGTH_LIMIT,
     MAX_CONCEPTUAL_RESPONSE_LENGTH,
+    STREAM_SENTENCE_MIN_CHARS,
+    STREAM_SENTENCE_MAX_CHARS,
 )
 
 logger = logging.getLogger(__name__)
 
+# Sentence terminators followed by whitespace or end-of-text. Compiled once;
+# conceptual truncation scans with finditer over a bounded region instead of
+# slicing a copy and rfind-ing over it.
+_SENT_END_RE = re.compile(r"[.!?](?=\s|$)")
+
 
 def route_response(
     intent: Literal["simple", "conceptual", "complex"], response_text: str
@@ -43,7 +52,7 @@ def route_response(
             logger.info("Routing to brief acknowledgment (complex query)")
 
     except Exception as e:
-        logger.error(f"Response routing failed: {e}")
+        logger.error("Response routing failed: %s", e)
         raise
 
 
@@ -83,10 +92,112 @@ async def route_response_async(
                 await _speak_acknowledgment_async(audio_handler)
 
     except Exception as e:
-        logger.error(f"Response routing failed: {e}")
+        logger.error("Response routing failed: %s", e)
         raise
 
 
+async def route_response_stream_async(
+    intent: Literal["simple", "conceptual", "complex"],
+    text_chunks: AsyncIterator[str],
+    audio_handler=None,
+) -> str:
+    """
+    Route a streaming response, starting TTS at the first sentence boundary.
+
+    For SIMPLE queries the response is spoken sentence-by-sentence as text
+    chunks arrive, so playback begins after the first complete sentence
+    instead of after the entire completion. CONCEPTUAL and COMPLEX queries
+    keep their existing truncated/acknowledgment behavior once the full
+    text is assembled.
+
+    Args:
+        intent: Query intent classification.
+        text_chunks: Async iterator of response text chunks (e.g. from
+            ReasoningEngine streaming).
+        audio_handler: AudioLiveHandler for TTS playback.
+
+    Returns:
+        str: The full assembled response text.
+    """
+    stream_tts = audio_handler is not None and intent == "simple"
+    sentence_queue: asyncio.Queue = asyncio.Queue()
+
+    async def _speak_sentences() -> None:
+        while True:
+            sentence = await sentence_queue.get()
+            if sentence is None:
+                break
+            try:
+                await audio_handler.speak_text(sentence)
+            except Exception as e:
+                logger.error("Streaming TTS failed for sentence: %s", e)
+
+    speaker_task = asyncio.create_task(_speak_sentences()) if stream_tts else None
+
+    full_text = ""
+    buffer = ""
+    try:
+        async for chunk in text_chunks:
+            full_text += chunk
+            if not stream_tts:
+                continue
+
+            buffer += chunk
+            segment, buffer = _split_sentence_boundary(buffer)
+            while segment:
+                await sentence_queue.put(segment)
+                segment, buffer = _split_sentence_boundary(buffer)
+
+        if stream_tts and buffer.strip():
+            await sentence_queue.put(buffer.strip())
+    finally:
+        if speaker_task:
+            await sentence_queue.put(None)
+            await speaker_task
+
+    # Print the assembled response once complete
+    if full_text:
+        _print_response(full_text)
+
+    # Non-streaming intents reuse the existing routing behavior
+    if audio_handler and not stream_tts and full_text:
+        if intent == "conceptual":
+            await _speak_conceptual_response_async(full_text, audio_handler)
+        elif intent == "complex":
+            await _speak_acknowledgment_async(audio_handler)
+
+    return full_text
+
+
+def _split_sentence_boundary(buffer: str) -> tuple[str, str]:
+    """
+    Split off the leading sentence from a streaming text buffer.
+
+    A segment is emitted when it ends at sentence punctuation - a
+    terminator followed by whitespace or the end of the buffer, so the
+    dot inside a decimal like "3.14159" never splits - past
+    STREAM_SENTENCE_MIN_CHARS, or unconditionally once the buffer exceeds
+    STREAM_SENTENCE_MAX_CHARS.
+
+    Returns:
+        tuple[str, str]: (segment to speak, remaining buffer). The segment
+        is "" when no complete sentence is available yet.
+    """
+    match = _SENT_END_RE.search(buffer, max(STREAM_SENTENCE_MIN_CHARS - 1, 0))
+    if match:
+        end = match.end()
+        return buffer[:end].strip(), buffer[end:]
+
+    if len(buffer) >= STREAM_SENTENCE_MAX_CHARS:
+        # No punctuation in sight - break at the last space to stay speakable
+        split_at = buffer.rfind(" ", STREAM_SENTENCE_MIN_CHARS, STREAM_SENTENCE_MAX_CHARS)
+        if split_at == -1:
+            split_at = STREAM_SENTENCE_MAX_CHARS
+        return buffer[:split_at].strip(), buffer[split_at:]
+
+    return "", buffer
+
+
 def _print_response(response_text: str) -> None:
     """Print response to console."""
     try:
@@ -100,10 +211,10 @@ def _print_response(response_text: str) -> None:
         print(display_text)
         print("=" * 80 + "\n")
 
-        logger.info(f"Printed response ({len(response_text)} chars)")
+        logger.info("Printed response (%d chars)", len(response_text))
 
     except Exception as e:
-        logger.error(f"Failed to print response: {e}")
+        logger.error("Failed to print response: %s", e)
         raise
 
 
@@ -114,7 +225,7 @@ async def _speak_full_response_async(response_text: str, audio_handler) -> None:
         await audio_handler.speak_text(response_text)
         logger.info("Successfully played full speech output")
     except Exception as e:
-        logger.error(f"Failed to speak full response: {e}")
+        logger.error("Failed to speak full response: %s", e)
 
 
 async def _speak_conceptual_response_async(response_text: str, audio_handler) -> None:
@@ -122,22 +233,27 @@ async def _speak_conceptual_response_async(response_text: str, audio_handler) ->
     try:
         logger.info("Speaking short explanation (conceptual query)")
         
-        # Truncate to MAX_CONCEPTUAL_RESPONSE_LENGTH, ending at sentence boundary
+        # Truncate to MAX_CONCEPTUAL_RESPONSE_LENGTH, ending at sentence
+        # boundary. finditer scans the bounded region in place - one slice
+        # for the final result instead of a truncated copy plus rfind.
         if len(response_text) > MAX_CONCEPTUAL_RESPONSE_LENGTH:
-            truncated = response_text[:MAX_CONCEPTUAL_RESPONSE_LENGTH]
-            last_period = truncated.rfind(".")
-            if last_period > MAX_CONCEPTUAL_RESPONSE_LENGTH // 2:
-                short_response = truncated[:last_period + 1]
+            end = 0
+            for m in _SENT_END_RE.finditer(
+                response_text, 0, MAX_CONCEPTUAL_RESPONSE_LENGTH
+            ):
+                end = m.end()
+            if end > MAX_CONCEPTUAL_RESPONSE_LENGTH // 2:
+                short_response = response_text[:end]
             else:
-                short_response = truncated.rstrip() + "..."
+                short_response = response_text[:MAX_CONCEPTUAL_RESPONSE_LENGTH].rstrip() + "..."
         else:
             short_response = response_text
 
-        logger.debug(f"Conceptual TTS length: {len(short_response)} chars")
+        logger.debug("Conceptual TTS length: %d chars", len(short_response))
         await audio_handler.speak_text(short_response)
         logger.info("Successfully played conceptual speech output")
     except Exception as e:
-        logger.error(f"Failed to speak conceptual response: {e}")
+        logger.error("Failed to speak conceptual response: %s", e)
 
 
 async def _speak_acknowledgment_async(audio_handler) -> None:
@@ -147,5 +263,5 @@ async def _speak_acknowledgment_async(audio_handler) -> None:
         await audio_handler.speak_text(SHORT_ACKNOWLEDGMENT)
         logger.info("Successfully played acknowledgment speech")
     except Exception as e:
-        logger.error(f"Failed to speak acknowledgment: {e}")
+        logger.error("Failed to speak acknowledgment: %s", e)
         raise
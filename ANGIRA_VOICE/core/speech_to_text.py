@@ -3,15 +3,15 @@ Speech-to-text module using Gemini Live API.
 Converts user speech to text with real microphone capture.
 """
 
-import asyncio
 import logging
+import os
 from typing import Optional
 
-from google import genai
+import numpy as np
 from google.genai import types
 
-from config.settings import settings
-from config.constants import SAMPLE_RATE, GEMINI_LIVE_MODEL
+from core._genai_client import get_client
+from config.constants import SAMPLE_RATE, GEMINI_LIVE_MODEL, SILENCE_THRESHOLD_I16
 
 logger = logging.getLogger(__name__)
 
@@ -24,11 +24,120 @@ class SpeechToText:
 
     def __init__(self):
         """Initialize SpeechToText with Gemini API credentials."""
-        self.api_key = settings.get_gemini_api_key()
-        self.client = genai.Client(api_key=self.api_key, http_options={"api_version": "v1beta"})
+        self.client = get_client()
         self.model = "gemini-2.0-flash"  # Use standard model for transcription
+        # Built once - the transcription config never varies per request.
+        self._gen_config = types.GenerateContentConfig(
+            automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
+                maximumRemoteCalls=100
+            )
+        )
         logger.info("SpeechToText initialized with Gemini API")
 
+    # Silence-trim parameters: 20 ms analysis blocks, 100 ms of context
+    # kept on each side of the detected speech span
+    _TRIM_BLOCK = 320
+    _TRIM_PAD_BLOCKS = 5
+
+    @classmethod
+    def _trim_silence(cls, audio_bytes: bytes) -> bytes:
+        """Drop leading and trailing silence from raw PCM before upload.
+
+        Capture includes the pre-speech wait and the end-of-speech silence
+        window; the model gains nothing from either, and upload time plus
+        server-side decode scale with length. Per-block energies come from
+        one reshaped einsum over an int16 view - a few numpy kernels,
+        no per-block Python loop. All-silent or already-tight captures are
+        returned unchanged.
+        """
+        samples = np.frombuffer(audio_bytes, dtype=np.int16)
+        n_blocks = samples.size // cls._TRIM_BLOCK
+        if n_blocks < 3:
+            return audio_bytes
+
+        blocks = (
+            samples[: n_blocks * cls._TRIM_BLOCK]
+            .astype(np.int64)
+            .reshape(n_blocks, cls._TRIM_BLOCK)
+        )
+        energy = np.einsum("ij,ij->i", blocks, blocks)
+        threshold = float(SILENCE_THRESHOLD_I16) ** 2 * cls._TRIM_BLOCK
+
+        voiced = np.nonzero(energy > threshold)[0]
+        if voiced.size == 0:
+            # Nothing above threshold - ship as-is and let the API decide
+            return audio_bytes
+
+        first = max(int(voiced[0]) - cls._TRIM_PAD_BLOCKS, 0)
+        last = min(int(voiced[-1]) + 1 + cls._TRIM_PAD_BLOCKS, n_blocks)
+        if first == 0 and last == n_blocks:
+            return audio_bytes
+
+        trimmed = samples[first * cls._TRIM_BLOCK : last * cls._TRIM_BLOCK].tobytes()
+        logger.debug("Trimmed silence: %d -> %d bytes", len(audio_bytes), len(trimmed))
+        return trimmed
+
+    @classmethod
+    def _build_contents(cls, audio_input: bytes) -> list[types.Content]:
+        """
+        Build the transcription request contents from raw audio or a file path.
+
+        Shared by the sync and async paths so both send byte-identical
+        requests.
+
+        Args:
+            audio_input: Raw PCM audio bytes, or a path to an audio file.
+
+        Returns:
+            list[types.Content]: Contents for generate_content.
+
+        Raises:
+            ValueError: If audio input is invalid or the file is missing.
+        """
+        if isinstance(audio_input, str):
+            # Handle file path. Size-check via stat before reading so an
+            # empty or truncated file is rejected without allocating its
+            # contents.
+            logger.info("Transcribing audio from file: %s", audio_input)
+            try:
+                if os.path.getsize(audio_input) < 100:
+                    raise ValueError("Audio input too short or empty")
+                with open(audio_input, "rb") as f:
+                    audio_bytes = f.read()
+            except FileNotFoundError as e:
+                logger.error("Audio file not found: %s", e)
+                raise ValueError(f"Audio file not found: {e}") from e
+        else:
+            audio_bytes = audio_input
+            if not audio_bytes or len(audio_bytes) < 100:
+                raise ValueError("Audio input too short or empty")
+            # Raw PCM only - file inputs may be containers we can't index
+            audio_bytes = cls._trim_silence(audio_bytes)
+
+        logger.info("Transcribing %d bytes of audio...", len(audio_bytes))
+
+        return [
+            types.Content(
+                parts=[
+                    types.Part.from_bytes(
+                        data=audio_bytes,
+                        mime_type=f"audio/pcm;rate={SAMPLE_RATE}"
+                    ),
+                    types.Part.from_text(
+                        text="Transcribe this audio exactly as spoken. "
+                        "Return only the transcription text, nothing else."
+                    )
+                ]
+            )
+        ]
+
+    @staticmethod
+    def _stripped(text: str) -> str:
+        """Trim surrounding whitespace without copying already-clean text."""
+        if text and (text[0].isspace() or text[-1].isspace()):
+            return text.strip()
+        return text
+
     def transcribe(self, audio_input: bytes) -> str:
         """
         Transcribe audio to text using Gemini.
@@ -44,57 +153,28 @@ class SpeechToText:
             Exception: If API call fails.
         """
         try:
-            if isinstance(audio_input, str):
-                # Handle file path
-                logger.info(f"Transcribing audio from file: {audio_input}")
-                with open(audio_input, "rb") as f:
-                    audio_bytes = f.read()
-            else:
-                audio_bytes = audio_input
-
-            if not audio_bytes or len(audio_bytes) < 100:
-                raise ValueError("Audio input too short or empty")
-
-            logger.info(f"Transcribing {len(audio_bytes)} bytes of audio...")
-
             # Use Gemini to transcribe audio
             response = self.client.models.generate_content(
                 model=self.model,
-                contents=[
-                    types.Content(
-                        parts=[
-                            types.Part.from_bytes(
-                                data=audio_bytes,
-                                mime_type=f"audio/pcm;rate={SAMPLE_RATE}"
-                            ),
-                            types.Part.from_text(
-                                text="Transcribe this audio exactly as spoken. "
-                                "Return only the transcription text, nothing else."
-                            )
-                        ]
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
-                        maximumRemoteCalls=100
-                    )
-                )
+                contents=self._build_contents(audio_input),
+                config=self._gen_config,
             )
 
-            transcribed_text = response.text.strip()
-            logger.info(f"Successfully transcribed: {transcribed_text[:50]}...")
+            transcribed_text = self._stripped(response.text)
+            logger.info("Successfully transcribed: %.50s...", transcribed_text)
             return transcribed_text
 
-        except FileNotFoundError as e:
-            logger.error(f"Audio file not found: {e}")
-            raise ValueError(f"Audio file not found: {e}") from e
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             raise
 
     async def transcribe_async(self, audio_input: bytes) -> str:
         """
-        Async version of transcribe.
+        Async version of transcribe using the SDK's native async client.
+
+        Awaits client.aio directly instead of shipping the blocking call to
+        a thread pool - no worker handoff, and the event loop (which is
+        also servicing mic capture) never loses the GIL to a parked thread.
 
         Args:
             audio_input: Raw PCM audio bytes.
@@ -102,7 +182,20 @@ class SpeechToText:
         Returns:
             str: Transcribed text.
         """
-        return await asyncio.to_thread(self.transcribe, audio_input)
+        try:
+            response = await self.client.aio.models.generate_content(
+                model=self.model,
+                contents=self._build_contents(audio_input),
+                config=self._gen_config,
+            )
+
+            transcribed_text = self._stripped(response.text)
+            logger.info("Successfully transcribed: %.50s...", transcribed_text)
+            return transcribed_text
+
+        except Exception as e:
+            logger.error("Transcription failed: %s", e)
+            raise
 
     def transcribe_streaming(self, audio_chunks: list[bytes]) -> str:
         """
@@ -4,24 +4,39 @@ Converts text responses to speech with real audio output.
 """
 
 import asyncio
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
 from typing import Optional
 
 import pyaudio
-from google import genai
 from google.genai import types
 
-from config.settings import settings
+from core._audio import get_pyaudio
+from core._genai_client import get_client
 from config.constants import (
     MAX_SIMPLE_RESPONSE_LENGTH,
     MAX_CONCEPTUAL_RESPONSE_LENGTH,
     OUTPUT_SAMPLE_RATE,
-    AUDIO_CHUNK_SIZE,
     GEMINI_LIVE_MODEL,
 )
 
 logger = logging.getLogger(__name__)
 
+# nest_asyncio is only needed when sync speak() is called from inside a
+# running event loop. Imported once here and applied at most once - apply()
+# rewalks asyncio internals, so doing it per call is pure overhead. Callers
+# in async contexts should prefer speak_async.
+try:
+    import nest_asyncio
+except ImportError:
+    nest_asyncio = None
+
+_NEST_APPLIED = False
+
 
 class TextToSpeech:
     """
@@ -29,20 +44,134 @@ class TextToSpeech:
     Generates and plays speech output through speakers.
     """
 
+    # Speaker callback block size: ~21 ms at 24 kHz, small enough that
+    # underflow padding is inaudible, large enough to keep callback rate low.
+    PLAYBACK_BLOCK_FRAMES = 512
+
+    # Synthesized PCM files kept on disk; stock phrases ("Okay.", short
+    # confirmations) recur constantly, and a local file read beats a Live
+    # API round-trip by the full network-plus-synthesis latency.
+    TTS_CACHE_ENTRIES = 64
+
     def __init__(self):
         """Initialize TextToSpeech with Gemini API credentials."""
-        self.api_key = settings.get_gemini_api_key()
-        self.client = genai.Client(api_key=self.api_key, http_options={"api_version": "v1beta"})
+        self.client = get_client()
         self.model = GEMINI_LIVE_MODEL
-        self.pya = pyaudio.PyAudio()
+        self.pya = get_pyaudio()
         
         # Audio configuration
         self.format = pyaudio.paInt16
         self.channels = 1
         self.sample_rate = OUTPUT_SAMPLE_RATE
-        
+
+        # One long-lived output stream, opened lazily and kept across
+        # utterances: a PortAudio open does device setup and kernel buffer
+        # allocation, which on small hardware can dominate the latency of
+        # a short utterance. The stream runs in callback mode and drains a
+        # lock-guarded ring of PCM chunks, so producers (the asyncio loop
+        # receiving Gemini audio) enqueue without ever blocking in write().
+        self._out_stream: Optional[pyaudio.Stream] = None
+        self._spk_ring: deque = deque()
+        self._spk_lock = threading.Lock()
+        self._spk_leftover = b""
+
+        # Live API connect config is identical for every utterance - build
+        # it (and its nested voice config) once.
+        self._voice = "Charon"  # Options: Puck, Charon, Kore, Fenrir, Aoede
+        self._live_config = types.LiveConnectConfig(
+            response_modalities=["AUDIO"],
+            speech_config=types.SpeechConfig(
+                voice_config=types.VoiceConfig(
+                    prebuilt_voice_config=types.PrebuiltVoiceConfig(
+                        voice_name=self._voice
+                    )
+                )
+            ),
+        )
+
+        # Disk-backed synthesis cache, LRU-indexed in memory. Keys hash the
+        # normalized text plus voice, so a voice change never replays stale
+        # audio. Unusable cache dirs just disable caching.
+        self._cache_dir: Optional[Path] = Path("~/.cache/angira/tts").expanduser()
+        self._cache_index: OrderedDict[str, Path] = OrderedDict()
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            for entry in sorted(
+                self._cache_dir.glob("*.pcm"), key=lambda p: p.stat().st_mtime
+            ):
+                self._cache_index[entry.stem] = entry
+        except OSError as e:
+            logger.warning(f"TTS cache disabled: {e}")
+            self._cache_dir = None
+
+        # One live session reused across utterances. Each connect() is a
+        # TLS handshake plus websocket setup; the TTS workload is
+        # request/response with server turn markers, so consecutive
+        # utterances can share the socket. The owning loop is tracked
+        # because reuse only holds within it - the sync speak() path runs
+        # each call under a fresh asyncio.run loop.
+        self._session = None
+        self._session_cm = None
+        self._session_loop = None
+
         logger.info(f"TextToSpeech initialized with Gemini Live API model: {self.model}")
 
+    def _speaker_callback(self, in_data, frame_count, time_info, status):
+        """Assemble one output block from the ring on PortAudio's thread.
+
+        Pads with silence on underflow so a slow Gemini delivery never
+        stalls the device - it just plays quiet until the next chunk lands.
+        """
+        need = frame_count * 2  # 16-bit mono
+        out = bytearray()
+        chunk = self._spk_leftover
+        with self._spk_lock:
+            while len(out) + len(chunk) < need and self._spk_ring:
+                out += chunk
+                chunk = self._spk_ring.popleft()
+        take = need - len(out)
+        out += chunk[:take]
+        self._spk_leftover = chunk[take:]
+        if len(out) < need:
+            out += b"\x00" * (need - len(out))
+        return (bytes(out), pyaudio.paContinue)
+
+    def _get_output_stream(self) -> pyaudio.Stream:
+        """Return the shared callback-mode speaker stream, opening it on first use."""
+        if self._out_stream is None:
+            self._out_stream = self.pya.open(
+                format=self.format,
+                channels=self.channels,
+                rate=self.sample_rate,
+                output=True,
+                frames_per_buffer=self.PLAYBACK_BLOCK_FRAMES,
+                stream_callback=self._speaker_callback,
+            )
+        return self._out_stream
+
+    def _enqueue_playback(self, pcm: bytes) -> None:
+        """Queue PCM for the speaker callback; never blocks the caller."""
+        with self._spk_lock:
+            self._spk_ring.append(pcm)
+
+    def _playback_pending(self) -> bool:
+        """Whether queued audio remains in the ring."""
+        with self._spk_lock:
+            return bool(self._spk_ring)
+
+    # Seconds per playback block - the natural polling interval while
+    # waiting for the ring to drain.
+    @property
+    def _block_seconds(self) -> float:
+        return self.PLAYBACK_BLOCK_FRAMES / self.sample_rate
+
+    async def _drain_playback(self) -> None:
+        """Wait until queued audio has been handed to the device."""
+        while self._playback_pending() or self._spk_leftover:
+            await asyncio.sleep(self._block_seconds)
+        # One more block so the final buffer actually reaches the speaker
+        await asyncio.sleep(self._block_seconds)
+
     def speak(self, text: str, play_audio: bool = True) -> bytes:
         """
         Convert text to speech using Gemini Live API.
@@ -73,14 +202,95 @@ class TextToSpeech:
         # Handle being called from within an existing event loop
         try:
             loop = asyncio.get_running_loop()
-            # We're in an async context, create a task
-            import nest_asyncio
-            nest_asyncio.apply()
-            return asyncio.run(self._speak_async(text, play_audio))
         except RuntimeError:
             # No running loop, safe to use asyncio.run
             return asyncio.run(self._speak_async(text, play_audio))
 
+        # We're in an async context - re-enter the running loop (needs the
+        # one-time nest_asyncio patch)
+        global _NEST_APPLIED
+        if nest_asyncio is not None and not _NEST_APPLIED:
+            nest_asyncio.apply()
+            _NEST_APPLIED = True
+        return loop.run_until_complete(self._speak_async(text, play_audio))
+
+    async def _ensure_session(self):
+        """Return the shared live session, connecting on first use.
+
+        A cached session is only valid on the event loop that opened it.
+        The sync speak() path spins up a fresh loop per call via
+        asyncio.run, so a session left over from the previous call is
+        bound to a closed loop - reconnect instead of failing the turn.
+        """
+        running = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not running:
+            if self._session_loop is None or self._session_loop.is_closed():
+                # The owning loop is gone and took its transports with it;
+                # there is nothing left to close, just drop the references
+                self._session = None
+                self._session_cm = None
+                self._session_loop = None
+            else:
+                await self._close_session()
+        if self._session is None:
+            self._session_cm = self.client.aio.live.connect(
+                model=self.model,
+                config=self._live_config,
+            )
+            self._session = await self._session_cm.__aenter__()
+            self._session_loop = running
+            logger.info("TTS live session opened")
+        return self._session
+
+    async def _close_session(self) -> None:
+        """Tear down the shared live session (best effort)."""
+        cm, self._session_cm, self._session = self._session_cm, None, None
+        self._session_loop = None
+        if cm is not None:
+            try:
+                await cm.__aexit__(None, None, None)
+            except Exception:
+                pass
+
+    def _cache_key(self, text: str) -> str:
+        """Cache key for an utterance: normalized text plus voice name."""
+        return hashlib.sha256(
+            f"{text.strip().lower()}|{self._voice}".encode()
+        ).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[bytes]:
+        """Return cached PCM for the key, or None."""
+        path = self._cache_index.get(key)
+        if path is None:
+            return None
+        try:
+            data = path.read_bytes()
+        except OSError:
+            # File vanished out from under the index - drop the entry
+            self._cache_index.pop(key, None)
+            return None
+        self._cache_index.move_to_end(key)
+        return data
+
+    def _cache_put(self, key: str, audio_data: bytes) -> None:
+        """Store synthesized PCM on disk, evicting the oldest past the cap."""
+        if self._cache_dir is None or not audio_data:
+            return
+        path = self._cache_dir / f"{key}.pcm"
+        try:
+            path.write_bytes(audio_data)
+        except OSError as e:
+            logger.warning(f"TTS cache write failed: {e}")
+            return
+        self._cache_index[key] = path
+        self._cache_index.move_to_end(key)
+        while len(self._cache_index) > self.TTS_CACHE_ENTRIES:
+            _, evicted = self._cache_index.popitem(last=False)
+            try:
+                evicted.unlink()
+            except OSError:
+                pass
+
     async def _speak_async(self, text: str, play_audio: bool = True) -> bytes:
         """
         Async implementation of speak.
@@ -92,65 +302,59 @@ class TextToSpeech:
         Returns:
             bytes: Audio data.
         """
-        audio_chunks = []
-        
+        # Cache short-circuit: identical utterances replay from disk
+        cache_key = self._cache_key(text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"TTS cache hit ({len(cached)} bytes)")
+            if play_audio:
+                self._get_output_stream()
+                self._enqueue_playback(cached)
+                await self._drain_playback()
+            return cached
+
+        # Amortized-growth accumulator: thousands of small PCM chunks land
+        # in one buffer instead of a list of bytes objects joined at the end.
+        audio_buf = bytearray()
+        audio_buf_extend = audio_buf.extend
+
         try:
-            # Configure Live API for TTS
-            config = types.LiveConnectConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(
-                            voice_name="Charon"  # Options: Puck, Charon, Kore, Fenrir, Aoede
-                        )
-                    )
-                ),
+            output_stream = self._get_output_stream() if play_audio else None
+
+            session = await self._ensure_session()
+
+            # Send text to be spoken
+            await session.send_client_content(
+                turns=[types.Content(parts=[types.Part.from_text(text=text)])],
+                turn_complete=True
             )
-            
-            output_stream = None
-            if play_audio:
-                output_stream = self.pya.open(
-                    format=self.format,
-                    channels=self.channels,
-                    rate=self.sample_rate,
-                    output=True,
-                )
-            
-            try:
-                async with self.client.aio.live.connect(
-                    model=self.model,
-                    config=config
-                ) as session:
-                    # Send text to be spoken
-                    await session.send_client_content(
-                        turns=[types.Content(parts=[types.Part.from_text(text=text)])],
-                        turn_complete=True
-                    )
-                    
-                    # Receive and play audio
-                    async for response in session.receive():
-                        if response.server_content and response.server_content.model_turn:
-                            for part in response.server_content.model_turn.parts:
-                                if part.inline_data and part.inline_data.data:
-                                    chunk = part.inline_data.data
-                                    audio_chunks.append(chunk)
-                                    if play_audio and output_stream:
-                                        output_stream.write(chunk)
-                        
-                        if response.server_content and response.server_content.turn_complete:
-                            break
-                            
-            finally:
-                if output_stream:
-                    output_stream.stop_stream()
-                    output_stream.close()
-                    
-            audio_data = b"".join(audio_chunks)
+
+            # Receive and play audio
+            async for response in session.receive():
+                if response.server_content and response.server_content.model_turn:
+                    for part in response.server_content.model_turn.parts:
+                        if part.inline_data and part.inline_data.data:
+                            chunk = part.inline_data.data
+                            audio_buf_extend(chunk)
+                            if play_audio and output_stream:
+                                self._enqueue_playback(chunk)
+
+                if response.server_content and response.server_content.turn_complete:
+                    break
+
+            if play_audio and output_stream:
+                await self._drain_playback()
+
+            audio_data = bytes(audio_buf)
+            self._cache_put(cache_key, audio_data)
             logger.info(f"Generated speech: {len(audio_data)} bytes")
             return audio_data
-            
+
         except Exception as e:
             logger.error(f"Text-to-speech failed: {e}")
+            # A failed turn leaves the shared session in an unknown state -
+            # drop it so the next utterance reconnects cleanly.
+            await self._close_session()
             raise
 
     async def speak_async(self, text: str, play_audio: bool = True) -> bytes:
@@ -179,18 +383,12 @@ class TextToSpeech:
         Args:
             audio_bytes: PCM audio data to play.
         """
-        stream = self.pya.open(
-            format=self.format,
-            channels=self.channels,
-            rate=self.sample_rate,
-            output=True,
-        )
-        
-        try:
-            stream.write(audio_bytes)
-        finally:
-            stream.stop_stream()
-            stream.close()
+        self._get_output_stream()
+        self._enqueue_playback(audio_bytes)
+        # Synchronous contract: return once the audio has been played out
+        while self._playback_pending() or self._spk_leftover:
+            time.sleep(self._block_seconds)
+        time.sleep(self._block_seconds)
 
     def save_speech(self, audio_bytes: bytes, output_path: str) -> None:
         """
@@ -228,7 +426,22 @@ class TextToSpeech:
 
     def cleanup(self) -> None:
         """Clean up PyAudio resources."""
-        self.pya.terminate()
+        if self._session is not None:
+            try:
+                asyncio.run(self._close_session())
+            except RuntimeError:
+                # Called from within a running loop - the socket dies with
+                # the process anyway.
+                self._session = None
+                self._session_cm = None
+        if self._out_stream is not None:
+            try:
+                self._out_stream.stop_stream()
+                self._out_stream.close()
+            except Exception:
+                pass
+            self._out_stream = None
+        # The shared PyAudio instance is terminated once at interpreter exit
         logger.info("TextToSpeech cleaned up")
 
     def __del__(self):
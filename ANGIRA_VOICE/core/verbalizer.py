@@ -3,6 +3,7 @@ Query verbalizer module for Agnira Voice Assistant.
 Converts mathematical symbols and shorthand to natural language.
 """
 
+import functools
 import logging
 import re
 from typing import Dict
@@ -43,6 +44,44 @@ SHORTHAND_MAP: Dict[str, str] = {
     "w.r.t.": "with respect to",
 }
 
+# Everything below is compiled/built once at import so verbalize_query is
+# a fixed number of single C-level passes rather than one full-string scan
+# per dictionary entry.
+
+# Symbol translation table: str.translate replaces all 16 symbols in one
+# pass. Replacements are padded with spaces (the trailing whitespace
+# collapse absorbs any doubles) so "√x" reads "square root of x".
+_SYMBOL_TABLE = str.maketrans(
+    {symbol: f" {word} " for symbol, word in MATH_SYMBOL_MAP.items()}
+)
+
+# One alternation over all shorthands, longest-first so "w.r.t." wins over
+# "w.r.t" and "eqn" over "eq"; a dict-lookup callback supplies the
+# expansion for whichever alternative matched.
+_SHORTHAND_RE = re.compile(
+    r"\b(?:"
+    + "|".join(map(re.escape, sorted(SHORTHAND_MAP, key=len, reverse=True)))
+    + r")\b",
+    re.IGNORECASE,
+)
+
+# Gate for the symbol-handling passes: one character-class scan that hits
+# iff the query contains any math symbol or superscript notation. Typical
+# English queries have none, so they skip translate plus the three
+# superscript substitutions entirely.
+_SYMBOL_SCAN_RE = re.compile(
+    "[" + "".join(map(re.escape, MATH_SYMBOL_MAP)) + re.escape("^²³") + "]"
+)
+
+_POW_RE = re.compile(r"([a-zA-Z0-9])\^(\d+)")
+_SQUARED_RE = re.compile(r"([a-zA-Z0-9])²")
+_CUBED_RE = re.compile(r"([a-zA-Z0-9])³")
+_WS_RE = re.compile(r"\s+")
+
+
+def _expand_shorthand(match: re.Match) -> str:
+    return SHORTHAND_MAP[match.group(0).lower()]
+
 
 def verbalize_query(text: str) -> str:
     """
@@ -65,32 +104,39 @@ def verbalize_query(text: str) -> str:
         >>> verbalize_query("Calculate ∫ x² dx from 0 to 1")
         "Calculate integral of x squared dx from 0 to 1"
     """
+    # Guard kept outside the cache so bad inputs (None, non-strings)
+    # neither occupy cache slots nor have to be hashable
     if not text or not isinstance(text, str):
         logger.warning("Invalid input to verbalize_query")
         return ""
 
-    verbalized = text
+    return _verbalize_impl(text)
+
+
+@functools.lru_cache(maxsize=2048)
+def _verbalize_impl(text: str) -> str:
+    """Run the transformation passes; memoized since verbalization is pure.
+
+    Repeated utterances resolve to a hash lookup, and the info log below
+    naturally only fires on cache misses.
+    """
+    has_symbols = _SYMBOL_SCAN_RE.search(text) is not None
 
-    # Replace mathematical symbols
-    for symbol, word in MATH_SYMBOL_MAP.items():
-        if symbol in verbalized:
-            verbalized = verbalized.replace(symbol, word)
-            logger.debug(f"Replaced symbol '{symbol}' with '{word}'")
+    # Replace mathematical symbols (all 16 in one translate pass)
+    verbalized = text.translate(_SYMBOL_TABLE) if has_symbols else text
 
-    # Replace shorthand expressions (case-insensitive)
-    for shorthand, expansion in SHORTHAND_MAP.items():
-        pattern = r"\b" + re.escape(shorthand) + r"\b"
-        if re.search(pattern, verbalized, re.IGNORECASE):
-            verbalized = re.sub(pattern, expansion, verbalized, flags=re.IGNORECASE)
-            logger.debug(f"Expanded shorthand '{shorthand}' to '{expansion}'")
+    # Replace shorthand expressions (case-insensitive, one alternation pass)
+    verbalized = _SHORTHAND_RE.sub(_expand_shorthand, verbalized)
 
     # Handle common superscript patterns (x², x³, etc.)
-    verbalized = re.sub(r"([a-zA-Z0-9])\^(\d+)", r"\1 to the power of \2", verbalized)
-    verbalized = re.sub(r"([a-zA-Z0-9])²", r"\1 squared", verbalized)
-    verbalized = re.sub(r"([a-zA-Z0-9])³", r"\1 cubed", verbalized)
+    if has_symbols:
+        verbalized = _POW_RE.sub(r"\1 to the power of \2", verbalized)
+        verbalized = _SQUARED_RE.sub(r"\1 squared", verbalized)
+        verbalized = _CUBED_RE.sub(r"\1 cubed", verbalized)
 
     # Remove multiple spaces
-    verbalized = re.sub(r"\s+", " ", verbalized).strip()
+    verbalized = _WS_RE.sub(" ", verbalized).strip()
 
-    logger.info(f"Verbalized query: '{text}' -> '{verbalized}'")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Verbalized query: '%s' -> '%s'", text, verbalized)
     return verbalized
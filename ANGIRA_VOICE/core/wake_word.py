@@ -4,26 +4,58 @@ Uses microphone input and Gemini for transcription-based detection.
 """
 
 import asyncio
+import hashlib
 import logging
+import math
+import os
+import queue
 import struct
+import threading
+from collections import OrderedDict
 from typing import Optional
 
+import ahocorasick
 import numpy as np
 import pyaudio
-from google import genai
 from google.genai import types
 
-from config.settings import settings
+from core._audio import get_pyaudio
+from core._genai_client import get_client
 from config.constants import (
     WAKE_WORD,
     WAKE_WORD_CONFIDENCE_THRESHOLD,
     SAMPLE_RATE,
-    AUDIO_CHUNK_SIZE,
-    SILENCE_THRESHOLD,
+    AUDIO_CAPTURE_FRAMES,
+    SILENCE_THRESHOLD_I16,
+    WAKE_WORD_MIN_DURATION,
+    WAKE_WORD_MAX_DURATION,
+    WAKE_WORD_VOICED_BAND,
+    WAKE_WORD_VOICED_RATIO,
+    WAKE_WORD_MODEL_PATH,
+    WAKE_WORD_LOCAL_SCORE,
 )
 
+try:
+    from openwakeword.model import Model as _WakeWordModel
+
+    _HAVE_OPENWAKEWORD = True
+except ImportError:  # pragma: no cover - on-device spotter is optional
+    _HAVE_OPENWAKEWORD = False
+
 logger = logging.getLogger(__name__)
 
+# Wake word plus common mishearings, compiled into one Aho-Corasick
+# automaton at import: a single O(len(transcription)) scan replaces one
+# substring search per variant, with identical substring semantics.
+_WAKE_VARIANTS: tuple[str, ...] = (
+    WAKE_WORD.lower(), "angira", "anira", "agira", "anjira",
+)
+_WAKE_AUTOMATON = ahocorasick.Automaton()
+for _variant in _WAKE_VARIANTS:
+    _WAKE_AUTOMATON.add_word(_variant, _variant)
+_WAKE_AUTOMATON.make_automaton()
+del _variant
+
 # Global audio handler for wake word detection
 _audio_handler: Optional["WakeWordDetector"] = None
 
@@ -34,129 +66,463 @@ class WakeWordDetector:
     Uses Gemini for transcription-based wake word detection.
     """
 
+    # Recent transcriptions kept per audio fingerprint; rapid repeated
+    # activations (or a looping noise source) stop paying a Gemini RTT each.
+    TRANSCRIPT_CACHE_ENTRIES = 64
+
+    # G.711 mu-law companding constants (14-bit domain, as in CCITT G.711)
+    ULAW_BIAS = 33
+    ULAW_CLIP = 8158
+
     def __init__(self):
         """Initialize wake word detector."""
-        self.api_key = settings.get_gemini_api_key()
-        self.client = genai.Client(api_key=self.api_key, http_options={"api_version": "v1beta"})
-        self.pya = pyaudio.PyAudio()
+        self.client = get_client()
+        self.pya = get_pyaudio()
         
         # Audio config
         self.format = pyaudio.paInt16
         self.channels = 1
         self.rate = SAMPLE_RATE
-        self.chunk_size = AUDIO_CHUNK_SIZE
+        self.chunk_size = AUDIO_CAPTURE_FRAMES
         
         self._stream: Optional[pyaudio.Stream] = None
-        logger.info("WakeWordDetector initialized")
 
-    def _calculate_rms(self, audio_data: bytes) -> float:
-        """Calculate RMS for silence detection."""
-        try:
-            samples = struct.unpack(f"{len(audio_data)//2}h", audio_data)
-            rms = np.sqrt(np.mean(np.square(np.array(samples, dtype=np.float32))))
-            return rms / 32768.0
-        except Exception:
-            return 0.0
+        # Default-input device index resolved once: PortAudio device
+        # enumeration can probe several PCMs (notably under ALSA), and it
+        # never changes between activations unless the mic is hot-plugged -
+        # refresh_input_device() covers that case.
+        self._input_device_index = self._default_input_index()
 
-    def _pcm_to_wav(self, pcm_data: bytes) -> bytes:
-        """Convert raw PCM data to WAV format by adding a proper header."""
-        sample_rate = self.rate
-        channels = self.channels
-        bits_per_sample = 16
-        
-        byte_rate = sample_rate * channels * bits_per_sample // 8
-        block_align = channels * bits_per_sample // 8
-        data_size = len(pcm_data)
-        
-        # WAV header (44 bytes)
-        header = struct.pack(
+        # LRU of fingerprint -> transcription (see TRANSCRIPT_CACHE_ENTRIES)
+        self._transcript_cache: OrderedDict[str, str] = OrderedDict()
+
+        # On-device wake-word spotter. When present, a wake attempt is a
+        # per-chunk model score instead of capture + upload + transcription,
+        # so wake latency drops from speech + 1.5s silence + network RTT to
+        # a single chunk period. Gemini transcription stays as the fallback.
+        self._wake_model = None
+        if _HAVE_OPENWAKEWORD and os.path.exists(WAKE_WORD_MODEL_PATH):
+            try:
+                self._wake_model = _WakeWordModel(
+                    wakeword_models=[WAKE_WORD_MODEL_PATH]
+                )
+                logger.info(f"On-device wake model loaded: {WAKE_WORD_MODEL_PATH}")
+            except Exception as e:
+                logger.warning(f"Failed to load wake model: {e}")
+
+        # WAV header template built once - format fields never change at
+        # runtime, so per-capture conversion only patches the two length
+        # fields instead of re-packing all fourteen.
+        byte_rate = self.rate * self.channels * 2
+        block_align = self.channels * 2
+        self._wav_header = bytearray(struct.pack(
             '<4sI4s4sIHHIIHH4sI',
             b'RIFF',
-            36 + data_size,  # File size - 8
+            0,   # File size - 8 (patched per capture)
             b'WAVE',
             b'fmt ',
             16,  # Subchunk1 size (16 for PCM)
             1,   # Audio format (1 = PCM)
-            channels,
-            sample_rate,
+            self.channels,
+            self.rate,
             byte_rate,
             block_align,
-            bits_per_sample,
+            16,  # Bits per sample
             b'data',
-            data_size
-        )
-        
-        return header + pcm_data
+            0,   # Data size (patched per capture)
+        ))
+
+        # Second template for the transcription upload: 8 kHz mu-law
+        # (WAVE_FORMAT_MULAW = 7, 8-bit). Wake transcription doesn't need
+        # 16-bit/16 kHz fidelity, and the encoded blob is 4x smaller - the
+        # upload is bandwidth-bound, so wake latency shrinks with it.
+        self._wav_header_ulaw = bytearray(struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF',
+            0,
+            b'WAVE',
+            b'fmt ',
+            16,
+            7,     # WAVE_FORMAT_MULAW
+            self.channels,
+            8000,
+            8000 * self.channels,  # Byte rate (1 byte/sample)
+            self.channels,
+            8,     # Bits per sample
+            b'data',
+            0,
+        ))
+        logger.info("WakeWordDetector initialized")
+
+    @staticmethod
+    def _rms_of(samples: np.ndarray) -> float:
+        """RMS of an int16 sample array.
+
+        The widened dot product fuses square-and-sum in one C kernel
+        without materializing the squared array.
+        """
+        if samples.size == 0:
+            return 0.0
+        s = samples.astype(np.int64)
+        return math.sqrt(float(np.dot(s, s)) / s.size)
+
+    def _calculate_rms(self, audio_data: bytes) -> float:
+        """Calculate RMS for silence detection (int16 sample domain).
+
+        frombuffer gives a zero-copy int16 view (no struct.unpack tuple).
+        """
+        try:
+            return self._rms_of(np.frombuffer(audio_data, dtype=np.int16))
+        except Exception:
+            return 0.0
+
+    def _fast_match(self, audio_data: bytes) -> bool:
+        """
+        Cheap prefilter run before the Gemini transcription round-trip.
+
+        Checks that the capture is plausibly the wake word: duration within
+        the bounds for a three-syllable utterance and enough spectral energy
+        concentrated in the voiced band. A single FFT is orders of magnitude
+        cheaper than a network transcription call.
+
+        Args:
+            audio_data: Raw PCM audio bytes (16-bit mono).
+
+        Returns:
+            bool: True if audio could contain the wake word.
+        """
+        try:
+            duration = len(audio_data) / (self.rate * 2)  # 16-bit = 2 bytes
+            if not (WAKE_WORD_MIN_DURATION <= duration <= WAKE_WORD_MAX_DURATION):
+                logger.debug(f"Fast match rejected: duration {duration:.2f}s out of bounds")
+                return False
+
+            samples = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
+            spectrum = np.abs(np.fft.rfft(samples)) ** 2
+            freqs = np.fft.rfftfreq(len(samples), d=1.0 / self.rate)
+
+            total_energy = np.sum(spectrum)
+            if total_energy <= 0:
+                return False
+
+            low, high = WAKE_WORD_VOICED_BAND
+            voiced_energy = np.sum(spectrum[(freqs >= low) & (freqs <= high)])
+            voiced_ratio = voiced_energy / total_energy
+
+            if voiced_ratio < WAKE_WORD_VOICED_RATIO:
+                logger.debug(f"Fast match rejected: voiced ratio {voiced_ratio:.2f}")
+                return False
+
+            return True
+        except Exception:
+            # Prefilter is an optimization only - never block detection on error
+            return True
+
+    @classmethod
+    def _encode_upload_audio(cls, pcm_data: bytes) -> bytes:
+        """Decimate 16 kHz/16-bit PCM to 8 kHz and mu-law compress it.
+
+        Transcription doesn't need full fidelity - telephone-grade 8 kHz
+        mu-law is the format speech recognizers were raised on. Averaging
+        adjacent sample pairs halves the rate, and the G.711 companding
+        halves the width again, all in vectorized numpy passes. (audioop
+        would do both, but it's deprecated for removal in 3.13; this
+        produces byte-identical mu-law output.)
+        """
+        samples = np.frombuffer(pcm_data, dtype=np.int16)
+        if samples.size & 1:
+            samples = samples[:-1]
+        pairs = samples.astype(np.int32)
+        decimated = (pairs[0::2] + pairs[1::2]) >> 1
+
+        scaled = decimated >> 2  # companding operates on a 14-bit domain
+        mask = np.where(scaled < 0, 0x7F, 0xFF)
+        magnitude = np.where(scaled < 0, -scaled, scaled)
+        magnitude = np.minimum(magnitude, cls.ULAW_CLIP) + cls.ULAW_BIAS
+        segment = np.maximum(np.log2(magnitude).astype(np.int32) - 5, 0)
+        uval = (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+        return ((uval ^ mask) & 0xFF).astype(np.uint8).tobytes()
+
+    def _pcm_to_wav(self, pcm_data: bytes, header: Optional[bytearray] = None) -> bytes:
+        """Wrap raw audio data in a WAV container (PCM header by default)."""
+        if header is None:
+            header = self._wav_header
+        data_size = len(pcm_data)
+        struct.pack_into('<I', header, 4, 36 + data_size)
+        struct.pack_into('<I', header, 40, data_size)
+        return bytes(header) + pcm_data
+
+    def _default_input_index(self) -> int:
+        """Resolve the default input device index via PortAudio."""
+        return int(self.pya.get_default_input_device_info()["index"])
+
+    def refresh_input_device(self) -> None:
+        """Re-resolve the default input device (e.g. after a mic hot-plug)."""
+        self._input_device_index = self._default_input_index()
+        logger.info(f"Input device refreshed: index {self._input_device_index}")
 
-    def _open_stream(self) -> pyaudio.Stream:
-        """Open microphone stream."""
-        mic_info = self.pya.get_default_input_device_info()
+    def _open_stream(self, stream_callback=None) -> pyaudio.Stream:
+        """Open microphone stream (callback mode when a callback is given)."""
         return self.pya.open(
             format=self.format,
             channels=self.channels,
             rate=self.rate,
             input=True,
-            input_device_index=int(mic_info["index"]),
+            input_device_index=self._input_device_index,
             frames_per_buffer=self.chunk_size,
+            stream_callback=stream_callback,
         )
 
+    def _listen_for_wake_word_local(self, timeout: float) -> bool:
+        """Spot the wake word on-device with the openWakeWord model.
+
+        Scores each mic chunk as it arrives - detection costs one model
+        pass per 20 ms chunk and zero network traffic. The callback feeds
+        a bounded queue so scoring runs on this thread, not PortAudio's.
+
+        Args:
+            timeout: Maximum seconds to listen.
+
+        Returns:
+            bool: True if the wake word was spotted, False otherwise.
+        """
+        chunk_queue: queue.Queue = queue.Queue(maxsize=50)
+
+        def _capture_callback(in_data, frame_count, time_info, status):
+            try:
+                chunk_queue.put_nowait(in_data)
+            except queue.Full:
+                pass  # scoring fell behind - dropping is fine for spotting
+            return (None, pyaudio.paContinue)
+
+        stream = self._open_stream(stream_callback=_capture_callback)
+        try:
+            chunks_needed = int(timeout * self.rate / self.chunk_size)
+            for _ in range(chunks_needed):
+                try:
+                    data = chunk_queue.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                scores = self._wake_model.predict(
+                    np.frombuffer(data, dtype=np.int16)
+                )
+                if max(scores.values()) >= WAKE_WORD_LOCAL_SCORE:
+                    logger.info("Wake word spotted on-device")
+                    self._wake_model.reset()
+                    return True
+            return False
+        except Exception as e:
+            logger.warning(f"On-device wake detection failed: {e}")
+            return False
+        finally:
+            stream.stop_stream()
+            stream.close()
+
+    def _capture_utterance(
+        self, timeout: float, abort: Optional[threading.Event] = None
+    ) -> Optional[bytes]:
+        """Capture one speech utterance in PortAudio callback mode.
+
+        The audio thread does the per-chunk RMS gating (a single numpy C
+        kernel) and copies each chunk's zero-copy int16 view into a ring
+        preallocated for the whole timeout, while this thread sleeps on an
+        event until end-of-speech (1.5 s of silence after speech), timeout,
+        or abort. The upload bytes are materialized once from the ring - no
+        growing list of chunks joined (re-copied) at the end.
+
+        Args:
+            timeout: Maximum seconds to listen.
+            abort: Optional event that cancels the capture early.
+
+        Returns:
+            Optional[bytes]: Captured 16-bit PCM, or None if no speech.
+        """
+        capture_done = threading.Event()
+        state = {"has_speech": False, "silence_frames": 0, "frames": 0, "write": 0}
+        max_silence = int(1.5 * self.rate / self.chunk_size)  # 1.5s silence
+        max_frames = int(timeout * self.rate / self.chunk_size)
+        if max_frames <= 0:
+            return None
+
+        ring = np.empty(max_frames * self.chunk_size, dtype=np.int16)
+
+        def _capture_callback(in_data, frame_count, time_info, status):
+            if abort is not None and abort.is_set():
+                capture_done.set()
+                return (None, pyaudio.paComplete)
+
+            chunk = np.frombuffer(in_data, dtype=np.int16)
+            rms = self._rms_of(chunk)
+            keep = False
+
+            if rms > SILENCE_THRESHOLD_I16:
+                state["has_speech"] = True
+                state["silence_frames"] = 0
+                keep = True
+            elif state["has_speech"]:
+                state["silence_frames"] += 1
+                keep = True
+
+            if keep:
+                write = state["write"]
+                end = min(write + chunk.size, ring.size)
+                ring[write:end] = chunk[: end - write]
+                state["write"] = end
+
+            # Stop after 1.5s of silence following speech
+            if state["has_speech"] and state["silence_frames"] >= max_silence:
+                capture_done.set()
+                return (None, pyaudio.paComplete)
+
+            state["frames"] += 1
+            if state["frames"] >= max_frames:
+                capture_done.set()
+                return (None, pyaudio.paComplete)
+            return (None, pyaudio.paContinue)
+
+        stream = self._open_stream(stream_callback=_capture_callback)
+        capture_done.wait(timeout + 1.0)
+
+        stream.stop_stream()
+        stream.close()
+
+        if state["write"] == 0 or (abort is not None and abort.is_set()):
+            return None
+        return ring[: state["write"]].tobytes()
+
     def listen_for_wake_word(self, timeout: float = 10.0) -> bool:
         """
         Listen for the wake word "Angira" in audio stream.
-        
+
+        Prefers the on-device spotter when its model is loaded; otherwise
+        falls back to capture plus Gemini transcription.
+
+        Capture runs in PortAudio callback mode: the audio thread does the
+        per-chunk RMS gating (a single numpy C kernel) and collects frames,
+        while this thread sleeps on an event until end-of-speech or timeout
+        and then ships one blob to transcription. No blocking read loop, no
+        per-chunk Python dispatch from this thread.
+
         Args:
             timeout: Maximum seconds to listen.
-            
+
         Returns:
             bool: True if wake word detected, False otherwise.
         """
         logger.debug(f"Listening for wake word: '{WAKE_WORD}' (timeout: {timeout}s)")
-        
+
+        if self._wake_model is not None:
+            return self._listen_for_wake_word_local(timeout)
+
         try:
-            stream = self._open_stream()
-            audio_chunks = []
-            has_speech = False
-            silence_frames = 0
-            max_silence = int(1.5 * self.rate / self.chunk_size)  # 1.5s silence
-            max_frames = int(timeout * self.rate / self.chunk_size)
-            
-            for frame_count in range(max_frames):
-                try:
-                    data = stream.read(self.chunk_size, exception_on_overflow=False)
-                except Exception as e:
-                    logger.warning(f"Audio read error: {e}")
-                    continue
+            audio_data = self._capture_utterance(timeout)
+            if audio_data is None:
+                logger.debug("No speech detected")
+                return False
+
+            # Cheap spectral fast match gates the expensive transcription call
+            if not self._fast_match(audio_data):
+                logger.debug("Fast match rejected capture - skipping transcription")
+                return False
+
+            logger.debug(f"Captured {len(audio_data)} bytes, transcribing...")
+
+            try:
+                # Fingerprint the capture (strided subsample is enough for
+                # dedupe) and reuse a recent transcription when the same
+                # audio comes around again - a hash over a few hundred KB
+                # instead of a network round-trip.
+                cache_key = hashlib.sha256(audio_data[::8]).hexdigest()
+                transcription = self._transcript_cache.get(cache_key)
+
+                if transcription is not None:
+                    self._transcript_cache.move_to_end(cache_key)
+                    logger.debug(f"Transcript cache hit: '{transcription}'")
+                else:
+                    # Ship 8 kHz mu-law (4x smaller than the raw capture);
+                    # fall back to full PCM if encoding ever fails.
+                    try:
+                        wav_data = self._pcm_to_wav(
+                            self._encode_upload_audio(audio_data),
+                            header=self._wav_header_ulaw,
+                        )
+                    except Exception:
+                        wav_data = self._pcm_to_wav(audio_data)
+
+                    response = self.client.models.generate_content(
+                        model="gemini-2.0-flash",
+                        contents=[
+                            types.Content(
+                                parts=[
+                                    types.Part.from_bytes(
+                                        data=wav_data,
+                                        mime_type="audio/wav"
+                                    ),
+                                    types.Part.from_text(
+                                        text="Transcribe this audio. Return only the transcription."
+                                    )
+                                ]
+                            )
+                        ],
+                        config=types.GenerateContentConfig(
+                            automaticFunctionCalling=types.AutomaticFunctionCallingConfig(
+                                maximumRemoteCalls=100
+                            )
+                        )
+                    )
+
+                    transcription = response.text.strip().lower()
+                    self._transcript_cache[cache_key] = transcription
+                    if len(self._transcript_cache) > self.TRANSCRIPT_CACHE_ENTRIES:
+                        self._transcript_cache.popitem(last=False)
+                    logger.debug(f"Transcription: '{transcription}'")
                 
-                rms = self._calculate_rms(data)
+                # Check for wake word (fuzzy match, one automaton scan)
+                detected = next(_WAKE_AUTOMATON.iter(transcription), None) is not None
                 
-                if rms > SILENCE_THRESHOLD:
-                    has_speech = True
-                    silence_frames = 0
-                    audio_chunks.append(data)
-                elif has_speech:
-                    silence_frames += 1
-                    audio_chunks.append(data)
+                if detected:
+                    logger.info(f"Wake word detected in: '{transcription}'")
+                    return True
                     
-                    # Stop after 1.5s of silence following speech
-                    if silence_frames >= max_silence:
-                        break
-            
-            stream.stop_stream()
-            stream.close()
-            
-            if not audio_chunks:
-                logger.debug("No speech detected")
+            except Exception as e:
+                logger.warning(f"Transcription error: {e}")
                 return False
             
-            # Transcribe and check for wake word
-            audio_data = b"".join(audio_chunks)
-            logger.debug(f"Captured {len(audio_data)} bytes, transcribing...")
+            return False
             
+        except Exception as e:
+            logger.error(f"Wake word detection failed: {e}")
+            return False
+
+    async def _transcribe_and_match(self, audio_data: bytes) -> bool:
+        """Transcribe one capture (non-blocking) and scan for wake variants.
+
+        Async mirror of the transcription branch in listen_for_wake_word:
+        same fast-match gate, transcript cache and automaton scan, but the
+        Gemini call rides client.aio so the event loop keeps running the
+        cover capture while the request is in flight.
+        """
+        if not self._fast_match(audio_data):
+            logger.debug("Fast match rejected capture - skipping transcription")
+            return False
+
+        cache_key = hashlib.sha256(audio_data[::8]).hexdigest()
+        transcription = self._transcript_cache.get(cache_key)
+
+        if transcription is not None:
+            self._transcript_cache.move_to_end(cache_key)
+            logger.debug(f"Transcript cache hit: '{transcription}'")
+        else:
             try:
-                # Convert PCM to WAV format
-                wav_data = self._pcm_to_wav(audio_data)
-                
-                response = self.client.models.generate_content(
+                try:
+                    wav_data = self._pcm_to_wav(
+                        self._encode_upload_audio(audio_data),
+                        header=self._wav_header_ulaw,
+                    )
+                except Exception:
+                    wav_data = self._pcm_to_wav(audio_data)
+
+                response = await self.client.aio.models.generate_content(
                     model="gemini-2.0-flash",
                     contents=[
                         types.Content(
@@ -177,43 +543,93 @@ class WakeWordDetector:
                         )
                     )
                 )
-                
+
                 transcription = response.text.strip().lower()
+                self._transcript_cache[cache_key] = transcription
+                if len(self._transcript_cache) > self.TRANSCRIPT_CACHE_ENTRIES:
+                    self._transcript_cache.popitem(last=False)
                 logger.debug(f"Transcription: '{transcription}'")
-                
-                # Check for wake word (fuzzy match)
-                wake_word_lower = WAKE_WORD.lower()
-                detected = (
-                    wake_word_lower in transcription or
-                    "angira" in transcription or  # Primary wake word
-                    "anira" in transcription or   # Common mishearing
-                    "agira" in transcription or
-                    "anjira" in transcription
-                )
-                
-                if detected:
-                    logger.info(f"Wake word detected in: '{transcription}'")
-                    return True
-                    
             except Exception as e:
                 logger.warning(f"Transcription error: {e}")
                 return False
-            
+
+        detected = next(_WAKE_AUTOMATON.iter(transcription), None) is not None
+        if detected:
+            logger.info(f"Wake word detected in: '{transcription}'")
+        return detected
+
+    async def listen_for_wake_word_async(self, timeout: float = 10.0) -> bool:
+        """Async wake detection that overlaps transcription with capture.
+
+        The sync path leaves the microphone idle for the full transcription
+        round-trip (hundreds of ms). Here, as soon as end-of-speech fires,
+        the transcription request is launched as a task and a cover capture
+        window reopens immediately - the network latency hides behind the
+        user's natural post-wake pause. A positive match aborts the cover
+        capture; a negative one lets its audio feed the next attempt.
+
+        Args:
+            timeout: Maximum seconds to listen overall.
+
+        Returns:
+            bool: True if wake word detected, False otherwise.
+        """
+        if self._wake_model is not None:
+            return await asyncio.to_thread(self._listen_for_wake_word_local, timeout)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        abort = threading.Event()
+        match_task: Optional[asyncio.Task] = None
+        capture_task: Optional[asyncio.Task] = asyncio.create_task(
+            asyncio.to_thread(self._capture_utterance, timeout, abort)
+        )
+
+        try:
+            while capture_task is not None or match_task is not None:
+                pending = {t for t in (capture_task, match_task) if t is not None}
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if match_task in done:
+                    if match_task.result():
+                        return True
+                    match_task = None
+
+                if capture_task in done:
+                    audio_data = capture_task.result()
+                    remaining = deadline - loop.time()
+                    capture_task = None
+                    if remaining > 0:
+                        capture_task = asyncio.create_task(
+                            asyncio.to_thread(
+                                self._capture_utterance, remaining, abort
+                            )
+                        )
+                    # One transcription in flight at a time; a capture that
+                    # lands mid-request is dropped (wake attempts repeat)
+                    if audio_data is not None and match_task is None:
+                        match_task = asyncio.create_task(
+                            self._transcribe_and_match(audio_data)
+                        )
             return False
-            
         except Exception as e:
             logger.error(f"Wake word detection failed: {e}")
             return False
-
-    async def listen_for_wake_word_async(self, timeout: float = 10.0) -> bool:
-        """Async version of listen_for_wake_word."""
-        return await asyncio.to_thread(self.listen_for_wake_word, timeout)
+        finally:
+            abort.set()
+            for task in (capture_task, match_task):
+                if task is not None and not task.done():
+                    try:
+                        await task
+                    except Exception:
+                        pass
 
     def cleanup(self) -> None:
-        """Clean up resources."""
+        """Clean up resources (the shared PyAudio terminates at exit)."""
         if self._stream:
             self._stream.close()
-        self.pya.terminate()
 
 
 def get_detector() -> WakeWordDetector:
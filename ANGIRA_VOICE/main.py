@@ -8,20 +8,45 @@ import asyncio
 import logging
 import sys
 import signal
+from dataclasses import dataclass
 from typing import Optional
 
 from utils.logger import setup_logging, get_logger
 from config.settings import settings
-from core.wake_word import listen_for_wake_word
-from core.audio_live import AudioLiveHandler
-from core.response_router import route_response_async
-from pipelines.agnira_pipeline import AgniraPipeline
+
+# The audio stack (pyaudio/PortAudio, the live-session handler) and the
+# pipeline's model plumbing are deliberately NOT imported here: --demo and
+# --help shouldn't pay for audio-device probing and the heavy transitive
+# imports. Each mode pulls in only what it uses, inside __init__.
+
+# uvloop (optional): drop-in libuv event loop that cuts per-await overhead
+# severalfold - worthwhile for a pipeline awaiting thousands of times a
+# second across mic chunks, WS frames and thread hops. Platforms without
+# it (e.g. Windows) silently keep the default loop. PortAudio callbacks
+# marshal onto the loop via call_soon_threadsafe either way.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
 
 # Setup logging
 setup_logging()
 logger = get_logger(__name__)
 
 
+@dataclass
+class _TurnState:
+    """Per-turn streaming state, reset in place instead of rebuilt each turn."""
+
+    user_text: str = ""
+    response_text: str = ""
+
+    def reset(self) -> None:
+        self.user_text = ""
+        self.response_text = ""
+
+
 class AgniraApp:
     """
     Main Agnira Voice Assistant Application.
@@ -40,9 +65,15 @@ class AgniraApp:
         """
         self.running = True
         self.use_audio = use_audio
+        self._turn = _TurnState()
+
+        from pipelines.agnira_pipeline import AgniraPipeline
+
         self.pipeline = AgniraPipeline()
-        
+
         if use_audio:
+            from core.audio_live import AudioLiveHandler
+
             self.audio_handler = AudioLiveHandler()
             logger.info("Agnira Voice Assistant initialized with REAL AUDIO mode")
         else:
@@ -64,6 +95,24 @@ class AgniraApp:
         
         sys.exit(0)
 
+    # Streaming callbacks defined once as bound methods - the hot audio
+    # loop used to rebuild three closures (and their cells) every turn.
+    def _on_transcription(self, text: str) -> None:
+        self._turn.user_text = text
+        print(f"\r🗣️ You: \"{text}\"", end="", flush=True)
+
+    def _on_response_chunk(self, chunk: str) -> None:
+        first_chunk = not self._turn.response_text
+        self._turn.response_text += chunk
+        # Print response as it streams
+        if first_chunk:
+            print(f"\n\n💬 Angira: {chunk}", end="", flush=True)
+        else:
+            print(chunk, end="", flush=True)
+
+    def _on_interrupted(self) -> None:
+        print("\n\n⚡ [Interrupted by user]", flush=True)
+
     def run(self) -> None:
         """Start the main application loop."""
         if self.use_audio:
@@ -90,37 +139,18 @@ class AgniraApp:
                     print("\n🎤 Listening... Speak your question now!")
                     logger.info("Starting streaming conversation...")
                     
-                    user_text = ""
-                    response_text = ""
-                    was_interrupted = False
-                    
-                    def on_transcription(text: str):
-                        nonlocal user_text
-                        user_text = text
-                        print(f"\r🗣️ You: \"{text}\"", end="", flush=True)
-                    
-                    def on_response_chunk(chunk: str):
-                        nonlocal response_text
-                        response_text += chunk
-                        # Print response as it streams
-                        if len(response_text) == len(chunk):
-                            print(f"\n\n💬 Angira: {chunk}", end="", flush=True)
-                        else:
-                            print(chunk, end="", flush=True)
-                    
-                    def on_interrupted():
-                        print("\n\n⚡ [Interrupted by user]", flush=True)
-                    
+                    self._turn.reset()
+
                     # Use streaming conversation for ultra-low latency
                     user_text, response_text, was_interrupted = await self.audio_handler.stream_conversation(
-                        on_transcription=on_transcription,
-                        on_response_text=on_response_chunk,
-                        on_interrupted=on_interrupted,
+                        on_transcription=self._on_transcription,
+                        on_response_text=self._on_response_chunk,
+                        on_interrupted=self._on_interrupted,
                     )
                     
                     if was_interrupted:
                         print("\n[Response was interrupted - ready for your next question]")
-                        logger.info(f"Conversation interrupted - partial response: {len(response_text)} chars")
+                        logger.info("Conversation interrupted - partial response: %d chars", len(response_text))
                     elif user_text and response_text:
                         print("\n")  # New line after streaming output
                         print("\n" + "=" * 80)
@@ -128,7 +158,7 @@ class AgniraApp:
                         print("=" * 80)
                         print(response_text)
                         print("=" * 80)
-                        logger.info(f"Conversation complete - User: '{user_text[:50]}', Response: {len(response_text)} chars")
+                        logger.info("Conversation complete - User: '%.50s', Response: %d chars", user_text, len(response_text))
                     elif not user_text:
                         print("\n❌ No speech detected. Please try again.")
                     
@@ -136,13 +166,27 @@ class AgniraApp:
                     
                 except KeyboardInterrupt:
                     break
+                except asyncio.TimeoutError:
+                    # A turn that times out is routine - go straight back
+                    # to listening without the cost of an error record
+                    logger.warning("Conversation turn timed out")
+                    continue
+                except OSError as e:
+                    # PortAudio surfaces device trouble as OSError; the
+                    # handler reopens its streams on the next turn
+                    logger.error("Audio device error: %r", e)
+                    print(f"\nAudio device error: {e}")
+                    continue
                 except Exception as e:
-                    logger.error(f"Error in streaming loop: {e}", exc_info=True)
+                    # Per-turn recovery path: repr only. Walking and
+                    # formatting the frame chain (exc_info) is reserved
+                    # for the fatal handler below.
+                    logger.error("Error in streaming loop: %r", e)
                     print(f"\nError: {e}")
                     continue
 
         except Exception as e:
-            logger.critical(f"Fatal error: {e}", exc_info=True)
+            logger.critical("Fatal error: %s", e, exc_info=True)
             sys.exit(1)
         finally:
             self._cleanup()
@@ -172,7 +216,7 @@ class AgniraApp:
                     if not user_input:
                         continue
 
-                    logger.info(f"Processing: {user_input}")
+                    logger.info("Processing: %.100s", user_input)
                     result = self.pipeline.process_text(user_input)
 
                     if result:
@@ -187,12 +231,12 @@ class AgniraApp:
                 except EOFError:
                     break
                 except Exception as e:
-                    logger.error(f"Error: {e}")
+                    logger.error("Error: %r", e)
                     print(f"Error: {e}")
                     continue
 
         except Exception as e:
-            logger.error(f"Demo mode failed: {e}", exc_info=True)
+            logger.error("Demo mode failed: %s", e, exc_info=True)
             raise
         finally:
             self._cleanup()
@@ -205,7 +249,7 @@ class AgniraApp:
                 self.audio_handler.cleanup()
             print("\nAgnira Voice Assistant terminated.")
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
 
 
 def main() -> None:
@@ -244,13 +288,13 @@ def main() -> None:
         app.run()
 
     except ValueError as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         print(f"Configuration error: {e}")
         print("Please ensure .env file has GEMINI_API_KEY set")
         sys.exit(1)
 
     except Exception as e:
-        logger.critical(f"Unexpected error: {e}", exc_info=True)
+        logger.critical("Unexpected error: %s", e, exc_info=True)
         print(f"Startup error: {e}")
         sys.exit(1)
 
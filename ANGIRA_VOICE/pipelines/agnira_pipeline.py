@@ -4,10 +4,12 @@ Orchestrates the complete flow: STT → Verbalization → Intent Classification
 """
 
 import logging
+import threading
 from typing import Optional, Tuple
 from core.speech_to_text import SpeechToText
 from core.verbalizer import verbalize_query
 from core.intent_classifier import classify_intent
+from core.arithmetic import evaluate_arithmetic
 from core.reasoning_engine import ReasoningEngine
 from core.response_router import route_response
 from models.intent_rules import ProcessedQuery
@@ -31,8 +33,86 @@ class AgniraPipeline:
         """Initialize pipeline components."""
         self.stt = SpeechToText()
         self.reasoning_engine = ReasoningEngine()
+
+        # Warm the pure-CPU stages off the critical path so the first real
+        # utterance doesn't pay first-call costs (regex compilation state,
+        # cache plumbing, classifier automaton). The query is arithmetic
+        # the local evaluator answers, so warmup never touches the network.
+        threading.Thread(
+            target=self._process_verbalized,
+            args=(verbalize_query("2 plus 2"), "2 plus 2"),
+            daemon=True,
+            name="pipeline-warmup",
+        ).start()
         logger.info("AgniraPipeline initialized")
 
+    def _process_verbalized(self, verbalized_text: str, original: str) -> ProcessedQuery:
+        """
+        Shared post-verbalization core: classify → answer → package.
+
+        Both sync entry points funnel through here so classification,
+        the local arithmetic fast-path, and result packaging exist once.
+
+        Args:
+            verbalized_text (str): Query after verbalize_query.
+            original (str): The raw user text for the ProcessedQuery.
+
+        Returns:
+            ProcessedQuery: Completed query with intent and response.
+        """
+        intent = classify_intent(verbalized_text)
+        logger.info("Intent classified as: %s", intent)
+
+        # Simple arithmetic is deterministic - answer it locally and skip
+        # the LLM round trip.
+        response = (
+            evaluate_arithmetic(verbalized_text) if intent == "simple" else None
+        )
+        if response is not None:
+            logger.info("Answered arithmetic locally: %s", response)
+        else:
+            response = self.reasoning_engine.solve(verbalized_text, intent=intent)
+            logger.info("Received response (%d chars)", len(response))
+
+        return ProcessedQuery(
+            original=original,
+            verbalized=verbalized_text,
+            intent=intent,
+            confidence=1.0,
+            response=response,
+        )
+
+    async def _process_verbalized_async(
+        self, verbalized_text: str, original: str
+    ) -> ProcessedQuery:
+        """
+        Async twin of _process_verbalized, awaiting solve_async.
+
+        Mirrored rather than shared because the reasoning call is the one
+        stage that differs (sync client vs aio transport).
+        """
+        intent = classify_intent(verbalized_text)
+        logger.info("Intent classified as: %s", intent)
+
+        response = (
+            evaluate_arithmetic(verbalized_text) if intent == "simple" else None
+        )
+        if response is not None:
+            logger.info("Answered arithmetic locally: %s", response)
+        else:
+            response = await self.reasoning_engine.solve_async(
+                verbalized_text, intent=intent
+            )
+            logger.info("Received response (%d chars)", len(response))
+
+        return ProcessedQuery(
+            original=original,
+            verbalized=verbalized_text,
+            intent=intent,
+            confidence=1.0,
+            response=response,
+        )
+
     def process_audio(self, audio_input: bytes) -> Optional[ProcessedQuery]:
         """
         Process audio through the complete pipeline.
@@ -55,37 +135,68 @@ class AgniraPipeline:
                 logger.warning("STT returned empty result")
                 return None
 
-            logger.info(f"Transcribed: '{transcribed_text}'")
+            logger.info("Transcribed: '%s'", transcribed_text)
 
-            # Step 2: Verbalize query
-            logger.debug("Step 2: Verbalizing query...")
+            # Steps 2-4: verbalize, classify, answer (response routing
+            # done by caller)
             verbalized_text = verbalize_query(transcribed_text)
-            logger.info(f"Verbalized: '{verbalized_text}'")
+            logger.info("Verbalized: '%s'", verbalized_text)
 
-            # Step 3: Classify intent
-            logger.debug("Step 3: Classifying intent...")
-            intent = classify_intent(verbalized_text)
-            logger.info(f"Intent classified as: {intent}")
+            processed_query = self._process_verbalized(
+                verbalized_text, transcribed_text
+            )
 
-            # Step 4: Get reasoning response
-            logger.debug("Step 4: Sending to reasoning engine...")
-            response = self.reasoning_engine.solve(verbalized_text, intent=intent)
-            logger.info(f"Received response ({len(response)} chars)")
-
-            # Create processed query result (response routing done by caller)
-            processed_query = ProcessedQuery(
-                original=transcribed_text,
-                verbalized=verbalized_text,
-                intent=intent,
-                confidence=1.0,
-                response=response,
+            logger.info("Audio processing pipeline completed successfully")
+            return processed_query
+
+        except Exception as e:
+            # repr only - traceback formatting walks the whole frame chain
+            # and is reserved for the top-level fatal handler in main()
+            logger.error("Pipeline processing failed: %r", e)
+            return None
+
+    async def process_audio_async(self, audio_input: bytes) -> Optional[ProcessedQuery]:
+        """
+        Async version of process_audio.
+
+        STT and reasoning ride the client's aio transport, so the event
+        loop stays free during both network calls - a caller can overlap
+        this pipeline with TTS playback of the previous turn or the next
+        capture. Verbalization and classification are microseconds of CPU
+        and run inline.
+
+        Args:
+            audio_input (bytes): Raw audio bytes or file path.
+
+        Returns:
+            Optional[ProcessedQuery]: Processed query with all transformations,
+                                      or None if processing fails.
+        """
+        try:
+            logger.info("Starting audio processing pipeline (async)")
+
+            transcribed_text = await self.stt.transcribe_async(audio_input)
+
+            if not transcribed_text:
+                logger.warning("STT returned empty result")
+                return None
+
+            logger.info("Transcribed: '%s'", transcribed_text)
+
+            verbalized_text = verbalize_query(transcribed_text)
+            logger.info("Verbalized: '%s'", verbalized_text)
+
+            processed_query = await self._process_verbalized_async(
+                verbalized_text, transcribed_text
             )
 
             logger.info("Audio processing pipeline completed successfully")
             return processed_query
 
         except Exception as e:
-            logger.error(f"Pipeline processing failed: {e}", exc_info=True)
+            # repr only - traceback formatting walks the whole frame chain
+            # and is reserved for the top-level fatal handler in main()
+            logger.error("Pipeline processing failed: %r", e)
             return None
 
     def process_text(self, text: str) -> Optional[ProcessedQuery]:
@@ -102,41 +213,26 @@ class AgniraPipeline:
                                       or None if processing fails.
         """
         try:
-            logger.info(f"Starting text processing pipeline: '{text}'")
+            logger.info("Starting text processing pipeline: '%.100s'", text)
 
             if not text:
                 logger.warning("Empty text input")
                 return None
 
-            # Step 1: Verbalize query
-            logger.debug("Step 1: Verbalizing query...")
+            # Verbalize, then run the shared core (response routing done
+            # by caller)
             verbalized_text = verbalize_query(text)
-            logger.info(f"Verbalized: '{verbalized_text}'")
+            logger.info("Verbalized: '%s'", verbalized_text)
 
-            # Step 2: Classify intent
-            logger.debug("Step 2: Classifying intent...")
-            intent = classify_intent(verbalized_text)
-            logger.info(f"Intent classified as: {intent}")
-
-            # Step 3: Get reasoning response
-            logger.debug("Step 3: Sending to reasoning engine...")
-            response = self.reasoning_engine.solve(verbalized_text, intent=intent)
-            logger.info(f"Received response ({len(response)} chars)")
-
-            # Create processed query result (response routing done by caller)
-            processed_query = ProcessedQuery(
-                original=text,
-                verbalized=verbalized_text,
-                intent=intent,
-                confidence=1.0,
-                response=response,
-            )
+            processed_query = self._process_verbalized(verbalized_text, text)
 
             logger.info("Text processing pipeline completed successfully")
             return processed_query
 
         except Exception as e:
-            logger.error(f"Pipeline processing failed: {e}", exc_info=True)
+            # repr only - traceback formatting walks the whole frame chain
+            # and is reserved for the top-level fatal handler in main()
+            logger.error("Pipeline processing failed: %r", e)
             return None
 
     def get_pipeline_info(self) -> dict:
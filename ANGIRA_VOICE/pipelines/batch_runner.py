@@ -0,0 +1,79 @@
+"""
+Batch runner for Agnira Voice Assistant.
+Processes many audio files in parallel with one pipeline per worker process.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from models.intent_rules import ProcessedQuery
+
+logger = logging.getLogger(__name__)
+
+# Dispatch granularity for executor.map: large enough to amortize IPC
+# per task, small enough that a slow file doesn't strand a whole worker's
+# queue behind it.
+_CHUNKSIZE = 4
+
+# One pipeline per worker process, built by the pool initializer so the
+# client setup and warmup are paid once per worker instead of once per
+# file. Module-level because it must survive across tasks in the child.
+_pipeline = None
+
+
+def _init_pipeline() -> None:
+    """Pool initializer: build this worker's pipeline instance."""
+    global _pipeline
+    # Imported here, not at module top: the parent process that builds the
+    # pool never needs the pipeline (or its transitive model imports).
+    from pipelines.agnira_pipeline import AgniraPipeline
+
+    _pipeline = AgniraPipeline()
+
+
+def _process_one(audio_path: str) -> Tuple[str, Optional[ProcessedQuery]]:
+    """Run one audio file through this worker's pipeline."""
+    return audio_path, _pipeline.process_audio(audio_path)
+
+
+def run_batch(
+    audio_paths: Iterable[str], n_workers: int = 2
+) -> List[Tuple[str, Optional[ProcessedQuery]]]:
+    """
+    Process a batch of audio files across worker processes.
+
+    Each worker instantiates AgniraPipeline once (client setup amortized
+    over its share of the batch) and files are dispatched round-robin in
+    small chunks, so throughput scales with worker count until the STT
+    backend saturates. A file that fails yields None in its result slot,
+    mirroring process_audio's own error contract; it never aborts the
+    batch.
+
+    Args:
+        audio_paths: Paths to audio files to transcribe and answer.
+        n_workers: Number of worker processes.
+
+    Returns:
+        List[Tuple[str, Optional[ProcessedQuery]]]: (path, result) pairs
+            in input order; result is None for files that failed.
+
+    Example:
+        >>> run_batch(["q1.wav", "q2.wav", "q3.wav"], n_workers=2)
+        [("q1.wav", ProcessedQuery(...)), ...]
+    """
+    paths = list(audio_paths)
+    if not paths:
+        return []
+
+    n_workers = max(1, min(n_workers, len(paths)))
+    logger.info("Running batch of %d files on %d workers", len(paths), n_workers)
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_pipeline
+    ) as executor:
+        results = list(executor.map(_process_one, paths, chunksize=_CHUNKSIZE))
+
+    failed = sum(1 for _, result in results if result is None)
+    logger.info("Batch complete: %d ok, %d failed", len(results) - failed, failed)
+    return results
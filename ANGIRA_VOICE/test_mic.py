@@ -1,6 +1,8 @@
 """Test microphone input levels."""
+import threading
+from collections import deque
+
 import pyaudio
-import struct
 import numpy as np
 
 p = pyaudio.PyAudio()
@@ -20,26 +22,60 @@ default = p.get_default_input_device_info()
 print(f"\nUsing: {default['name']} (index {default['index']})")
 print("=" * 50)
 
+# Callback capture: PortAudio's audio thread pushes 256-frame chunks
+# (16 ms at 16 kHz) into a bounded deque, so capture never blocks on the
+# printing below - a blocking s.read() on the main thread stalls the
+# device whenever the terminal is slow, causing overruns.
+ring = deque(maxlen=64)  # single-producer/single-consumer, drops oldest
+frames_ready = threading.Event()
+
+
+def _capture_callback(in_data, frame_count, time_info, status):
+    ring.append(in_data)
+    frames_ready.set()
+    return (None, pyaudio.paContinue)
+
+
 s = p.open(
-    format=pyaudio.paInt16, 
-    channels=1, 
-    rate=16000, 
-    input=True, 
-    frames_per_buffer=1024
+    format=pyaudio.paInt16,
+    channels=1,
+    rate=16000,
+    input=True,
+    frames_per_buffer=256,
+    stream_callback=_capture_callback,
 )
 
 print("\n🎤 SPEAK NOW for 3 seconds!")
 print("-" * 50)
 
 max_level = 0
-for i in range(30):
-    data = s.read(1024, exception_on_overflow=False)
-    samples = struct.unpack(f"{len(data)//2}h", data)
-    rms = np.sqrt(np.mean(np.square(np.array(samples, dtype=np.float32)))) / 32768
+sq = np.empty(1024, dtype=np.float32)  # reused squared-sample scratch
+pending = []
+pending_samples = 0
+lines = 0
+while lines < 30:
+    if not ring:
+        frames_ready.clear()
+        frames_ready.wait(1.0)
+        continue
+    pending.append(ring.popleft())
+    pending_samples += len(pending[-1]) // 2
+    if pending_samples < 1024:  # aggregate 4 chunks per meter line
+        continue
+    # Zero-copy int16 view of the frames, squared into the scratch buffer -
+    # no per-frame struct.unpack tuple or fresh temporaries
+    samples = np.frombuffer(b"".join(pending), dtype=np.int16).astype(np.float32)
+    pending.clear()
+    pending_samples = 0
+    out = sq[:samples.size]
+    np.multiply(samples, samples, out=out)
+    rms = float(np.sqrt(out.mean())) / 32768
     max_level = max(max_level, rms)
     bar = "█" * int(rms * 500)
     print(f"Level: {rms:.6f} {bar}")
+    lines += 1
 
+s.stop_stream()
 s.close()
 p.terminate()
 
@@ -0,0 +1,78 @@
+"""
+Tests for the local arithmetic evaluator.
+Validates the fast-path that answers simple arithmetic without the LLM.
+"""
+
+import unittest
+from core.arithmetic import evaluate_arithmetic
+
+
+class TestEvaluateArithmetic(unittest.TestCase):
+    """Test cases for local arithmetic evaluation."""
+
+    def test_symbolic_expressions(self) -> None:
+        """Test evaluation of plain symbolic arithmetic."""
+        test_cases = [
+            ("2 + 2", "4"),
+            ("100 / 5", "20"),
+            ("7 - 10", "-3"),
+            ("(2 + 3) * 4", "20"),
+            ("1 / 4", "0.25"),
+        ]
+
+        for query, expected in test_cases:
+            with self.subTest(query=query):
+                self.assertEqual(evaluate_arithmetic(query), expected)
+
+    def test_spoken_operators(self) -> None:
+        """Test normalization of spelled-out operators from STT."""
+        test_cases = [
+            ("What is 2 plus 2?", "4"),
+            ("Calculate 15 times 3", "45"),
+            ("How much is 100 divided by 5?", "20"),
+            ("What is 10 minus 4", "6"),
+            ("3 squared", "9"),
+            ("2 to the power of 10", "1024"),
+            ("what is 2 x 8", "16"),
+        ]
+
+        for query, expected in test_cases:
+            with self.subTest(query=query):
+                self.assertEqual(evaluate_arithmetic(query), expected)
+
+    def test_non_arithmetic_returns_none(self) -> None:
+        """Test that non-arithmetic queries fall through to the engine."""
+        queries = [
+            "what is entropy",
+            "tell me a joke",
+            "solve x plus 2 equals 5",
+            "what time is it",
+        ]
+
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertIsNone(evaluate_arithmetic(query))
+
+    def test_unsafe_or_invalid_returns_none(self) -> None:
+        """Test that malformed or dangerous inputs are rejected."""
+        queries = [
+            "2 +",
+            "1 / 0",
+            "__import__('os')",
+            "9 to the power of 999999",
+            "",
+            None,
+        ]
+
+        for query in queries:
+            with self.subTest(query=query):
+                self.assertIsNone(evaluate_arithmetic(query))  # type: ignore
+
+    def test_result_formatting(self) -> None:
+        """Test that whole-number float results read as integers."""
+        self.assertEqual(evaluate_arithmetic("10 / 2"), "5")
+        self.assertEqual(evaluate_arithmetic("10 / 4"), "2.5")
+
+
+if __name__ == "__main__":
+    unittest.main()
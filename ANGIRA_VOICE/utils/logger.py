@@ -3,10 +3,14 @@ Logging configuration for Agnira Voice Assistant.
 Provides centralized logging setup and utilities.
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
+from typing import Optional
+
 from config.settings import settings
 
 # Create logs directory if it doesn't exist
@@ -18,6 +22,9 @@ if not os.path.exists(LOG_DIR):
 LOG_FILE = os.path.join(LOG_DIR, f"agnira_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
 ERROR_LOG_FILE = os.path.join(LOG_DIR, "agnira_errors.log")
 
+# Background listener that owns the slow handlers (see setup_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
 
 def setup_logging() -> logging.Logger:
     """
@@ -29,16 +36,33 @@ def setup_logging() -> logging.Logger:
     - Error file handler with ERROR level
     - Custom formatter with timestamp and level
 
+    All three handlers run behind a QueueHandler/QueueListener pair: a
+    log call on the audio path costs one queue.put instead of three
+    synchronous write/flush round-trips, and the actual I/O happens on
+    the listener's own thread.
+
     Returns:
         logging.Logger: Configured root logger.
     """
+    global _listener
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)
 
-    # Remove any existing handlers
+    # Remove any existing handlers (and stop a previous listener)
+    if _listener is not None:
+        atexit.unregister(_listener.stop)
+        _listener.stop()
+        _listener = None
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
 
+    # Records don't use thread/process fields in the format string - skip
+    # the per-record getpid()/current_thread lookups.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Create formatter
     formatter = logging.Formatter(
         fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -49,7 +73,6 @@ def setup_logging() -> logging.Logger:
     console_handler = logging.StreamHandler()
     console_handler.setLevel(getattr(logging, settings.LOG_LEVEL))
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
 
     # File handler (all levels)
     file_handler = logging.handlers.RotatingFileHandler(
@@ -57,13 +80,25 @@ def setup_logging() -> logging.Logger:
     )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
 
     # Error file handler (errors only)
     error_handler = logging.FileHandler(ERROR_LOG_FILE)
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(formatter)
-    root_logger.addHandler(error_handler)
+
+    # The root logger only gets the queue front-end; the listener thread
+    # drains it through the real handlers (respecting their levels).
+    log_queue: queue.Queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
 
     root_logger.info(
         f"Logging initialized - Level: {settings.LOG_LEVEL}, "
@@ -2,14 +2,132 @@
 Mathematical utilities for expression parsing and normalization.
 """
 
+import ast
+import functools
 import logging
+import math
+import operator
 import re
-from typing import List, Tuple
+from types import MappingProxyType
+from typing import List, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# google-re2 (optional): linear-time DFA engine. The extraction pattern
+# is plain-regular (no backreferences or lookaround), so RE2 accepts it
+# unchanged and guarantees O(n) matching on text we don't control -
+# stdlib re is a backtracking engine whose worst case degrades on
+# adversarial input. Environments without the wheel silently keep re.
+try:
+    import re2 as _re2_engine
+except ImportError:
+    _re2_engine = None
 
-def extract_math_expressions(text: str) -> List[str]:
+# Patterns compiled once at import: per-call re.findall/re.sub with string
+# literals goes through re's internal cache lookup every time (and
+# re-parses on eviction).
+
+# The four expression shapes fused into one alternation so extraction
+# walks the text once instead of four times. Branch order matters only
+# where shapes could overlap at the same position; each match consumes
+# its span, so nested shapes (e.g. arithmetic inside a function call)
+# yield the outer match.
+_MATH_EXPR_RE = (_re2_engine or re).compile(
+    r"(?:\d+\s*[\+\-\*/]\s*\d+)"  # Simple arithmetic
+    r"|(?:[a-zA-Z]+\s*\(\s*[^)]+\s*\))"  # Function calls
+    r"|(?:∫.*?dx)"  # Integrals
+    r"|(?:√\d+)"  # Square roots
+)
+
+# Prescreen for extraction: every expression shape needs at least one of
+# these anchor characters, and most utterances have none. One
+# character-class scan decides whether the alternation runs at all.
+_MATH_ANCHOR_RE = re.compile(r"[0-9+\-*/∫√(]")
+
+# Allowed functions in evaluation, built once - this dict used to be
+# reconstructed (nine attribute lookups included) on every call. The
+# read-only proxy keeps an evaluated expression from mutating the
+# whitelist shared by every later call.
+_SAFE_DICT = MappingProxyType({
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "sqrt": math.sqrt,
+    "log": math.log,
+    "ln": math.log,
+    "exp": math.exp,
+    "pi": math.pi,
+    "e": math.e,
+})
+
+# AST operator whitelist for evaluation: anything not listed here
+# (attributes, subscripts, comprehensions, lambdas) is rejected by the
+# walker below, so no expression can reach machinery outside _SAFE_DICT.
+_BINOPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+    ast.Mod: operator.mod,
+}
+_UNARYOPS = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_math(expr: str) -> ast.Expression:
+    """Parse an expression to its AST; memoized per string.
+
+    Parsing dominates evaluation for expressions this small, so repeats
+    skip straight to the walk.
+    """
+    return ast.parse(expr, mode="eval")
+
+
+def _evaluate_ast(node: ast.expr) -> float:
+    """Evaluate one whitelisted AST node; raise ValueError on anything else."""
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        return _BINOPS[type(node.op)](
+            _evaluate_ast(node.left), _evaluate_ast(node.right)
+        )
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARYOPS:
+        return _UNARYOPS[type(node.op)](_evaluate_ast(node.operand))
+    if isinstance(node, ast.Name):
+        try:
+            value = _SAFE_DICT[node.id]
+        except KeyError:
+            raise ValueError(f"Unknown name: {node.id}") from None
+        if callable(value):
+            raise ValueError(f"Function used as a value: {node.id}")
+        return value
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name) or node.keywords:
+            raise ValueError("Unsupported function call")
+        func = _SAFE_DICT.get(node.func.id)
+        if not callable(func):
+            raise ValueError(f"Unknown function: {node.func.id}")
+        return func(*[_evaluate_ast(arg) for arg in node.args])
+    raise ValueError(f"Unsupported expression node: {type(node).__name__}")
+
+# Probe for normalization work: hits iff the string contains an operator
+# synonym, a whitespace run, edge whitespace, or any whitespace character
+# other than a plain space - exactly the cases where normalization
+# changes the string. [^\S ] is "whitespace that isn't a space".
+_NEEDS_NORM_RE = re.compile(r"[×÷]|\s\s|^\s|\s$|[^\S ]")
+
+# Operator-synonym table: one translate pass replaces the chained
+# str.replace calls (each of which scans the whole string and allocates
+# its own intermediate). New synonyms (−, ⋅, ∗) are one entry, not
+# another pass.
+_OP_TABLE = str.maketrans({"×": "*", "÷": "/"})
+
+
+def extract_math_expressions(text: str) -> Tuple[str, ...]:
     """
     Extract mathematical expressions from text.
 
@@ -17,28 +135,55 @@ def extract_math_expressions(text: str) -> List[str]:
         text (str): Text containing mathematical expressions.
 
     Returns:
-        List[str]: List of detected mathematical expressions.
+        Tuple[str, ...]: Detected mathematical expressions, in order of
+            appearance in the text. A tuple rather than a list so results
+            are immutable and safe to memoize.
     """
-    try:
-        # Match common mathematical patterns
-        patterns = [
-            r"\d+\s*[\+\-\*/]\s*\d+",  # Simple arithmetic
-            r"[a-zA-Z]+\s*\(\s*[^)]+\s*\)",  # Function calls
-            r"∫.*?dx",  # Integrals
-            r"√\d+",  # Square roots
-        ]
-
-        expressions = []
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            expressions.extend(matches)
-
-        logger.debug(f"Extracted {len(expressions)} mathematical expressions")
-        return expressions
-
-    except Exception as e:
-        logger.error(f"Expression extraction failed: {e}")
-        raise
+    # Guard kept outside the cache so bad inputs neither occupy cache
+    # slots nor have to be hashable
+    if not isinstance(text, str):
+        raise TypeError("extract_math_expressions expects a string")
+
+    # Mathless text (most utterances) bails on one anchor-character scan
+    # without touching the extraction pattern or occupying a cache slot
+    if _MATH_ANCHOR_RE.search(text) is None:
+        return ()
+
+    return _extract_impl(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_impl(text: str) -> Tuple[str, ...]:
+    """Run the extraction pass; memoized since extraction is pure.
+
+    Voice input repeats short phrases constantly (retries, echoes, the
+    same intents), so repeats resolve to a hash lookup.
+    """
+    expressions = tuple(_MATH_EXPR_RE.findall(text))
+    logger.debug("Extracted %d mathematical expressions", len(expressions))
+    return expressions
+
+
+def extract_math_expressions_batch(
+    texts: Sequence[str],
+) -> List[Tuple[str, ...]]:
+    """
+    Extract mathematical expressions from many texts in one call.
+
+    Per-text results are identical to extract_math_expressions; the
+    prescreen and extractor are hoisted into locals so the loop body is
+    two calls with no attribute lookups - the per-call dispatch overhead
+    is paid once for the batch instead of once per utterance.
+
+    Args:
+        texts: Texts to scan.
+
+    Returns:
+        List[Tuple[str, ...]]: One expression tuple per input, in order.
+    """
+    search = _MATH_ANCHOR_RE.search
+    extract = _extract_impl
+    return [() if search(t) is None else extract(t) for t in texts]
 
 
 def normalize_math_expression(expr: str) -> str:
@@ -51,30 +196,41 @@ def normalize_math_expression(expr: str) -> str:
     Returns:
         str: Normalized expression.
     """
-    try:
-        normalized = expr
+    # Guard kept outside the cache so bad inputs neither occupy cache
+    # slots nor have to be hashable
+    if not isinstance(expr, str):
+        raise TypeError("normalize_math_expression expects a string")
 
-        # Remove extra whitespace
-        normalized = re.sub(r"\s+", " ", normalized).strip()
+    # Already-normalized strings (the common case) bail on one compiled
+    # probe without allocating or occupying a cache slot
+    if _NEEDS_NORM_RE.search(expr) is None:
+        return expr
 
-        # Standardize operators
-        normalized = normalized.replace("×", "*")
-        normalized = normalized.replace("÷", "/")
+    return _normalize_impl(expr)
 
-        logger.debug(f"Normalized expression: '{expr}' -> '{normalized}'")
-        return normalized
 
-    except Exception as e:
-        logger.error(f"Expression normalization failed: {e}")
-        raise
+@functools.lru_cache(maxsize=4096)
+def _normalize_impl(expr: str) -> str:
+    """Run the normalization passes; memoized since normalization is pure."""
+    # Remove extra whitespace: split() tokenizes on any whitespace run and
+    # drops leading/trailing runs, so join replaces the regex sub + strip
+    # pair with one pure-C pass
+    normalized = " ".join(expr.split())
+
+    # Standardize operators (single pass over the code points)
+    normalized = normalized.translate(_OP_TABLE)
+
+    logger.debug("Normalized expression: '%s' -> '%s'", expr, normalized)
+    return normalized
 
 
 def evaluate_simple_math(expr: str) -> float:
     """
     Safely evaluate simple mathematical expressions.
 
-    Uses restricted eval with allowed operations only.
-    DO NOT use for untrusted input!
+    Walks the parsed AST against an operator/function whitelist, so only
+    arithmetic and the functions in _SAFE_DICT can execute - there is no
+    eval and no path to attributes, builtins, or anything else.
 
     Args:
         expr (str): Mathematical expression to evaluate.
@@ -86,32 +242,16 @@ def evaluate_simple_math(expr: str) -> float:
         ValueError: If expression is invalid or contains unsafe operations.
     """
     try:
-        import math
-
-        # Allowed functions in evaluation
-        safe_dict = {
-            "sin": math.sin,
-            "cos": math.cos,
-            "tan": math.tan,
-            "sqrt": math.sqrt,
-            "log": math.log,
-            "ln": math.log,
-            "exp": math.exp,
-            "pi": math.pi,
-            "e": math.e,
-        }
-
-        # Validate expression
-        if not re.match(r"^[0-9+\-*/().a-z\s]*$", expr.lower()):
-            raise ValueError("Expression contains invalid characters")
-
-        result = eval(expr, {"__builtins__": {}}, safe_dict)
-        logger.info(f"Evaluated expression: {expr} = {result}")
+        result = _evaluate_ast(_parse_math(expr).body)
+        logger.info("Evaluated expression: %s = %s", expr, result)
         return float(result)
 
     except SyntaxError as e:
-        logger.error(f"Invalid mathematical expression syntax: {e}")
+        logger.error("Invalid mathematical expression syntax: %s", e)
         raise ValueError(f"Invalid expression: {e}") from e
-    except Exception as e:
-        logger.error(f"Mathematical evaluation failed: {e}")
+    except (ValueError, TypeError, ZeroDivisionError, OverflowError) as e:
+        # Everything the walker and math functions can actually raise:
+        # rejected constructs, domain errors (sqrt(-1)), division by zero,
+        # and bad arity on a whitelisted function (e.g. sin(1,2) -> TypeError)
+        logger.error("Mathematical evaluation failed: %s", e)
         raise